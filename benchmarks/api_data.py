@@ -0,0 +1,20 @@
+"""API data shared by the benchmarks."""
+
+
+def cost_range_data(price):
+    return {
+        "min_seatprice": price,
+        "max_seatprice": price + 10,
+        "min_surcharge": 2.5,
+        "max_surcharge": 5,
+        "range_currency_code": "gbp",
+        "valid_quantities": [1, 2, 3, 4],
+        "best_value_offer": {
+            "offer_seatprice": price - 5,
+            "offer_surcharge": 2.5,
+            "full_seatprice": price,
+            "full_surcharge": 2.5,
+            "absolute_saving": 5,
+            "percentage_saving": 10,
+        },
+    }
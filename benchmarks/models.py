@@ -0,0 +1,166 @@
+"""Measure the memory used by parsed model objects.
+
+Builds availability for a large venue (price bands full of seat blocks and
+discounts) along with performances and events, and reports the memory
+allocated for them and the peak resident set size of the process::
+
+    $ python benchmarks/models.py --seats 200000 --trace
+
+``--trace`` needs python 3.
+
+"""
+
+from __future__ import print_function
+
+import argparse
+import gc
+import resource
+import sys
+import time
+
+from api_data import cost_range_data
+from pyticketswitch.event import Event
+from pyticketswitch.performance import Performance
+from pyticketswitch.price_band import PriceBand
+
+try:
+    import tracemalloc
+except ImportError:
+    # python 2
+    tracemalloc = None
+
+
+def price_band_data(code, seats):
+    rows = {}
+    for number in range(seats):
+        row = "R{}".format(number // 40)
+        rows.setdefault(row, [[]])[0].append("{}{}".format(row, number % 40))
+
+    return {
+        "price_band_code": code,
+        "price_band_desc": "Band {}".format(code),
+        "number_available": seats,
+        "sale_seatprice": 50,
+        "sale_surcharge": 5,
+        "cost_range": cost_range_data(50),
+        "free_seat_blocks": {
+            "blocks_by_row": rows,
+            "separators_by_row": {row: "" for row in rows},
+            "restricted_view_seats": [],
+            "seats_by_text_message": {},
+        },
+        "possible_discounts": {
+            "discount": [
+                {
+                    "discount_code": "DISC{}".format(number),
+                    "discount_desc": "Discount {}".format(number),
+                    "price_band_code": code,
+                    "sale_seatprice": 50 - number,
+                    "sale_surcharge": 5,
+                }
+                for number in range(4)
+            ]
+        },
+    }
+
+
+def performance_data(number):
+    return {
+        "perf_id": "6IF-{}".format(number),
+        "event_id": "6IF",
+        "iso8601_date_and_time": "2026-01-01T19:30:00+00:00",
+        "date_desc": "Thu, 1st January 2026",
+        "time_desc": "7.30 PM",
+        "cost_range": cost_range_data(30),
+        "avail_details": {
+            "ticket_type": [
+                {
+                    "ticket_type_code": "CIRCLE",
+                    "price_band": [
+                        {
+                            "price_band_code": "A",
+                            "avail_detail": [
+                                {"seatprice": 30, "surcharge": 3, "currency": "gbp"}
+                            ],
+                        }
+                    ],
+                }
+            ]
+        },
+    }
+
+
+def event_data(number):
+    return {
+        "event_id": "EV{}".format(number),
+        "event_desc": "Event {}".format(number),
+        "event_status": "live",
+        "venue_desc": "Venue",
+        "city_desc": "London",
+        "country_code": "uk",
+        "cost_range": cost_range_data(30),
+    }
+
+
+def build(args):
+    bands = [
+        PriceBand.from_api_data(price_band_data(str(number), args.band_size))
+        for number in range(args.seats // args.band_size)
+    ]
+    performances = [
+        Performance.from_api_data(performance_data(number))
+        for number in range(args.performances)
+    ]
+    events = [Event.from_api_data(event_data(number)) for number in range(args.events)]
+    return bands, performances, events
+
+
+def peak_rss():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        maxrss *= 1024
+    return maxrss / 1024.0 / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seats", type=int, default=200000)
+    parser.add_argument("--band-size", type=int, default=400)
+    parser.add_argument("--performances", type=int, default=20000)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="also count allocated memory with tracemalloc, which is slower",
+    )
+    args = parser.parse_args(argv)
+    if args.trace and tracemalloc is None:
+        parser.error("--trace needs tracemalloc, which requires python 3")
+
+    gc.collect()
+    rss_before = peak_rss()
+    if args.trace:
+        tracemalloc.start()
+
+    start = time.time()
+    objects = build(args)
+    elapsed = time.time() - start
+
+    seats = sum(len(band.get_seats()) for band in objects[0])
+    print(
+        "built {} seats, {} performances and {} events in {:.2f}s".format(
+            seats, len(objects[1]), len(objects[2]), elapsed
+        )
+    )
+    if args.trace:
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("allocated: {:.1f} MiB".format(allocated / 1024.0 / 1024))
+    print(
+        "peak rss: {:.1f} MiB (+{:.1f} MiB)".format(peak_rss(), peak_rss() - rss_before)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Measure how quickly model objects are serialised to JSON.
+
+Builds events with cost ranges, offers and raw data, and times
+``__jsondict__`` on them, alongside the closure based implementation it
+replaced::
+
+    $ python benchmarks/serialise.py --events 2000 --repeat 5
+
+"""
+
+from __future__ import print_function
+
+import argparse
+import datetime
+import decimal
+import time
+
+from api_data import cost_range_data
+from pyticketswitch.event import Event
+from pyticketswitch.lazy import load_lazy_attributes
+from pyticketswitch.mixins import iter_attributes
+
+
+def event_data(number):
+    # prices are parsed as Decimals when the client uses use_decimal
+    price = decimal.Decimal("30.50") if number % 2 else 30.5
+    return {
+        "event_id": "EV{}".format(number),
+        "event_desc": "Event {}".format(number),
+        "event_status": "live",
+        "event_type": "simple_ticket",
+        "venue_desc": "Venue",
+        "city_desc": "London",
+        "city_code": "london-uk",
+        "country_code": "uk",
+        "postcode": "WC2H 9HU",
+        "geo_data": {"latitude": 51.5, "longitude": -0.13},
+        "event_upsell_list": {"event_id": ["EV1", "EV2"]},
+        "cost_range": cost_range_data(price),
+        "no_singles_cost_range": cost_range_data(price + 5),
+    }
+
+
+def legacy_jsondict(self, hide_none=True, hide_empty=True):
+    # JSONMixin.__jsondict__ before serialisation plans were cached
+
+    def sanitise(obj):
+        if isinstance(obj, (datetime.datetime, datetime.date)):
+            return obj.isoformat()
+
+        if isinstance(obj, decimal.Decimal):
+            return float(obj)
+
+        if hasattr(obj, "__jsondict__"):
+            return legacy_jsondict(obj, hide_none=hide_none, hide_empty=hide_empty)
+
+        if isinstance(obj, list):
+            return [sanitise(x) for x in obj]
+
+        if isinstance(obj, dict):
+            return {key: sanitise(value) for key, value in obj.items()}
+
+        return obj
+
+    load_lazy_attributes(self)
+
+    return {
+        key: sanitise(obj)
+        for key, obj in iter_attributes(self)
+        if not (hide_none and obj is None)
+        if not (hide_empty and hasattr(obj, "__iter__") and not obj)
+    }
+
+
+def timed(serialise, events, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        for event in events:
+            serialise(event)
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    events = [Event.from_api_data(event_data(number)) for number in range(args.events)]
+
+    for event in events:
+        assert event.__jsondict__() == legacy_jsondict(event)
+
+    legacy = timed(legacy_jsondict, events, args.repeat)
+    current = timed(lambda event: event.__jsondict__(), events, args.repeat)
+
+    print("legacy: {:.0f} events/s".format(len(events) / legacy))
+    print("cached: {:.0f} events/s".format(len(events) / current))
+    print("speedup: {:.2f}x".format(legacy / current))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+"""asyncio interface for the ticketswitch f13 API.
+
+.. note:: this module requires python 3.
+"""
+
+import asyncio
+import collections
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pyticketswitch import exceptions
+from pyticketswitch.client import Client, DEFAULT_PREFETCH
+from pyticketswitch.loader import BatchLoader, DEFAULT_MAX_BATCH_SIZE
+
+DEFAULT_MAX_WORKERS = 32
+
+#: :class:`Client <pyticketswitch.client.Client>` methods that are exposed as
+#: awaitables on the :class:`AsyncClient`. Methods that call other endpoint
+#: methods (``get_event``, ``get_performance``, ``get_availability_many``,
+#: ``iter_events`` and ``iter_performances``) are defined explicitly, as the
+#: inherited versions would get coroutines back from the methods they call.
+ASYNC_METHODS = (
+    "test",
+    "list_events",
+    "get_events",
+    "get_months",
+    "list_performances",
+    "get_performances",
+    "get_availability",
+    "get_send_methods",
+    "get_discounts",
+    "get_trolley",
+    "get_upsells",
+    "get_addons",
+    "make_reservation",
+    "release_reservation",
+    "get_reservation",
+    "get_status",
+    "make_purchase",
+    "get_purchase",
+    "next_callout",
+    "cancel_purchase",
+)
+
+
+def _awaitable(method):
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await self.run_in_executor(method, self, *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncBatchLoader(BatchLoader):
+    """:class:`BatchLoader <pyticketswitch.loader.BatchLoader>` for asyncio.
+
+    :meth:`load` returns an :class:`asyncio.Future` to be awaited. Unless
+    **wait** is given, keys loaded during the same iteration of the event
+    loop, for example by coroutines passed to :func:`asyncio.gather`, are
+    dispatched together on the client's executor once control returns to
+    the loop::
+
+        >>> loader = client.event_loader()
+        >>> nutcracker, swan_lake = await asyncio.gather(
+        ...     loader.load('6IF'), loader.load('6IE'))
+
+    Attributes:
+        client (:class:`AsyncClient`): the client whose executor runs the
+            batched calls.
+        **kwargs: see :class:`BatchLoader <pyticketswitch.loader.BatchLoader>`.
+
+    """
+
+    def __init__(self, client, batch_func, **kwargs):
+        super(AsyncBatchLoader, self).__init__(batch_func, **kwargs)
+        self.client = client
+        self._scheduled = False
+
+    def load(self, key):
+        """Look up a key.
+
+        Args:
+            key: the key to look up, for example an event ID.
+
+        Returns:
+            :class:`asyncio.Future`: resolves to the result for the key.
+
+        """
+        future = super(AsyncBatchLoader, self).load(key)
+        if self.wait is None and not self._scheduled:
+            self._scheduled = True
+            asyncio.get_event_loop().call_soon(self._dispatch_soon)
+        return asyncio.wrap_future(future)
+
+    def _dispatch_soon(self):
+        self._scheduled = False
+        self.client.run_in_executor(self.dispatch)
+
+
+class AsyncClient(Client):
+    """Client for use from asyncio applications.
+
+    Every endpoint method of :class:`Client <pyticketswitch.client.Client>`
+    is available with the same signature and return types, but returns an
+    awaitable instead of blocking the event loop::
+
+        >>> client = AsyncClient('demo', 'demopass')
+        >>> events, meta = await client.list_events()
+
+    Calls are dispatched to a thread pool and share a pooled keep-alive
+    connection pool sized to match it, so up to **max_workers** requests can
+    be in flight at once. Response parsing and error handling are identical
+    to :class:`Client <pyticketswitch.client.Client>`.
+
+    :meth:`make_request <pyticketswitch.client.Client.make_request>` itself
+    remains synchronous so that subclasses overriding it continue to work.
+
+    :meth:`iter_events` and :meth:`iter_performances` are asynchronous
+    generators, to be used with ``async for``, and :meth:`event_loader` and
+    :meth:`performance_loader` return an :class:`AsyncBatchLoader` whose
+    lookups are awaited.
+
+    Attributes:
+        max_workers (int): maximum number of concurrent requests. Defaults
+            to 32.
+        **kwargs: see :class:`Client <pyticketswitch.client.Client>`.
+
+    """
+
+    def __init__(self, user, password, max_workers=DEFAULT_MAX_WORKERS, **kwargs):
+        kwargs.setdefault("pooled", True)
+        kwargs.setdefault("pool_size", max_workers)
+        super(AsyncClient, self).__init__(user, password, **kwargs)
+        self.max_workers = max_workers
+        self._executor = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await asyncio.get_event_loop().run_in_executor(None, self.close)
+
+    def get_executor(self):
+        """Get the executor used to run requests.
+
+        The executor is created on first use.
+
+        Returns:
+            :class:`concurrent.futures.Executor`: the executor.
+        """
+        with self._session_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def run_in_executor(self, func, *args, **kwargs):
+        """Run a blocking callable without blocking the event loop.
+
+        Args:
+            func (callable): the callable to run.
+            *args: positional arguments for the callable.
+            **kwargs: keyword arguments for the callable.
+
+        Returns:
+            :class:`asyncio.Future`: resolves to the result of the callable,
+            or raises the exception it raised.
+        """
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(
+            self.get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    async def get_event(self, event_id, **kwargs):
+        """Get a specific event by id
+
+        See :meth:`Client.get_event <pyticketswitch.client.Client.get_event>`.
+        """
+        events, meta = await self.get_events([event_id], **kwargs)
+        return events.get(event_id), meta
+
+    async def get_performance(self, performance_id, **kwargs):
+        """Get a specific performance by id
+
+        See :meth:`Client.get_performance
+        <pyticketswitch.client.Client.get_performance>`.
+        """
+        performances, meta = await self.get_performances([performance_id], **kwargs)
+        return performances.get(performance_id), meta
+
+    async def get_availability_many(
+        self, performance_ids, max_workers=None, timeout=None, deadline=None, **kwargs
+    ):
+        """Fetch availability for several performances concurrently
+
+        See :meth:`Client.get_availability_many
+        <pyticketswitch.client.Client.get_availability_many>`.
+
+        Args:
+            performance_ids (list): identifiers of the target performances.
+            max_workers (int): maximum number of concurrent requests.
+                Defaults to the client's **max_workers**.
+            timeout (float): number of seconds to wait for each individual
+                response from the API. Defaults to :obj:`None`.
+            deadline (float): number of seconds to wait for all of the
+                responses. Defaults to :obj:`None`.
+            **kwargs: see :meth:`get_availability
+                <pyticketswitch.client.Client.get_availability>` for more
+                info.
+
+        Returns:
+            dict: indexed by performance ID, either a tuple of a list of
+            :class:`TicketTypes <pyticketswitch.ticket_type.TicketType>` and
+            :class:`AvailabilityMeta <pyticketswitch.availability.AvailabilityMeta>`,
+            or the exception raised while fetching that performance's
+            availability.
+
+        """
+        performance_ids = list(dict.fromkeys(performance_ids))
+        if not performance_ids:
+            return {}
+
+        semaphore = asyncio.Semaphore(max_workers or self.max_workers)
+
+        async def fetch(performance_id):
+            async with semaphore:
+                return await self.get_availability(
+                    performance_id, timeout=timeout, **kwargs
+                )
+
+        pending = {
+            asyncio.ensure_future(fetch(performance_id)): performance_id
+            for performance_id in performance_ids
+        }
+        done, not_done = await asyncio.wait(pending, timeout=deadline)
+
+        results = {}
+        for future in not_done:
+            future.cancel()
+            results[pending[future]] = exceptions.DeadlineExceededError(
+                "availability not fetched within {} seconds".format(deadline)
+            )
+        for future in done:
+            error = future.exception()
+            results[pending[future]] = error if error is not None else future.result()
+
+        return results
+
+    def iter_events(self, page_length=0, prefetch=DEFAULT_PREFETCH, **kwargs):
+        """Iterate over all events matching the given parameters
+
+        See :meth:`Client.iter_events
+        <pyticketswitch.client.Client.iter_events>`::
+
+            >>> async for event in client.iter_events(keywords=['lion']):
+            ...     print(event.description)
+
+        Returns:
+            asynchronous generator: yields :class:`Events
+            <pyticketswitch.event.Event>` in the order they are returned by
+            the API.
+
+        """
+        return self._iter_pages(self.list_events, page_length, prefetch, **kwargs)
+
+    def iter_performances(
+        self, event_id, page_length=0, prefetch=DEFAULT_PREFETCH, **kwargs
+    ):
+        """Iterate over all performances for a specified event
+
+        See :meth:`Client.iter_performances
+        <pyticketswitch.client.Client.iter_performances>`.
+
+        Returns:
+            asynchronous generator: yields :class:`Performances
+            <pyticketswitch.performance.Performance>` in the order they are
+            returned by the API.
+
+        """
+        return self._iter_pages(
+            self.list_performances, page_length, prefetch, event_id, **kwargs
+        )
+
+    async def _iter_pages(self, list_method, page_length, prefetch, *args, **kwargs):
+        def fetch(page):
+            return asyncio.ensure_future(
+                list_method(*args, page=page, page_length=page_length, **kwargs)
+            )
+
+        items, meta = await list_method(
+            *args, page=0, page_length=page_length, **kwargs
+        )
+        for item in items:
+            yield item
+
+        pages = iter(range(1, (meta.pages_remaining or 0) + 1))
+        window = collections.deque()
+        try:
+            for page in pages:
+                window.append(fetch(page))
+                if len(window) > max(prefetch, 0):
+                    items, _ = await window.popleft()
+                    for item in items:
+                        yield item
+            while window:
+                items, _ = await window.popleft()
+                for item in items:
+                    yield item
+        finally:
+            for future in window:
+                future.cancel()
+
+    def event_loader(self, max_batch_size=DEFAULT_MAX_BATCH_SIZE, wait=None, **kwargs):
+        """Get a loader that batches individual event lookups
+
+        See :meth:`Client.event_loader
+        <pyticketswitch.client.Client.event_loader>`::
+
+            >>> loader = client.event_loader(media=True)
+            >>> events = await asyncio.gather(
+            ...     *[loader.load(event_id) for event_id in ('6IF', '6IE')])
+
+        Returns:
+            :class:`AsyncBatchLoader`: a loader whose futures resolve to
+            :class:`Events <pyticketswitch.event.Event>`, or :obj:`None` if
+            the event does not exist.
+
+        """
+        return AsyncBatchLoader(
+            self,
+            self._batch(functools.partial(Client.get_events, self), **kwargs),
+            max_batch_size=max_batch_size,
+            wait=wait,
+        )
+
+    def performance_loader(
+        self, max_batch_size=DEFAULT_MAX_BATCH_SIZE, wait=None, **kwargs
+    ):
+        """Get a loader that batches individual performance lookups
+
+        See :meth:`Client.performance_loader
+        <pyticketswitch.client.Client.performance_loader>`.
+
+        Returns:
+            :class:`AsyncBatchLoader`: a loader whose futures resolve to
+            :class:`Performances <pyticketswitch.performance.Performance>`,
+            or :obj:`None` if the performance does not exist.
+
+        """
+        return AsyncBatchLoader(
+            self,
+            self._batch(functools.partial(Client.get_performances, self), **kwargs),
+            max_batch_size=max_batch_size,
+            wait=wait,
+        )
+
+    def close(self):
+        """Shut down the executor and close the pooled session."""
+        with self._session_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        super(AsyncClient, self).close()
+
+
+for name in ASYNC_METHODS:
+    setattr(AsyncClient, name, _awaitable(getattr(Client, name)))
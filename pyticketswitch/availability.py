@@ -1,7 +1,12 @@
+import calendar
 import datetime
 from pyticketswitch.mixins import JSONMixin
 from pyticketswitch.currency import CurrencyMeta
 from pyticketswitch.misc import MONTH_NUMBERS
+from pyticketswitch.utils import yyyymmdd_to_date
+
+# the bit of the api's weekday mask for each python weekday, from monday.
+WEEKDAY_BITS = (1, 2, 3, 4, 5, 6, 0)
 
 
 class AvailabilityMeta(CurrencyMeta):
@@ -122,6 +127,43 @@ class AvailabilityDetails(JSONMixin, object):
 
     """
 
+    __slots__ = (
+        "ticket_type",
+        "ticket_type_description",
+        "price_band",
+        "price_band_description",
+        "seatprice",
+        "surcharge",
+        "full_seatprice",
+        "full_surcharge",
+        "percentage_saving",
+        "absolute_saving",
+        "currency",
+        "first_date",
+        "last_date",
+        "_calendar_masks",
+        "_weekday_mask",
+        "valid_quantities",
+        "cached_number_available",
+        "discount_code",
+        "discount_desc",
+        "discount_semantic_type",
+        "suffixed_price_band_code",
+        "combined_tax_component",
+        "weekday_list",
+        "__dict__",
+        "__weakref__",
+    )
+
+    price_attributes = (
+        "seatprice",
+        "surcharge",
+        "full_seatprice",
+        "full_surcharge",
+        "absolute_saving",
+        "combined_tax_component",
+    )
+
     def __init__(
         self,
         ticket_type=None,
@@ -227,19 +269,17 @@ class AvailabilityDetails(JSONMixin, object):
                     available_dates = raw_details.get("available_dates", {})
                     if "first_yyyymmdd" in available_dates:
                         try:
-                            first = datetime.datetime.strptime(
-                                available_dates["first_yyyymmdd"], "%Y%m%d"
+                            kwargs["first_date"] = yyyymmdd_to_date(
+                                available_dates["first_yyyymmdd"]
                             )
-                            kwargs["first_date"] = first.date()
                         except ValueError:
                             pass
 
                     if "last_yyyymmdd" in available_dates:
                         try:
-                            last = datetime.datetime.strptime(
-                                available_dates["last_yyyymmdd"], "%Y%m%d"
+                            kwargs["last_date"] = yyyymmdd_to_date(
+                                available_dates["last_yyyymmdd"]
                             )
-                            kwargs["last_date"] = last.date()
                         except ValueError:
                             pass
 
@@ -266,11 +306,12 @@ class AvailabilityDetails(JSONMixin, object):
 
                     avail_details = AvailabilityDetails(**kwargs)
 
-                    if avail_details._weekday_mask:
-                        weekday_list = []
-                        for day in range(0, 7):
-                            weekday_list.append(avail_details.on_weekday(day))
-                        avail_details.weekday_list = weekday_list
+                    weekday_mask = avail_details._weekday_mask
+                    if weekday_mask:
+                        # the api's weeks start on sunday, python's on monday
+                        avail_details.weekday_list = [
+                            bool(weekday_mask >> day & 1) for day in WEEKDAY_BITS
+                        ]
                     details.append(avail_details)
 
         return sorted(
@@ -316,6 +357,35 @@ class AvailabilityDetails(JSONMixin, object):
 
         return True
 
+    def get_day_mask(self, start):
+        """Get the days with availability as a single bitset.
+
+        The calendar masks of each month are shifted into place so that bit
+        ``n`` of the result is set when there is availability ``n`` days after
+        **start**. Days before **start** are dropped.
+
+        Args:
+            start (datetime.date): the day of the lowest bit.
+
+        Returns:
+            int: the bitset of available days.
+
+        """
+        day_mask = 0
+        for year, month_masks in (self._calendar_masks or {}).items():
+            for month, mask in month_masks.items():
+                if not mask:
+                    continue
+                days_in_month = calendar.monthrange(year, month)[1]
+                mask &= (1 << days_in_month) - 1
+                offset = (datetime.date(year, month, 1) - start).days
+                if offset < 0:
+                    mask >>= -offset
+                else:
+                    mask <<= offset
+                day_mask |= mask
+        return day_mask
+
     def on_weekday(self, day):
         """
         Check if this combination of ticket_type and price band is available
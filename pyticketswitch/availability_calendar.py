@@ -0,0 +1,270 @@
+import bisect
+import collections
+import datetime
+
+
+class AvailabilityCalendar(object):
+    """Index of the days with availability at each price.
+
+    Built from the :class:`AvailabilityDetails
+    <pyticketswitch.availability.AvailabilityDetails>` of an event or
+    performance. The available days of each detail are held as a single
+    integer bitset, where bit ``n`` is set when there is availability ``n``
+    days after :attr:`start`, so questions about a whole year are answered
+    with a handful of bitwise operations rather than a call per day::
+
+        >>> events, meta = client.get_events(
+        ...     event_ids, availability=True)
+        >>> calendar = AvailabilityCalendar.from_event(events[0])
+        >>> calendar.available_days(max_price=40)
+        [datetime.date(2017, 1, 3), datetime.date(2017, 1, 4), ...]
+
+    Prices are the combined seat price and surcharge.
+
+    Attributes:
+        start (datetime.date): the first day of the index.
+        end (datetime.date): the last day with availability, or :obj:`None`
+            when there is none.
+
+    """
+
+    def __init__(self, details=None, start=None):
+        details = list(details or [])
+
+        if start is None:
+            months = [
+                (year, month)
+                for detail in details
+                for year, month_masks in (detail._calendar_masks or {}).items()
+                for month, mask in month_masks.items()
+                if mask
+            ]
+            if months:
+                year, month = min(months)
+                start = datetime.date(year, month, 1)
+            else:
+                start = datetime.date.today()
+        self.start = start
+
+        entries = []
+        for detail in details:
+            bits = detail.get_day_mask(start)
+            if bits:
+                price = (detail.seatprice or 0) + (detail.surcharge or 0)
+                entries.append((price, detail.ticket_type, detail.price_band, bits))
+        entries.sort(key=lambda entry: entry[0])
+        self._entries = entries
+
+        # _cumulative[i] is the days available at _prices[i] or less
+        self._prices = []
+        self._cumulative = []
+        bits = 0
+        for price, _, _, entry_bits in entries:
+            bits |= entry_bits
+            self._prices.append(price)
+            self._cumulative.append(bits)
+
+        self.end = None
+        if bits:
+            self.end = self._date(bits.bit_length() - 1)
+
+    @classmethod
+    def from_event(cls, event, start=None):
+        """Creates a new calendar from the availability details of an event.
+
+        Performances have availability details too, and can be used in
+        place of an event.
+
+        Args:
+            event (:class:`Event <pyticketswitch.event.Event>`): the event.
+            start (datetime.date): the first day of the index. Defaults to
+                the first month with availability.
+
+        Returns:
+            :class:`AvailabilityCalendar <pyticketswitch.availability_calendar.AvailabilityCalendar>`:
+            the calendar.
+
+        """
+        return cls(event.availability_details, start=start)
+
+    @classmethod
+    def from_events(cls, events, start=None):
+        """Creates a calendar for each of a list of events.
+
+        Args:
+            events (list): :class:`Events <pyticketswitch.event.Event>`.
+            start (datetime.date): the first day of the indexes. Defaults to
+                the first month with availability of each event.
+
+        Returns:
+            dict: :class:`AvailabilityCalendars
+            <pyticketswitch.availability_calendar.AvailabilityCalendar>`
+            indexed on event ID.
+
+        """
+        return collections.OrderedDict(
+            (event.id, cls.from_event(event, start=start)) for event in events
+        )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __bool__(self):
+        return bool(self._entries)
+
+    __nonzero__ = __bool__
+
+    def _date(self, offset):
+        return self.start + datetime.timedelta(days=offset)
+
+    def _offset(self, day):
+        return (day - self.start).days
+
+    def _range_mask(self, start, end):
+        first = 0 if start is None else max(self._offset(start), 0)
+        if end is None:
+            return -1 << first
+        last = self._offset(end)
+        if last < first:
+            return 0
+        return ((1 << (last - first + 1)) - 1) << first
+
+    def get_mask(
+        self,
+        start=None,
+        end=None,
+        max_price=None,
+        ticket_type=None,
+        price_band=None,
+    ):
+        """Get the days with availability as a bitset.
+
+        Args:
+            start (datetime.date): the first day to include.
+            end (datetime.date): the last day to include.
+            max_price (float): only include availability at this price or
+                less.
+            ticket_type (str): only include this ticket type.
+            price_band (str): only include this price band.
+
+        Returns:
+            int: a bitset where bit ``n`` is set when there is availability
+            ``n`` days after :attr:`start`.
+
+        """
+        if ticket_type is None and price_band is None:
+            if max_price is None:
+                index = len(self._prices)
+            else:
+                index = bisect.bisect_right(self._prices, max_price)
+            bits = self._cumulative[index - 1] if index else 0
+        else:
+            bits = 0
+            for price, entry_ticket_type, entry_price_band, entry_bits in self._entries:
+                if max_price is not None and price > max_price:
+                    break
+                if ticket_type is not None and entry_ticket_type != ticket_type:
+                    continue
+                if price_band is not None and entry_price_band != price_band:
+                    continue
+                bits |= entry_bits
+
+        if start is not None or end is not None:
+            bits &= self._range_mask(start, end)
+        return bits
+
+    def _days(self, bits):
+        first = self.start.toordinal()
+        return [datetime.date.fromordinal(first + offset) for offset in _offsets(bits)]
+
+    def available_days(
+        self,
+        start=None,
+        end=None,
+        max_price=None,
+        ticket_type=None,
+        price_band=None,
+    ):
+        """Get the days with availability.
+
+        Args:
+            start (datetime.date): the first day to include.
+            end (datetime.date): the last day to include.
+            max_price (float): only include availability at this price or
+                less.
+            ticket_type (str): only include this ticket type.
+            price_band (str): only include this price band.
+
+        Returns:
+            list: :py:class:`datetime.date` objects, in order.
+
+        """
+        bits = self.get_mask(
+            start=start,
+            end=end,
+            max_price=max_price,
+            ticket_type=ticket_type,
+            price_band=price_band,
+        )
+        return self._days(bits)
+
+    def is_available(self, day, max_price=None, ticket_type=None, price_band=None):
+        """Check for availability on a day.
+
+        Args:
+            day (datetime.date): the day to check.
+            max_price (float): only look for availability at this price or
+                less.
+            ticket_type (str): only look in this ticket type.
+            price_band (str): only look in this price band.
+
+        Returns:
+            bool: :obj:`True` when there is availability on the day.
+
+        """
+        offset = self._offset(day)
+        if offset < 0:
+            return False
+        bits = self.get_mask(
+            max_price=max_price, ticket_type=ticket_type, price_band=price_band
+        )
+        return bool(bits >> offset & 1)
+
+    def cheapest_prices(self, start=None, end=None, ticket_type=None):
+        """Get the cheapest price available on each day.
+
+        Args:
+            start (datetime.date): the first day to include.
+            end (datetime.date): the last day to include.
+            ticket_type (str): only include this ticket type.
+
+        Returns:
+            dict: the cheapest prices indexed on :py:class:`datetime.date`,
+            in date order. Days without availability are left out.
+
+        """
+        remaining = self.get_mask(start=start, end=end, ticket_type=ticket_type)
+        cheapest = {}
+        # entries are in price order, so each day is claimed by the first
+        # entry that has it.
+        for price, entry_ticket_type, _, bits in self._entries:
+            if not remaining:
+                break
+            if ticket_type is not None and entry_ticket_type != ticket_type:
+                continue
+            claimed = bits & remaining
+            if claimed:
+                for offset in _offsets(claimed):
+                    cheapest[offset] = price
+                remaining &= ~claimed
+
+        first = self.start.toordinal()
+        return collections.OrderedDict(
+            (datetime.date.fromordinal(first + offset), cheapest[offset])
+            for offset in sorted(cheapest)
+        )
+
+
+def _offsets(bits):
+    # the positions of the set bits, lowest first
+    return [offset for offset, bit in enumerate(bin(bits)[:1:-1]) if bit == "1"]
@@ -0,0 +1,136 @@
+import logging
+import random
+import re
+
+DEFAULT_MAX_BYTES = 4096
+
+#: response fields whose values are replaced before logging.
+DEFAULT_REDACTED_FIELDS = frozenset(
+    [
+        "first_name",
+        "last_name",
+        "email_address",
+        "phone",
+        "home_phone",
+        "work_phone",
+        "address_line_one",
+        "address_line_two",
+        "postcode",
+        "card_number",
+        "cv_two",
+    ]
+)
+
+REDACTED = "[redacted]"
+
+
+class BodyLogger(object):
+    """Logs the bodies of API responses at debug level.
+
+    Nothing is done unless debug logging is enabled for the logger, so the
+    default configuration costs nothing in production. When it is enabled
+    bodies are sampled, truncated to **max_bytes** and have the values of
+    personal and payment fields redacted before being logged::
+
+        >>> body_logger = BodyLogger(
+        ...     max_bytes=1024,
+        ...     sample_rate=0.1,
+        ...     endpoint_sample_rates={'events.v1': 0, 'purchase.v1': 1},
+        ... )
+        >>> client = Client('demo', 'demopass', body_logger=body_logger)
+
+    Attributes:
+        max_bytes (int): the maximum number of bytes of each body to log.
+            When :obj:`None` whole bodies are logged. Defaults to 4096.
+        sample_rate (float): the fraction of responses to log, between 0
+            and 1. Defaults to 1.
+        endpoint_sample_rates (dict): sample rates indexed on endpoint,
+            overriding **sample_rate**. A rate of 0 disables logging for an
+            endpoint.
+        redacted_fields (set): JSON fields whose string values are replaced
+            with ``[redacted]``. Defaults to
+            :data:`DEFAULT_REDACTED_FIELDS`.
+
+    """
+
+    def __init__(
+        self,
+        max_bytes=DEFAULT_MAX_BYTES,
+        sample_rate=1,
+        endpoint_sample_rates=None,
+        redacted_fields=DEFAULT_REDACTED_FIELDS,
+    ):
+        self.max_bytes = max_bytes
+        self.sample_rate = sample_rate
+        self.endpoint_sample_rates = endpoint_sample_rates or {}
+        self.redacted_fields = redacted_fields
+        self._redact_pattern = None
+        if redacted_fields:
+            self._redact_pattern = re.compile(
+                r'"({})"(\s*:\s*)"(?:[^"\\]|\\.)*("|\\?$)'.format(
+                    "|".join(re.escape(field) for field in sorted(redacted_fields))
+                )
+            )
+
+    def should_log(self, logger, endpoint):
+        """Check if the body of a response should be logged.
+
+        Args:
+            logger (:class:`logging.Logger`): the logger to log to.
+            endpoint (str): target API endpoint.
+
+        Returns:
+            bool: :obj:`True` when the body should be logged.
+
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return False
+
+        rate = self.endpoint_sample_rates.get(endpoint, self.sample_rate)
+        if rate >= 1:
+            return True
+        return rate > 0 and random.random() < rate
+
+    def format(self, content):
+        """Prepare a response body for logging.
+
+        Args:
+            content (bytes): the raw response body.
+
+        Returns:
+            str: the truncated and redacted body.
+
+        """
+        size = len(content)
+        max_bytes = self.max_bytes
+        truncated = max_bytes is not None and size > max_bytes
+        if truncated:
+            content = content[:max_bytes]
+
+        if isinstance(content, bytes):
+            content = content.decode("utf-8", "replace")
+
+        if self._redact_pattern is not None:
+            content = self._redact_pattern.sub(self._redact, content)
+
+        if truncated:
+            content = "{}... ({} of {} bytes)".format(content, max_bytes, size)
+
+        return content
+
+    def _redact(self, match):
+        return '"{}"{}"{}"'.format(match.group(1), match.group(2), REDACTED)
+
+    def log(self, logger, endpoint, response):
+        """Log the body of a response when configured to.
+
+        Args:
+            logger (:class:`logging.Logger`): the logger to log to.
+            endpoint (str): target API endpoint.
+            response (:class:`requests.Response`): the raw response.
+
+        """
+        if not self.should_log(logger, endpoint):
+            return
+
+        logger.debug("%s response: %s", endpoint, self.format(response.content))
@@ -32,6 +32,17 @@ class Bundle(JSONMixin, object):
 
     """
 
+    price_attributes = (
+        "total_seatprice",
+        "total_surcharge",
+        "total_send_cost",
+        "total",
+        "send_cost_tax_component",
+        "total_combined_tax_component",
+        "total_surcharge_tax_sub_component",
+        "orders",
+    )
+
     def __init__(
         self,
         source_code,
@@ -65,12 +76,18 @@ class Bundle(JSONMixin, object):
         self.total_surcharge_tax_sub_component = total_surcharge_tax_sub_component
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new Bundle object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a bundle.
+            lazy (bool): whether the events of the orders are lazy, see
+                :meth:`Event.from_api_data
+                <pyticketswitch.event.Event.from_api_data>`. Defaults to
+                :obj:`False`.
+            keep_raw (bool or list): the raw data the events of the orders
+                keep. Defaults to :obj:`True`.
 
         Returns:
             :class:`Bundle <pyticketswitch.bundle.Bundle>`: a new
@@ -88,7 +105,10 @@ class Bundle(JSONMixin, object):
 
         raw_orders = data.get("order")
         if raw_orders:
-            orders = [Order.from_api_data(order) for order in raw_orders]
+            orders = [
+                Order.from_api_data(order, lazy=lazy, keep_raw=keep_raw)
+                for order in raw_orders
+            ]
             kwargs.update(orders=orders)
 
         # Below we are explicital checking for not None because we want to
@@ -0,0 +1,212 @@
+import collections
+import threading
+import time
+
+#: default time to live in seconds for read only endpoints whose responses
+#: change slowly.
+DEFAULT_TTLS = {
+    "events.v1": 300,
+    "events_by_id.v1": 300,
+    "months.v1": 300,
+    "performances.v1": 300,
+    "performances_by_id.v1": 300,
+    "send_methods.v1": 300,
+}
+
+#: endpoints whose responses are never cached, regardless of any configured
+#: time to live.
+NEVER_CACHE = frozenset(
+    [
+        "reserve.v1",
+        "release.v1",
+        "reserve_page_archive.v1",
+        "purchase.v1",
+        "purchase_page_archive.v1",
+        "callback.v1",
+        "cancel.v1",
+        "trolley.v1",
+        "status.v1",
+        "trans_id_status.v1",
+    ]
+)
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# params that vary between otherwise identical requests and shouldn't
+# prevent a cache hit.
+UNKEYED_PARAMS = frozenset(["tsw_session_track_id"])
+
+
+def make_cache_key(endpoint, params, user=None, language=None):
+    """Generate a hashable key identifying a request.
+
+    Args:
+        endpoint (str): target API endpoint.
+        params (dict): parameters sent with the request.
+        user (str): the user making the request.
+        language (str): the language requested.
+
+    Returns:
+        tuple: the key. Parameter order and tracking IDs do not affect the
+        key.
+
+    """
+    canonical_params = tuple(
+        sorted(
+            (key, str(value))
+            for key, value in params.items()
+            if key not in UNKEYED_PARAMS
+        )
+    )
+    return (endpoint, user, language, canonical_params)
+
+
+class ResponseCache(object):
+    """In memory LRU cache of decoded API responses with per endpoint TTLs.
+
+    Pass an instance to a :class:`Client <pyticketswitch.client.Client>` to
+    cache the responses of ``GET`` requests::
+
+        >>> cache = ResponseCache(ttls={'events.v1': 60}, max_entries=500)
+        >>> client = Client('demo', 'demopass', cache=cache)
+
+    Cached responses are shared between callers and should be treated as
+    read only.
+
+    Alternative cache backends can be provided by implementing the
+    :meth:`get_ttl`, :meth:`get` and :meth:`set` methods.
+
+    Attributes:
+        ttls (dict): time to live in seconds indexed on endpoint. Defaults
+            to :data:`DEFAULT_TTLS`.
+        default_ttl (float): time to live in seconds for endpoints missing
+            from **ttls**. When :obj:`None` those endpoints are not cached.
+            Defaults to :obj:`None`.
+        never_cache (set): endpoints that are never cached. Defaults to
+            :data:`NEVER_CACHE`.
+        max_entries (int): the maximum number of responses to keep. Defaults
+            to 1024.
+        max_bytes (int): the maximum combined size in bytes of the raw
+            responses kept. When :obj:`None` there is no limit. Defaults to
+            :obj:`None`.
+        hits (int): number of lookups that found a response.
+        misses (int): number of lookups that did not find a response.
+        evictions (int): number of responses evicted to make room for
+            others.
+
+    """
+
+    def __init__(
+        self,
+        ttls=None,
+        default_ttl=None,
+        never_cache=NEVER_CACHE,
+        max_entries=DEFAULT_MAX_ENTRIES,
+        max_bytes=None,
+        clock=time.time,
+    ):
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.default_ttl = default_ttl
+        self.never_cache = never_cache
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_bytes = 0
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_ttl(self, endpoint):
+        """Get the time to live for responses from an endpoint.
+
+        Args:
+            endpoint (str): the target API endpoint.
+
+        Returns:
+            float: the time to live in seconds or :obj:`None` when the
+            endpoint should not be cached.
+
+        """
+        if endpoint in self.never_cache:
+            return None
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, key):
+        """Look up a response.
+
+        Args:
+            key (tuple): the request key, see :func:`make_cache_key`.
+
+        Returns:
+            dict: the cached response or :obj:`None` when the response is
+            missing or has expired.
+
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires, size, value = entry
+            if expires <= self.clock():
+                self.total_bytes -= size
+                self.misses += 1
+                return None
+
+            # reinsert to mark as most recently used
+            self._entries[key] = entry
+            self.hits += 1
+            return value
+
+    def set(self, key, value, size=0):
+        """Store a response.
+
+        The response is stored with the time to live of the endpoint at the
+        start of the key, it is not stored when the endpoint is not cached.
+
+        Args:
+            key (tuple): the request key, see :func:`make_cache_key`.
+            value (dict): the decoded response.
+            size (int): size of the raw response in bytes.
+
+        """
+        ttl = self.get_ttl(key[0])
+        if ttl is None:
+            return
+
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+
+            self._entries[key] = (self.clock() + ttl, size, value)
+            self.total_bytes += size
+            self._evict()
+
+    def _over_budget(self):
+        if len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.total_bytes > self.max_bytes
+
+    def _evict(self):
+        while self._entries and self._over_budget():
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Remove all responses from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
@@ -1,19 +1,39 @@
+import collections
 import decimal
+import functools
+import itertools
 import requests
 import logging
 import six
+import threading
+import time
 import pyticketswitch
-from pyticketswitch import exceptions, utils
+from concurrent import futures
+from pyticketswitch import exceptions, money, utils
 from pyticketswitch.availability import AvailabilityMeta
+from pyticketswitch.body_logging import BodyLogger
+from pyticketswitch.cache import make_cache_key
 from pyticketswitch.callout import Callout
 from pyticketswitch.cancellation import CancellationResult
 from pyticketswitch.currency import CurrencyMeta
 from pyticketswitch.discount import Discount
 from pyticketswitch.event import Event, EventMeta
+from pyticketswitch.instrumentation import (
+    RequestRecord,
+    instrumented,
+    notify,
+    report,
+    timer,
+)
+from pyticketswitch.loader import BatchLoader, DEFAULT_MAX_BATCH_SIZE
+from pyticketswitch.mixins import iter_attributes
 from pyticketswitch.month import Month
 from pyticketswitch.performance import Performance, PerformanceMeta
 from pyticketswitch.reservation import Reservation
+from pyticketswitch.resilience import backend_error_from_api_data
 from pyticketswitch.send_method import SendMethod
+from pyticketswitch.single_flight import SingleFlight
+from pyticketswitch.streaming import DEFAULT_CHUNK_SIZE, ResponseStream
 from pyticketswitch.status import Status
 from pyticketswitch.ticket_type import TicketType
 from pyticketswitch.trolley import Trolley
@@ -24,6 +44,10 @@ logger = logging.getLogger(__name__)
 POST = "post"
 GET = "get"
 DEFAULT_ROOT_URL = "https://api.ticketswitch.com"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_WORKERS = 10
+DEFAULT_PREFETCH = 2
+DEFAULT_ID_CHUNK_SIZE = 100
 
 
 class Client(object):
@@ -49,6 +73,65 @@ class Client(object):
         tracking_id (:obj:`str`, optional): a tracking ID to use with requests
         use_decimal (bool): parse JSON numbers as decimal. Default is `False`
             but this use is deprecated and decimals are recommended.
+        pooled (bool): when :obj:`True` the client will share a single
+            keep-alive :class:`requests.Session` across all requests (and
+            threads) rather than opening a new connection for each call.
+            Defaults to :obj:`False`.
+        pool_size (int): the maximum number of connections kept open to the
+            API when **pooled** is :obj:`True`. Defaults to 10.
+        pool_idle_timeout (float): number of seconds a pooled session may
+            sit unused before its connections are discarded and a fresh
+            session is created. When :obj:`None` connections are kept until
+            :meth:`close <pyticketswitch.client.Client.close>` is called.
+            Defaults to :obj:`None`.
+        cache (:class:`ResponseCache <pyticketswitch.cache.ResponseCache>`):
+            cache for the responses of read only requests. When :obj:`None`
+            responses are not cached. Defaults to :obj:`None`.
+        coalesce (bool): when :obj:`True` concurrent identical ``GET``
+            requests from different threads share a single request to the
+            API and its decoded response. Defaults to :obj:`False`.
+        id_chunk_size (int): the maximum number of IDs requested in a single
+            call by :meth:`get_events <pyticketswitch.client.Client.get_events>`
+            and :meth:`get_performances
+            <pyticketswitch.client.Client.get_performances>`. Longer lists
+            are split into several concurrent calls. Defaults to 100.
+        resilience (:class:`ResiliencePolicy <pyticketswitch.resilience.ResiliencePolicy>`):
+            policy for retrying failed requests and failing fast when backend
+            systems are down. When :obj:`None` requests are made once.
+            Defaults to :obj:`None`.
+        throttle (:class:`Throttle <pyticketswitch.throttle.Throttle>`):
+            rate limits and concurrency caps applied per endpoint and sub
+            user. When :obj:`None` requests are not limited. Defaults to
+            :obj:`None`.
+        observers (list): callables passed a
+            :class:`RequestRecord <pyticketswitch.instrumentation.RequestRecord>`
+            with the timings of each request made, see
+            :class:`RequestStats <pyticketswitch.instrumentation.RequestStats>`.
+            Defaults to no observers.
+        body_logger (:class:`BodyLogger <pyticketswitch.body_logging.BodyLogger>`):
+            controls how response bodies are logged when debug logging is
+            enabled. Defaults to a :class:`BodyLogger
+            <pyticketswitch.body_logging.BodyLogger>` with its default
+            settings.
+        lazy_events (bool): when :obj:`True` events, including upsells,
+            add-ons and the events of orders, are returned with their cost
+            ranges, content, media, reviews and other details built on first
+            access rather than up front, see
+            :class:`Event <pyticketswitch.event.Event>`. Defaults to
+            :obj:`False`.
+        keep_raw (bool or list): whether events keep the data they were
+            built from as :attr:`Event.raw <pyticketswitch.event.Event.raw>`.
+            :obj:`True` keeps all of it, :obj:`False` none of it, and a
+            list of keys keeps only those keys. This applies to the events of
+            orders too. Can be overridden per call of the methods that return
+            events. Defaults to :obj:`True`.
+        minor_units (bool): when :obj:`True` the prices of events,
+            performances, months, availability, discounts, send methods,
+            trolleys, reservations and statuses, including their cost ranges,
+            taxes, savings and commissions, are whole numbers of the minor
+            units of their currency, see :mod:`pyticketswitch.money`. The
+            priced attributes of lazy events are built up front. Defaults to
+            :obj:`False`.
         **kwargs: Additional arbitrary key word arguments to keep with the
             object.
 
@@ -63,6 +146,19 @@ class Client(object):
         language=None,
         tracking_id=None,
         use_decimal=False,
+        pooled=False,
+        pool_size=DEFAULT_POOL_SIZE,
+        pool_idle_timeout=None,
+        cache=None,
+        coalesce=False,
+        id_chunk_size=DEFAULT_ID_CHUNK_SIZE,
+        resilience=None,
+        throttle=None,
+        observers=None,
+        body_logger=None,
+        lazy_events=False,
+        keep_raw=True,
+        minor_units=False,
         **kwargs
     ):
         self.user = user
@@ -72,8 +168,69 @@ class Client(object):
         self.language = language
         self.tracking_id = tracking_id
         self.use_decimal = use_decimal
+        self.pooled = pooled
+        self.pool_size = pool_size
+        self.pool_idle_timeout = pool_idle_timeout
+        self.cache = cache
+        self.coalesce = coalesce
+        self.id_chunk_size = id_chunk_size
+        self.resilience = resilience
+        self.throttle = throttle
+        self.observers = list(observers or [])
+        self.body_logger = BodyLogger() if body_logger is None else body_logger
+        self.lazy_events = lazy_events
+        self.keep_raw = keep_raw
+        self.minor_units = minor_units
         self.kwargs = kwargs
 
+        self._single_flight = SingleFlight()
+
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._session_in_flight = 0
+        self._session_last_used = None
+        # sessions closed while requests were still using them, with the
+        # number of those requests
+        self._closing_sessions = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the pooled session and any connections it holds open.
+
+        Safe to call when the client is not pooled or has not made any
+        requests yet. A pooled client can continue to be used after it has
+        been closed, a new session will be created on the next request.
+
+        Requests already in flight on the session when it is closed finish
+        normally, and the session is closed when the last of them is done.
+
+        The client can also be used as a context manager, in which case this
+        method is called on exit::
+
+            >>> with Client('demo', 'demopass', pooled=True) as client:
+            ...     client.list_events()
+
+        """
+        with self._session_lock:
+            session, in_flight = self._session, self._session_in_flight
+            self._session = None
+            self._session_in_flight = 0
+            self._session_last_used = None
+
+            if session is not None and in_flight:
+                logger.debug("closing pooled requests session once requests finish")
+                self._closing_sessions[session] = in_flight
+                return
+
+        if session is not None:
+            logger.debug("closing pooled requests session")
+            session.close()
+
     def get_url(self, end_point):
         """Get the url for a given endpoint
 
@@ -185,25 +342,87 @@ class Client(object):
         replicates the default behaviour of the requests library:
         https://github.com/kennethreitz/requests/blob/ead8fba84b12e7496c65272a07de47d553aa0ca0/requests/api.py#L57-L58
 
-        A common modification to this class would be to overload this method to
-        provide a single session instance across all calls to take advantage of
-        keep-alive.
+        When the client is created with ``pooled=True`` a single session is
+        shared across all calls (and threads) to take advantage of keep-alive.
+        The session is created lazily by
+        :meth:`create_pooled_session <pyticketswitch.client.Client.create_pooled_session>`
+        and is replaced when it has been idle for longer than
+        ``pool_idle_timeout``.
 
-        .. note:: remember to also overload
+        .. note:: if you overload this method remember to also overload
                   :meth:`cleanup_session <pyticketswitch.client.Client.cleanup_session>`
                   as well or you connections/session might be unexpectedly killed.
         """
-        return requests.Session()
+        if not self.pooled:
+            return requests.Session()
+
+        with self._session_lock:
+            now = time.time()
+            if self._session_is_idle(now):
+                logger.debug("pooled requests session idle, recycling")
+                self._session.close()
+                self._session = None
+
+            if self._session is None:
+                self._session = self.create_pooled_session()
+
+            self._session_in_flight += 1
+            self._session_last_used = now
+            return self._session
+
+    def _session_is_idle(self, now):
+        if self._session is None or self.pool_idle_timeout is None:
+            return False
+        if self._session_in_flight:
+            return False
+        return now - self._session_last_used > self.pool_idle_timeout
+
+    def create_pooled_session(self):
+        """Create the shared session used when the client is pooled.
+
+        This method is intended to be overwritten if the pooled session needs
+        additional configuration, for example custom retries or certificates.
+
+        Returns:
+            :class:`requests.Session`: a session with a connection pool of
+            ``pool_size`` connections mounted for http and https.
+        """
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def cleanup_session(self, session):
         """Cleans up sessions so that we don't leave open sockets.
 
-        If you want to add support for persistent connections, then you should
-        noop this method so it does nothing.
+        When the client is pooled the shared session is left open so its
+        connections can be reused, use
+        :meth:`close <pyticketswitch.client.Client.close>` to release them.
 
         Args:
             session (:class:`requests.Session`): the http session to clean up.
         """
+        if self.pooled:
+            with self._session_lock:
+                if session is self._session:
+                    self._session_in_flight = max(0, self._session_in_flight - 1)
+                    self._session_last_used = time.time()
+                    return
+                if session not in self._closing_sessions:
+                    return
+                self._closing_sessions[session] -= 1
+                if self._closing_sessions[session] > 0:
+                    return
+                del self._closing_sessions[session]
+
+            logger.debug("closing pooled requests session")
+            session.close()
+            return
+
         logger.debug("requests session cleaning up")
         session.close()
 
@@ -229,6 +448,40 @@ class Client(object):
             APIError: When any other explict errors are returned from the API
         """
 
+        url, raw_headers = self._prepare_request(endpoint, params, headers)
+
+        cache_key = self.get_cache_key(endpoint, params, method)
+        if cache_key is not None:
+            contents = self.cache.get(cache_key)
+            if contents is not None:
+                logger.debug("cached response for endpoint: %s", endpoint)
+                if self.observers:
+                    report(self.observers, RequestRecord(endpoint, method, cached=True))
+                return contents
+
+        fetch = functools.partial(
+            self._fetch, endpoint, url, params, method, raw_headers, timeout, cache_key
+        )
+
+        if self.throttle is not None:
+            fetch = functools.partial(
+                self.throttle.call, endpoint, params.get("sub_id"), fetch
+            )
+
+        if self.resilience is not None:
+            fetch = functools.partial(
+                self.resilience.call, endpoint, params, method, fetch
+            )
+
+        if self.coalesce and method == GET:
+            flight_key = make_cache_key(
+                endpoint, params, user=self.user, language=self.language
+            )
+            return self._single_flight.do(flight_key, fetch)
+
+        return fetch()
+
+    def _prepare_request(self, endpoint, params, headers):
         url = self.get_url(endpoint)
         params.update(self.get_extra_params())
         if not params.get("tsw_session_track_id"):
@@ -236,25 +489,251 @@ class Client(object):
 
         logger.debug("url: %s; endpoint: %s; params: %s", self.url, endpoint, params)
 
-        raw_headers = self.get_headers(headers)
+        return url, self.get_headers(headers)
 
-        auth = self.get_auth()
+    def stream_request(
+        self,
+        endpoint,
+        params,
+        path,
+        item_factory,
+        meta_factory=None,
+        method=GET,
+        headers={},
+        timeout=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
+        """Makes a request to the API and streams a list from the response
+
+        Unlike :meth:`make_request <pyticketswitch.client.Client.make_request>`
+        the response isn't read before this method returns. Instead the items
+        of the list are decoded one at a time as the response arrives.
+        Sending the request is throttled and retried like any other, and
+        each attempt is reported to the client's observers when the stream
+        is closed, but the response is not cached or coalesced. Problems
+        reported in the body of the response are only raised once it has
+        been read, and aren't retried. The prices of the objects aren't
+        converted to minor units as the currencies of the response aren't
+        known until it has been read.
+
+        The stream holds a connection until it is read to the end or closed,
+        so close it, or use it as a context manager, when it isn't read to
+        the end. Streams that are never iterated over are closed when they
+        are garbage collected.
 
-        session = self.get_session()
+        Args:
+            endpoint (str): target API endpoint
+            params (dict): parameters to provide to requests
+            path (tuple): keys leading to the list in the response, for
+                example ``('results', 'event')``.
+            item_factory (callable): builds an object from each item.
+            meta_factory (callable): builds the meta information from the
+                rest of the response.
+            method (str): HTTP method to make the request with
+                valid values are ``post`` and ``get``. Defaults to ``get``.
+            headers (dict): headers to include with the request
+            timeout (int): timeout to include with the request. Defaults to ``None``.
+            chunk_size (int): number of bytes to read from the response at a
+                time. Defaults to 65536.
+
+        Returns:
+            :class:`ResponseStream <pyticketswitch.streaming.ResponseStream>`:
+            the objects built from the list.
+
+        Raises:
+            AuthenticationError: When authentication details provided are
+                invalid
+            InvalidResponseError: When the status code of the response is not
+                200
+            APIError: When any other explict errors are returned from the API
+        """
+        url, raw_headers = self._prepare_request(endpoint, params, headers)
 
-        if method == POST:
-            response = session.post(
-                url, auth=auth, data=params, headers=raw_headers, timeout=timeout
+        send = functools.partial(
+            self._open_stream, endpoint, url, params, method, raw_headers, timeout
+        )
+
+        if self.throttle is not None:
+            send = functools.partial(
+                self.throttle.call, endpoint, params.get("sub_id"), send
             )
-        else:
-            response = session.get(
-                url, auth=auth, params=params, headers=raw_headers, timeout=timeout
+
+        if self.resilience is not None:
+            send = functools.partial(
+                self.resilience.call, endpoint, params, method, send
             )
 
-        logger.debug(six.u(response.content))
+        response, session, record = send()
+        start = timer()
+
+        def read():
+            for chunk in response.iter_content(chunk_size):
+                record.bytes += len(chunk)
+                yield chunk
+
+        def close():
+            response.close()
+            self.cleanup_session(session)
+            record.total_time += timer() - start
+            if self.observers:
+                notify(self.observers, record)
+
+        return ResponseStream(
+            read(),
+            path,
+            item_factory,
+            meta_factory=meta_factory,
+            parse_float=decimal.Decimal if self.use_decimal else float,
+            check=functools.partial(self.check_response, endpoint, response),
+            on_close=close,
+        )
+
+    def _open_stream(self, endpoint, url, params, method, headers, timeout):
+        record = RequestRecord(endpoint, method)
+        auth = self.get_auth()
+        session = self.get_session()
+        start = timer()
+        try:
+            if method == POST:
+                response = session.post(
+                    url,
+                    auth=auth,
+                    data=params,
+                    headers=headers,
+                    timeout=timeout,
+                    stream=True,
+                )
+            else:
+                response = session.get(
+                    url,
+                    auth=auth,
+                    params=params,
+                    headers=headers,
+                    timeout=timeout,
+                    stream=True,
+                )
+        except Exception as error:
+            self.cleanup_session(session)
+            record.error = error
+            if self.observers:
+                notify(self.observers, record)
+            raise
+
+        record.status_code = response.status_code
+        record.total_time = timer() - start
+        elapsed = getattr(response, "elapsed", None)
+        if elapsed is not None:
+            record.ttfb = elapsed.total_seconds()
+
+        if response.status_code != 200:
+            try:
+                self.process_response(endpoint, response)
+            except Exception as error:
+                record.error = error
+                raise
+            finally:
+                response.close()
+                self.cleanup_session(session)
+                if self.observers:
+                    notify(self.observers, record)
+
+        return response, session, record
+
+    def _fetch(self, endpoint, url, params, method, headers, timeout, cache_key):
+        record = RequestRecord(endpoint, method)
+        try:
+            start = timer()
+            response = self.send_request(url, params, method, headers, timeout)
+            record.set_response(response, timer() - start)
+            self.body_logger.log(logger, endpoint, response)
+
+            start = timer()
+            contents = self.process_response(endpoint, response)
+            record.decode_time = timer() - start
+        except Exception as error:
+            record.error = error
+            raise
+        finally:
+            if self.observers:
+                report(self.observers, record)
+
+        # responses flagging a backend problem are raised or retried by the
+        # resilience policy, and shouldn't be served again from the cache
+        if cache_key is not None and backend_error_from_api_data(contents) is None:
+            self.cache.set(cache_key, contents, size=len(response.content))
+
+        return contents
+
+    def get_cache_key(self, endpoint, params, method=GET):
+        """Get the key used to cache the response to a request.
+
+        Args:
+            endpoint (str): target API endpoint
+            params (dict): parameters sent with the request, including any
+                extra parameters such as the sub user.
+            method (str): HTTP method of the request.
+
+        Returns:
+            tuple: the key, or :obj:`None` when the response should not be
+            cached.
+        """
+        if self.cache is None or method != GET:
+            return None
 
-        self.cleanup_session(session)
+        if self.cache.get_ttl(endpoint) is None:
+            return None
 
+        return make_cache_key(endpoint, params, user=self.user, language=self.language)
+
+    def send_request(self, url, params, method, headers, timeout=None):
+        """Send a request to the API over a session
+
+        Args:
+            url (str): the full url for the endpoint.
+            params (dict): parameters to provide to requests
+            method (str): HTTP method to make the request with
+                valid values are ``post`` and ``get``.
+            headers (dict): headers to include with the request
+            timeout (int): timeout to include with the request.
+
+        Returns:
+            :class:`requests.Response`: the raw response.
+        """
+        auth = self.get_auth()
+
+        session = self.get_session()
+
+        try:
+            if method == POST:
+                response = session.post(
+                    url, auth=auth, data=params, headers=headers, timeout=timeout
+                )
+            else:
+                response = session.get(
+                    url, auth=auth, params=params, headers=headers, timeout=timeout
+                )
+        finally:
+            self.cleanup_session(session)
+
+        return response
+
+    def process_response(self, endpoint, response):
+        """Decode a raw response and raise any errors it contains
+
+        Args:
+            endpoint (str): target API endpoint
+            response (:class:`requests.Response`): the raw response.
+
+        Returns:
+            dict: The body of the response after deserialising from JSON
+
+        Raises:
+            AuthenticationError: When authentication details provided are
+                invalid
+            InvalidResponseError: When the status code of the response is not
+                200
+            APIError: When any other explict errors are returned from the API
+        """
         parse_float = decimal.Decimal if self.use_decimal else float
 
         try:
@@ -270,6 +749,25 @@ class Client(object):
                 )
             )
 
+        self.check_response(endpoint, response, contents)
+
+        return contents
+
+    def check_response(self, endpoint, response, contents):
+        """Raise any errors contained in a decoded response
+
+        Args:
+            endpoint (str): target API endpoint
+            response (:class:`requests.Response`): the raw response.
+            contents (dict): the decoded body of the response.
+
+        Raises:
+            AuthenticationError: When authentication details provided are
+                invalid
+            InvalidResponseError: When the status code of the response is not
+                200
+            APIError: When any other explict errors are returned from the API
+        """
         if "error_code" in contents:
 
             if contents["error_code"] == 3:
@@ -307,8 +805,33 @@ class Client(object):
                 )
             )
 
-        return contents
+    def get_keep_raw(self, keep_raw=None):
+        """Get how much raw data events should keep.
+
+        Args:
+            keep_raw (bool or list): the setting for a single call, or
+                :obj:`None` to use the client's setting.
+
+        Returns:
+            bool or list: :obj:`True` to keep all raw data, :obj:`False` to
+            keep none, or a list of keys to keep.
 
+        """
+        return self.keep_raw if keep_raw is None else keep_raw
+
+    def convert_prices(self, obj, meta):
+        """Convert prices to minor units when the client uses minor units.
+
+        Args:
+            obj: the object, or list of objects, with prices.
+            meta (:class:`CurrencyMeta <pyticketswitch.currency.CurrencyMeta>`):
+                the currencies of the response the object came from.
+
+        """
+        if self.minor_units:
+            money.convert_prices(obj, currency_meta=meta)
+
+    @instrumented
     def test(self):
         """Test the connection
 
@@ -467,6 +990,7 @@ class Client(object):
             params.update(req_src_info=True)
         params.update(kwargs)
 
+    @instrumented
     def list_events(
         self,
         keywords=None,
@@ -481,6 +1005,7 @@ class Client(object):
         sort_order=None,
         page=0,
         page_length=0,
+        keep_raw=None,
         **kwargs
     ):
         """List events with the given parameters
@@ -525,6 +1050,8 @@ class Client(object):
             page (int): the page of a paginated response.
             page_length (int): how many performances are
                 returned per page.
+            keep_raw (bool or list): whether the events keep their raw
+                data. Defaults to the client's ``keep_raw``.
             **kwargs: see :meth:
                 `add_optional_kwargs <pyticketswitch.client.Client.add_optional_kwargs>`
                 for more info.
@@ -544,6 +1071,55 @@ class Client(object):
 
         """
 
+        params = self._list_events_params(
+            keywords=keywords,
+            start_date=start_date,
+            end_date=end_date,
+            country_code=country_code,
+            city_code=city_code,
+            latitude=latitude,
+            longitude=longitude,
+            radius=radius,
+            include_dead=include_dead,
+            sort_order=sort_order,
+            page=page,
+            page_length=page_length,
+            **kwargs
+        )
+
+        response = self.make_request("events.v1", params)
+
+        if "results" not in response:
+            raise exceptions.InvalidResponseError("got no results key in json response")
+
+        result = response.get("results", {})
+        raw_events = result.get("event", [])
+        keep_raw = self.get_keep_raw(keep_raw)
+        events = [
+            Event.from_api_data(data, lazy=self.lazy_events, keep_raw=keep_raw)
+            for data in raw_events
+        ]
+
+        meta = EventMeta.from_api_data(response)
+        self.convert_prices(events, meta)
+        return events, meta
+
+    def _list_events_params(
+        self,
+        keywords=None,
+        start_date=None,
+        end_date=None,
+        country_code=None,
+        city_code=None,
+        latitude=None,
+        longitude=None,
+        radius=None,
+        include_dead=False,
+        sort_order=None,
+        page=0,
+        page_length=0,
+        **kwargs
+    ):
         params = {}
 
         if keywords:
@@ -583,28 +1159,193 @@ class Client(object):
             params.update(page_len=page_length)
 
         self.add_optional_kwargs(params, **kwargs)
+        return params
 
-        response = self.make_request("events.v1", params)
+    def stream_events(self, keep_raw=None, **kwargs):
+        """Stream events with the given parameters
 
-        if "results" not in response:
-            raise exceptions.InvalidResponseError("got no results key in json response")
+        Wraps `/f13/events.v1`_
 
-        result = response.get("results", {})
-        raw_events = result.get("event", [])
-        events = [Event.from_api_data(data) for data in raw_events]
+        Events are decoded one at a time as the response arrives, rather
+        than after the whole response has been read. This keeps memory use
+        down when requesting large amounts of detail for many events, for
+        example with ``extra_info``, ``media`` and ``reviews``.
 
-        meta = EventMeta.from_api_data(response)
-        return events, meta
+        Args:
+            keep_raw (bool or list): whether the events keep their raw
+                data. Defaults to the client's ``keep_raw``.
+            **kwargs: see :meth:`list_events
+                <pyticketswitch.client.Client.list_events>` for more info.
+
+        Returns:
+            :class:`ResponseStream <pyticketswitch.streaming.ResponseStream>`:
+            yields :class:`Events <pyticketswitch.event.Event>`. Once read to
+            the end its ``meta`` is the
+            :class:`EventMeta <pyticketswitch.event.EventMeta>` for the events.
+
+        Raises:
+            InvalidGeoParameters: when latitude, longitude, or radius is
+                specified without the rest of the required geographic
+                parameters.
+            InvalidResponse: when the response is in an unexpected format
+
+        """
+        params = self._list_events_params(**kwargs)
+        return self.stream_request(
+            "events.v1",
+            params,
+            ("results", "event"),
+            functools.partial(
+                Event.from_api_data,
+                lazy=self.lazy_events,
+                keep_raw=self.get_keep_raw(keep_raw),
+            ),
+            meta_factory=EventMeta.from_api_data,
+        )
+
+    def iter_events(self, page_length=0, prefetch=DEFAULT_PREFETCH, **kwargs):
+        """Iterate over all events matching the given parameters
+
+        Pages through the results of :meth:`list_events
+        <pyticketswitch.client.Client.list_events>`, yielding events as each
+        page arrives. Once the first page has been fetched the following
+        **prefetch** pages are requested concurrently, and at most that many
+        pages are held in memory at a time.
+
+        Args:
+            page_length (int): how many events are returned per page.
+            prefetch (int): how many pages to fetch ahead of the page being
+                iterated over. When zero pages are fetched one at a time.
+                Defaults to 2.
+            **kwargs: see :meth:`list_events
+                <pyticketswitch.client.Client.list_events>` for more info.
+
+        Yields:
+            :class:`Event <pyticketswitch.event.Event>`: events in the order
+            they are returned by the API.
+
+        """
+        return self._iter_pages(self.list_events, page_length, prefetch, **kwargs)
+
+    def _iter_pages(self, list_method, page_length, prefetch, *args, **kwargs):
+        def fetch(page):
+            items, _ = list_method(*args, page=page, page_length=page_length, **kwargs)
+            return items
+
+        items, meta = list_method(*args, page=0, page_length=page_length, **kwargs)
+        for item in items:
+            yield item
+
+        pages = iter(six.moves.range(1, (meta.pages_remaining or 0) + 1))
+
+        if prefetch < 1:
+            for page in pages:
+                for item in fetch(page):
+                    yield item
+            return
 
-    def get_events(self, event_ids, with_addons=False, with_upsells=False, **kwargs):
+        executor = futures.ThreadPoolExecutor(max_workers=prefetch)
+        window = collections.deque(
+            executor.submit(fetch, page) for page in itertools.islice(pages, prefetch)
+        )
+        try:
+            while window:
+                items = window.popleft().result()
+                for page in itertools.islice(pages, 1):
+                    window.append(executor.submit(fetch, page))
+                for item in items:
+                    yield item
+        finally:
+            for future in window:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _get_by_id(self, get_chunk, ids, chunk_size, max_workers, **kwargs):
+        # accept any iterable of IDs, such as a generator or a set
+        ids = list(ids)
+        if chunk_size is None:
+            chunk_size = self.id_chunk_size
+
+        if not chunk_size or len(ids) <= chunk_size:
+            return get_chunk(ids, **kwargs)
+
+        chunks = utils.chunked(ids, chunk_size)
+
+        executor = futures.ThreadPoolExecutor(max_workers=min(max_workers, len(chunks)))
+        try:
+            chunk_futures = [
+                executor.submit(get_chunk, chunk, **kwargs) for chunk in chunks
+            ]
+            futures.wait(chunk_futures)
+        finally:
+            executor.shutdown(wait=False)
+
+        results = {}
+        errors = {}
+        meta = None
+        for chunk, future in zip(chunks, chunk_futures):
+            error = future.exception()
+            if error is not None:
+                errors.update(dict.fromkeys(chunk, error))
+                continue
+
+            chunk_results, chunk_meta = future.result()
+            results.update(chunk_results)
+            if meta is None:
+                meta = chunk_meta
+            else:
+                self._merge_meta(meta, chunk_meta)
+
+        if errors and meta is None:
+            raise chunk_futures[0].exception()
+
+        if errors:
+            raise exceptions.PartialResponseError(
+                "{} of {} ids failed".format(len(errors), len(ids)),
+                results=results,
+                meta=meta,
+                errors=errors,
+            )
+
+        return results, meta
+
+    def _merge_meta(self, meta, chunk_meta):
+        # dictionaries such as the currencies are combined, and anything
+        # else is taken from the first chunk that has it
+        for name, value in iter_attributes(chunk_meta):
+            current = getattr(meta, name, None)
+            if isinstance(current, dict) and isinstance(value, dict):
+                current.update(value)
+            elif current is None:
+                setattr(meta, name, value)
+
+    def get_events(
+        self,
+        event_ids,
+        with_addons=False,
+        with_upsells=False,
+        chunk_size=None,
+        max_workers=DEFAULT_MAX_WORKERS,
+        keep_raw=None,
+        **kwargs
+    ):
         """Get events with the given id's
 
         Wraps `/f13/events_by_id.v1`_
 
+        Long lists of IDs are split into chunks that are requested
+        concurrently, and the results merged.
+
         Args:
             event_ids (list): list of event IDs
             with_addons (bool): include add-on events
             with_upsells (bool): include upsell events
+            chunk_size (int): the maximum number of IDs to request in a
+                single call. Defaults to the client's ``id_chunk_size``.
+            max_workers (int): maximum number of chunks to request
+                concurrently. Defaults to 10.
+            keep_raw (bool or list): whether the events keep their raw
+                data. Defaults to the client's ``keep_raw``.
             **kwargs:
                 see :meth:
                 `add_optional_kwargs <pyticketswitch.client.Client.add_optional_kwargs>`
@@ -617,10 +1358,27 @@ class Client(object):
 
         Raises:
             InvalidResponse: when the response is in an unexpected format
+            PartialResponseError: when some, but not all, of the chunks
+                failed.
 
         .. _`/f13/events_by_id.v1`: http://docs.ingresso.co.uk/#events-by-id
 
         """
+        return self._get_by_id(
+            self._get_events_chunk,
+            event_ids,
+            chunk_size,
+            max_workers,
+            with_addons=with_addons,
+            with_upsells=with_upsells,
+            keep_raw=keep_raw,
+            **kwargs
+        )
+
+    @instrumented
+    def _get_events_chunk(
+        self, event_ids, with_addons=False, with_upsells=False, keep_raw=None, **kwargs
+    ):
         params = {}
 
         if event_ids:
@@ -641,14 +1399,18 @@ class Client(object):
                 "got no events_by_id key in json response"
             )
 
+        keep_raw = self.get_keep_raw(keep_raw)
         events_by_id = response.get("events_by_id", {})
         events = {
-            event_id: Event.from_events_by_id_api_data(raw_event)
+            event_id: Event.from_events_by_id_api_data(
+                raw_event, lazy=self.lazy_events, keep_raw=keep_raw
+            )
             for event_id, raw_event in events_by_id.items()
             if raw_event.get("event")
         }
 
         meta = EventMeta.from_api_data(response)
+        self.convert_prices(list(events.values()), meta)
         return events, meta
 
     def get_event(self, event_id, **kwargs):
@@ -680,6 +1442,51 @@ class Client(object):
         events, meta = self.get_events([event_id], **kwargs)
         return events.get(event_id), meta
 
+    def event_loader(self, max_batch_size=DEFAULT_MAX_BATCH_SIZE, wait=None, **kwargs):
+        """Get a loader that batches individual event lookups
+
+        Events requested from the loader are fetched together with as few
+        calls to :meth:`get_events <pyticketswitch.client.Client.get_events>`
+        as possible::
+
+            >>> loader = client.event_loader(media=True)
+            >>> futures = [loader.load(event_id) for event_id in ('6IF', '6IE')]
+            >>> [future.result() for future in futures]
+            [<Event 6IF:Matthew Bourne's Nutcracker TEST>,
+             <Event 6IE:Matthew Bourne's Swan Lake test>]
+
+        Args:
+            max_batch_size (int): the maximum number of events to request in a
+                single call. Defaults to 50.
+            wait (float): number of seconds to collect event IDs for before
+                automatically requesting them. Defaults to :obj:`None`.
+            **kwargs: see :meth:`get_events
+                <pyticketswitch.client.Client.get_events>` for more info.
+
+        Returns:
+            :class:`BatchLoader <pyticketswitch.loader.BatchLoader>`: a loader
+            whose futures resolve to :class:`Events
+            <pyticketswitch.event.Event>`, or :obj:`None` if the event does
+            not exist.
+
+        """
+        return BatchLoader(
+            self._batch(self.get_events, **kwargs),
+            max_batch_size=max_batch_size,
+            wait=wait,
+        )
+
+    def _batch(self, get_many, **kwargs):
+        def batch(ids):
+            try:
+                results, _ = get_many(ids, **kwargs)
+            except exceptions.PartialResponseError as error:
+                results = dict(error.errors, **error.results)
+            return results
+
+        return batch
+
+    @instrumented
     def get_months(self, event_id, **kwargs):
         """Returns a summary of availability accross months.
 
@@ -713,9 +1520,11 @@ class Client(object):
         raw_months = result.get("month", [])
 
         months = [Month.from_api_data(data) for data in raw_months]
+        self.convert_prices(months, CurrencyMeta.from_api_data(response))
 
         return months
 
+    @instrumented
     def list_performances(
         self, event_id, start_date=None, end_date=None, page_length=0, page=0, **kwargs
     ):
@@ -747,6 +1556,33 @@ class Client(object):
 
         .. _`/f13/performances.v1`: http://docs.ingresso.co.uk/#performances-list
         """
+        params = self._list_performances_params(
+            event_id,
+            start_date=start_date,
+            end_date=end_date,
+            page_length=page_length,
+            page=page,
+            **kwargs
+        )
+
+        response = self.make_request("performances.v1", params)
+
+        if "results" not in response:
+            raise exceptions.InvalidResponseError("got no results key in json response")
+
+        result = response.get("results", {})
+
+        raw_performances = result.get("performance", [])
+        performances = [Performance.from_api_data(data) for data in raw_performances]
+
+        meta = PerformanceMeta.from_api_data(response)
+        self.convert_prices(performances, meta)
+
+        return performances, meta
+
+    def _list_performances_params(
+        self, event_id, start_date=None, end_date=None, page_length=0, page=0, **kwargs
+    ):
         params = {"event_id": event_id}
 
         if page > 0:
@@ -759,28 +1595,93 @@ class Client(object):
             params.update(date_range=utils.date_range_str(start_date, end_date))
 
         self.add_optional_kwargs(params, **kwargs)
+        return params
 
-        response = self.make_request("performances.v1", params)
+    def stream_performances(self, event_id, **kwargs):
+        """Stream performances for a specified event
 
-        if "results" not in response:
-            raise exceptions.InvalidResponseError("got no results key in json response")
+        Wraps `/f13/performances.v1`_
 
-        result = response.get("results", {})
+        Performances are decoded one at a time as the response arrives,
+        rather than after the whole response has been read.
 
-        raw_performances = result.get("performance", [])
-        performances = [Performance.from_api_data(data) for data in raw_performances]
+        Args:
+            event_id (str): identifier for the event.
+            **kwargs: see :meth:`list_performances
+                <pyticketswitch.client.Client.list_performances>` for more
+                info.
 
-        meta = PerformanceMeta.from_api_data(response)
+        Returns:
+            :class:`ResponseStream <pyticketswitch.streaming.ResponseStream>`:
+            yields :class:`Performances
+            <pyticketswitch.performance.Performance>`. Once read to the end
+            its ``meta`` is the :class:`PerformanceMeta
+            <pyticketswitch.performance.PerformanceMeta>` for the
+            performances.
 
-        return performances, meta
+        Raises:
+            InvalidResponse: when the response is in an unexpected format
+
+        """
+        params = self._list_performances_params(event_id, **kwargs)
+        return self.stream_request(
+            "performances.v1",
+            params,
+            ("results", "performance"),
+            Performance.from_api_data,
+            meta_factory=PerformanceMeta.from_api_data,
+        )
+
+    def iter_performances(
+        self, event_id, page_length=0, prefetch=DEFAULT_PREFETCH, **kwargs
+    ):
+        """Iterate over all performances for a specified event
+
+        Pages through the results of :meth:`list_performances
+        <pyticketswitch.client.Client.list_performances>`, yielding
+        performances as each page arrives. Once the first page has been
+        fetched the following **prefetch** pages are requested concurrently,
+        and at most that many pages are held in memory at a time.
+
+        Args:
+            event_id (str): identifier for the event.
+            page_length (int): how many performances are returned per page.
+            prefetch (int): how many pages to fetch ahead of the page being
+                iterated over. When zero pages are fetched one at a time.
+                Defaults to 2.
+            **kwargs: see :meth:`list_performances
+                <pyticketswitch.client.Client.list_performances>` for more
+                info.
+
+        Yields:
+            :class:`Performance <pyticketswitch.performance.Performance>`:
+            performances in the order they are returned by the API.
+
+        """
+        return self._iter_pages(
+            self.list_performances, page_length, prefetch, event_id, **kwargs
+        )
 
-    def get_performances(self, performance_ids, **kwargs):
+    def get_performances(
+        self,
+        performance_ids,
+        chunk_size=None,
+        max_workers=DEFAULT_MAX_WORKERS,
+        **kwargs
+    ):
         """Get performances with the given ID's
 
         Wraps `/f13/performances_by_id.v1`_
 
+        Long lists of IDs are split into chunks that are requested
+        concurrently, and the results merged.
+
         Args:
             performance_ids (list): list of performance IDs to fetch.
+            chunk_size (int): the maximum number of IDs to request in a
+                single call. Defaults to the client's ``id_chunk_size``.
+            max_workers (int): maximum number of chunks to request
+                concurrently. Defaults to 10.
             **kwargs: see :meth:
                 `add_optional_kwargs <pyticketswitch.client.Client.add_optional_kwargs>`
                 for more info.
@@ -793,11 +1694,22 @@ class Client(object):
 
         Raises:
             InvalidResponse: when the response is in an unexpected format.
+            PartialResponseError: when some, but not all, of the chunks
+                failed.
 
         .. _`/f13/performances_by_id.v1`: http://docs.ingresso.co.uk/#performances-by-id
 
         """
+        return self._get_by_id(
+            self._get_performances_chunk,
+            performance_ids,
+            chunk_size,
+            max_workers,
+            **kwargs
+        )
 
+    @instrumented
+    def _get_performances_chunk(self, performance_ids, **kwargs):
         params = {
             "perf_id_list": ",".join(performance_ids),
         }
@@ -818,6 +1730,7 @@ class Client(object):
         }
 
         meta = PerformanceMeta.from_api_data(response)
+        self.convert_prices(list(performances.values()), meta)
 
         return performances, meta
 
@@ -850,6 +1763,37 @@ class Client(object):
         performances, meta = self.get_performances([performance_id], **kwargs)
         return performances.get(performance_id), meta
 
+    def performance_loader(
+        self, max_batch_size=DEFAULT_MAX_BATCH_SIZE, wait=None, **kwargs
+    ):
+        """Get a loader that batches individual performance lookups
+
+        Performances requested from the loader are fetched together with as
+        few calls to :meth:`get_performances
+        <pyticketswitch.client.Client.get_performances>` as possible.
+
+        Args:
+            max_batch_size (int): the maximum number of performances to
+                request in a single call. Defaults to 50.
+            wait (float): number of seconds to collect performance IDs for
+                before automatically requesting them. Defaults to :obj:`None`.
+            **kwargs: see :meth:`get_performances
+                <pyticketswitch.client.Client.get_performances>` for more info.
+
+        Returns:
+            :class:`BatchLoader <pyticketswitch.loader.BatchLoader>`: a loader
+            whose futures resolve to :class:`Performances
+            <pyticketswitch.performance.Performance>`, or :obj:`None` if the
+            performance does not exist.
+
+        """
+        return BatchLoader(
+            self._batch(self.get_performances, **kwargs),
+            max_batch_size=max_batch_size,
+            wait=wait,
+        )
+
+    @instrumented
     def get_availability(
         self,
         performance_id,
@@ -858,6 +1802,8 @@ class Client(object):
         example_seats=False,
         seat_blocks=False,
         user_commission=False,
+        timeout=None,
+        compact_seats=False,
         **kwargs
     ):
         """Fetch available tickets and prices for a given performance
@@ -877,6 +1823,13 @@ class Client(object):
                 available. Defaults to :obj:`False`.
             user_commission (bool): request user commission for each
                 price band/discount. Defaults to :obj:`False`
+            timeout (float): number of seconds to wait for a response from
+                the API. Defaults to :obj:`None`.
+            compact_seats (bool): keep the free seats of each price band in
+                a :class:`SeatInventory
+                <pyticketswitch.seat_inventory.SeatInventory>` rather than as
+                seat blocks, using much less memory for large venues.
+                Defaults to :obj:`False`.
             **kwargs: see :meth:
                 `add_optional_kwargs <pyticketswitch.client.Client.add_optional_kwargs>`
                 for more info.
@@ -918,7 +1871,7 @@ class Client(object):
 
         self.add_optional_kwargs(params, **kwargs)
 
-        response = self.make_request("availability.v1", params)
+        response = self.make_request("availability.v1", params, timeout=timeout)
 
         if "availability" not in response:
             raise exceptions.InvalidResponseError(
@@ -930,12 +1883,88 @@ class Client(object):
         raw_availability = response.get("availability", {})
 
         availability = [
-            TicketType.from_api_data(data)
+            TicketType.from_api_data(data, compact_seats=compact_seats)
             for data in raw_availability.get("ticket_type", [])
         ]
+        self.convert_prices(availability, meta)
 
         return availability, meta
 
+    def get_availability_many(
+        self,
+        performance_ids,
+        max_workers=DEFAULT_MAX_WORKERS,
+        timeout=None,
+        deadline=None,
+        **kwargs
+    ):
+        """Fetch availability for several performances concurrently
+
+        Calls :meth:`get_availability
+        <pyticketswitch.client.Client.get_availability>` for each performance
+        on a pool of worker threads, so the total time taken is roughly that
+        of the slowest call rather than the sum of all of them.
+
+        .. note:: this works best with a pooled client (see
+                  :ref:`connection pooling <connection_pooling>`) so that
+                  connections are reused between calls.
+
+        Args:
+            performance_ids (list): identifiers of the target performances.
+            max_workers (int): maximum number of concurrent requests.
+                Defaults to 10.
+            timeout (float): number of seconds to wait for each individual
+                response from the API. Defaults to :obj:`None`.
+            deadline (float): number of seconds to wait for all of the
+                responses. Performances that have not completed in time are
+                reported with a
+                :class:`DeadlineExceededError <pyticketswitch.exceptions.DeadlineExceededError>`.
+                Defaults to :obj:`None`.
+            **kwargs: see :meth:`get_availability
+                <pyticketswitch.client.Client.get_availability>` for more
+                info.
+
+        Returns:
+            dict: indexed by performance ID, either a tuple of a list of
+            :class:`TicketTypes <pyticketswitch.ticket_type.TicketType>` and
+            :class:`AvailabilityMeta <pyticketswitch.availability.AvailabilityMeta>`,
+            or the exception raised while fetching that performance's
+            availability.
+
+        """
+        performance_ids = list(dict.fromkeys(performance_ids))
+        if not performance_ids:
+            return {}
+
+        executor = futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(performance_ids))
+        )
+        pending = {
+            executor.submit(
+                self.get_availability, performance_id, timeout=timeout, **kwargs
+            ): performance_id
+            for performance_id in performance_ids
+        }
+        try:
+            done, not_done = futures.wait(pending, timeout=deadline)
+        finally:
+            for future in pending:
+                if not future.done():
+                    future.cancel()
+            executor.shutdown(wait=False)
+
+        results = {}
+        for future in not_done:
+            results[pending[future]] = exceptions.DeadlineExceededError(
+                "availability not fetched within {} seconds".format(deadline)
+            )
+        for future in done:
+            error = future.exception()
+            results[pending[future]] = error if error is not None else future.result()
+
+        return results
+
+    @instrumented
     def get_send_methods(self, performance_id, **kwargs):
         """Fetch available delivery methods for a given performance
 
@@ -975,9 +2004,11 @@ class Client(object):
         ]
 
         meta = CurrencyMeta.from_api_data(response)
+        self.convert_prices(send_methods, meta)
 
         return send_methods, meta
 
+    @instrumented
     def get_discounts(
         self,
         performance_id,
@@ -1032,6 +2063,7 @@ class Client(object):
         ]
 
         meta = CurrencyMeta.from_api_data(response)
+        self.convert_prices(discounts, meta)
 
         return discounts, meta
 
@@ -1140,6 +2172,7 @@ class Client(object):
 
         return params
 
+    @instrumented
     def get_trolley(
         self,
         token=None,
@@ -1213,8 +2246,11 @@ class Client(object):
 
         response = self.make_request("trolley.v1", params)
 
-        trolley = Trolley.from_api_data(response)
+        trolley = Trolley.from_api_data(
+            response, lazy=self.lazy_events, keep_raw=self.keep_raw
+        )
         meta = CurrencyMeta.from_api_data(response)
+        self.convert_prices(trolley, meta)
 
         if raise_on_unavailable_order:
             if trolley and trolley.input_contained_unavailable_order:
@@ -1224,6 +2260,7 @@ class Client(object):
 
         return trolley, meta
 
+    @instrumented
     def get_upsells(
         self,
         token=None,
@@ -1235,6 +2272,7 @@ class Client(object):
         performance_id=None,
         price_band_code=None,
         item_numbers_to_remove=None,
+        keep_raw=None,
         **kwargs
     ):
         """Retrieve a list of upsell events related to a trolley from the API.
@@ -1263,6 +2301,8 @@ class Client(object):
                 specified price band added.
             item_numbers_to_remove: (list): trolley with a list of
                 item numbers removed.
+            keep_raw (bool or list): whether the events keep their raw
+                data. Defaults to the client's ``keep_raw``.
             **kwargs: arbitary additional raw keyword arguments to add the
                 parameters.
 
@@ -1300,12 +2340,18 @@ class Client(object):
         results = response.get("results", {})
 
         raw_upsell_events = results.get("event", [])
-        upsell_events = [Event.from_api_data(data) for data in raw_upsell_events]
+        keep_raw = self.get_keep_raw(keep_raw)
+        upsell_events = [
+            Event.from_api_data(data, lazy=self.lazy_events, keep_raw=keep_raw)
+            for data in raw_upsell_events
+        ]
 
         upsell_meta = EventMeta.from_api_data(response)
+        self.convert_prices(upsell_events, upsell_meta)
 
         return (upsell_events, upsell_meta)
 
+    @instrumented
     def get_addons(
         self,
         token=None,
@@ -1317,6 +2363,7 @@ class Client(object):
         performance_id=None,
         price_band_code=None,
         item_numbers_to_remove=None,
+        keep_raw=None,
         **kwargs
     ):
         """Retrieve a list of add-on events from the API.
@@ -1340,6 +2387,8 @@ class Client(object):
                 specified price band added.
             item_numbers_to_remove: (list): trolley with a list of
                 item numbers removed.
+            keep_raw (bool or list): whether the events keep their raw
+                data. Defaults to the client's ``keep_raw``.
             **kwargs: arbitrary additional raw keyword arguments to add to the
                 parameters.
 
@@ -1376,12 +2425,18 @@ class Client(object):
         add_on_results = response.get("results", {})
 
         raw_add_on_events = add_on_results.get("event", [])
-        add_on_events = [Event.from_api_data(data) for data in raw_add_on_events]
+        keep_raw = self.get_keep_raw(keep_raw)
+        add_on_events = [
+            Event.from_api_data(data, lazy=self.lazy_events, keep_raw=keep_raw)
+            for data in raw_add_on_events
+        ]
 
         add_on_meta = EventMeta.from_api_data(response)
+        self.convert_prices(add_on_events, add_on_meta)
 
         return (add_on_events, add_on_meta)
 
+    @instrumented
     def make_reservation(
         self,
         token=None,
@@ -1469,6 +2524,7 @@ class Client(object):
 
         return self.process_reservation_response(response, raise_on_unavailable_order)
 
+    @instrumented
     def release_reservation(self, transaction_uuid, **kwargs):
         """Release an existing reservation.
 
@@ -1493,6 +2549,7 @@ class Client(object):
 
         return response.get("released_ok", False)
 
+    @instrumented
     def get_reservation(
         self, transaction_uuid, raise_on_unavailable_order=False, **kwargs
     ):
@@ -1537,6 +2594,7 @@ class Client(object):
 
         return self.process_reservation_response(response, raise_on_unavailable_order)
 
+    @instrumented
     def get_status(
         self,
         transaction_uuid=None,
@@ -1590,11 +2648,15 @@ class Client(object):
             params.update(transaction_uuid=transaction_uuid)
             response = self.make_request("status.v1", params)
 
-        status = Status.from_api_data(response)
+        status = Status.from_api_data(
+            response, lazy=self.lazy_events, keep_raw=self.keep_raw
+        )
         meta = CurrencyMeta.from_api_data(response)
+        self.convert_prices(status, meta)
 
         return status, meta
 
+    @instrumented
     def make_purchase(
         self,
         transaction_uuid,
@@ -1668,6 +2730,7 @@ class Client(object):
 
         return self.process_purchase_response(response)
 
+    @instrumented
     def get_purchase(self, transaction_uuid, **kwargs):
         """
         This method retrieves a previously made purchase response, verbatim.
@@ -1709,6 +2772,7 @@ class Client(object):
 
         return self.process_purchase_response(response)
 
+    @instrumented
     def next_callout(self, this_token, next_token, returned_data, **kwargs):
         """Gets the next callout in a callout chain.
 
@@ -1753,15 +2817,21 @@ class Client(object):
             callout = Callout.from_api_data(callout_data)
         else:
             callout = None
-            status = Status.from_api_data(response)
+            status = Status.from_api_data(
+                response, lazy=self.lazy_events, keep_raw=self.keep_raw
+            )
 
         meta = CurrencyMeta.from_api_data(response)
+        self.convert_prices(status, meta)
 
         return status, callout, meta
 
     def process_reservation_response(self, response, raise_on_unavailable_order):
-        reservation = Reservation.from_api_data(response)
+        reservation = Reservation.from_api_data(
+            response, lazy=self.lazy_events, keep_raw=self.keep_raw
+        )
         meta = CurrencyMeta.from_api_data(response)
+        self.convert_prices(reservation, meta)
 
         if raise_on_unavailable_order:
             if reservation and reservation.input_contained_unavailable_order:
@@ -1781,12 +2851,16 @@ class Client(object):
             callout = Callout.from_api_data(callout_data)
         else:
             callout = None
-            status = Status.from_api_data(response)
+            status = Status.from_api_data(
+                response, lazy=self.lazy_events, keep_raw=self.keep_raw
+            )
 
         meta = CurrencyMeta.from_api_data(response)
+        self.convert_prices(status, meta)
 
         return status, callout, meta
 
+    @instrumented
     def cancel_purchase(self, transaction_uuid, cancel_items_list=None, **kwargs):
         """Attempt cancellation of item numbers from the transaction, specified in
         `cancel_items_list`. If there is no `cancel_items_list` then attempt
@@ -1818,7 +2892,9 @@ class Client(object):
 
         response = self.make_request("cancel.v1", params, method=POST)
 
-        result = CancellationResult.from_api_data(response)
+        result = CancellationResult.from_api_data(
+            response, lazy=self.lazy_events, keep_raw=self.keep_raw
+        )
         meta = CurrencyMeta.from_api_data(response)
 
         return result, meta
@@ -10,6 +10,8 @@ class Commission(JSONMixin, object):
        currency_code (str): the currency code the commission is priced in.
     """
 
+    price_attributes = ("including_vat", "excluding_vat")
+
     def __init__(self, including_vat, excluding_vat, currency_code):
         self.including_vat = including_vat
         self.excluding_vat = excluding_vat
@@ -42,6 +42,43 @@ class CostRange(JSONMixin, object):
             When included, the child cost ranges for alternate discounts
     """
 
+    __slots__ = (
+        "valid_quantities",
+        "max_seatprice",
+        "max_surcharge",
+        "min_seatprice",
+        "min_surcharge",
+        "currency",
+        "best_value_offer",
+        "max_saving_offer",
+        "min_cost_offer",
+        "top_price_offer",
+        "max_combined_combined_tax_component",
+        "max_combined_surcharge_tax_sub",
+        "min_combined_combined_tax_component",
+        "min_combined_surcharge_tax_sub",
+        "discount_semantic_type",
+        "alternate_discounts",
+        "__dict__",
+        "__weakref__",
+    )
+
+    price_attributes = (
+        "min_seatprice",
+        "min_surcharge",
+        "max_seatprice",
+        "max_surcharge",
+        "best_value_offer",
+        "max_saving_offer",
+        "min_cost_offer",
+        "top_price_offer",
+        "max_combined_combined_tax_component",
+        "max_combined_surcharge_tax_sub",
+        "min_combined_combined_tax_component",
+        "min_combined_surcharge_tax_sub",
+        "alternate_discounts",
+    )
+
     def __init__(
         self,
         valid_quantities=None,
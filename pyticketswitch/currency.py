@@ -1,4 +1,5 @@
 import six
+from pyticketswitch import money
 from pyticketswitch.mixins import JSONMixin
 
 
@@ -87,11 +88,14 @@ class Currency(JSONMixin, object):
 
         return cls(data.get("currency_code"), **kwargs)
 
-    def price_as_string(self, price):
+    def price_as_string(self, price, minor_units=False):
         """Generates a human readble string for a price.
 
         Args:
             price (float): a price
+            minor_units (bool): the price is a whole number of minor units,
+                as returned by a client with ``minor_units`` set. Defaults to
+                :obj:`False`.
 
         Returns:
             str: the price with the correct number of places with pre and post
@@ -105,9 +109,13 @@ class Currency(JSONMixin, object):
             u'$5.00'
             >>> usd.price_as_string(12.34567)
             u'$12.34'
+            >>> usd.price_as_string(1234, minor_units=True)
+            u'$12.34'
 
         """
         price = price if price else 0
+        if minor_units:
+            price = self.from_minor_units(price)
         format_string = six.text_type("{pre}{price:." + str(self.places) + "f}{post}")
         return format_string.format(
             pre=self.pre_symbol or "",
@@ -115,6 +123,30 @@ class Currency(JSONMixin, object):
             post=self.post_symbol or "",
         )
 
+    def to_minor_units(self, price):
+        """Convert a price to a whole number of minor units of the currency.
+
+        Args:
+            price (float): a price.
+
+        Returns:
+            int: the price in minor units.
+
+        """
+        return money.to_minor_units(price, self.places)
+
+    def from_minor_units(self, amount):
+        """Convert a whole number of minor units of the currency to a price.
+
+        Args:
+            amount (int): the price in minor units.
+
+        Returns:
+            :py:class:`Decimal <decimal.Decimal>`: the exact price.
+
+        """
+        return money.from_minor_units(amount, self.places)
+
     def __repr__(self):
         return "<Currency {}>".format(self.code)
 
@@ -27,6 +27,33 @@ class Discount(SeatPricingMixin, JSONMixin, object):
         valid_quantities: list of ints of valid quantities one can buy of this discount
     """
 
+    __slots__ = (
+        "code",
+        "description",
+        "price_band_code",
+        "is_offer",
+        "availability",
+        "percentage_saving",
+        "absolute_saving",
+        "gross_commission",
+        "user_commission",
+        "disallowed_seat_nos",
+        "tax_component",
+        "semantic_type",
+        "minimum_eligible_age",
+        "maximum_eligible_age",
+        "valid_quantities",
+        "__dict__",
+        "__weakref__",
+    )
+
+    price_attributes = SeatPricingMixin.price_attributes + (
+        "absolute_saving",
+        "tax_component",
+        "gross_commission",
+        "user_commission",
+    )
+
     def __init__(
         self,
         code,
@@ -6,10 +6,114 @@ from pyticketswitch.media import Media
 from pyticketswitch.review import Review
 from pyticketswitch.availability import AvailabilityDetails
 from pyticketswitch.field import Field
+from pyticketswitch.lazy import LAZY, lazy_slots
 from pyticketswitch.mixins import JSONMixin, PaginationMixin
 from pyticketswitch.currency import CurrencyMeta
 
 
+def _cost_range(data):
+    api_cost_range = data.get("cost_range", {})
+    if not api_cost_range:
+        return None
+
+    api_cost_range["singles"] = True
+    return CostRange.from_api_data(api_cost_range)
+
+
+def _no_singles_cost_range(data):
+    api_cost_range = data.get("cost_range", {})
+    api_no_singles_cost_range = api_cost_range.get("no_singles_cost_range", {})
+    if not api_no_singles_cost_range:
+        return None
+
+    api_no_singles_cost_range["singles"] = False
+    return CostRange.from_api_data(api_no_singles_cost_range)
+
+
+def _cost_range_details(data):
+    api_cost_range_details = data.get("cost_range_details", {})
+    ticket_type_list = api_cost_range_details.get("ticket_type", [])
+    return [TicketType.from_api_data(ticket_type) for ticket_type in ticket_type_list]
+
+
+def _content(data):
+    api_content = data.get("structured_info", {})
+    return {key: Content.from_api_data(value) for key, value in api_content.items()}
+
+
+def _fields(data):
+    return {
+        field.get("custom_field_name"): Field.from_api_data(field)
+        for field in data.get("custom_fields", {})
+    }
+
+
+def _media(data):
+    media = {}
+    api_media = data.get("media", {})
+    for asset in api_media.get("media_asset", []):
+        new_media = Media.from_api_data(asset)
+        media[new_media.name] = new_media
+
+    api_video = data.get("video_iframe")
+    if api_video:
+        kwargs = {
+            "secure_complete_url": api_video.get("video_iframe_url_when_secure"),
+            "insecure_complete_url": api_video.get("video_iframe_url_when_insecure"),
+            "caption": api_video.get("video_iframe_caption"),
+            "caption_html": api_video.get("video_iframe_caption_html"),
+            "width": api_video.get("video_iframe_width"),
+            "height": api_video.get("video_iframe_height"),
+            "name": "video",
+        }
+        new_video = Media.from_api_data(kwargs)
+        media["video"] = new_video
+
+    return media
+
+
+def _reviews(data):
+    api_reviews = data.get("reviews", {})
+    return [
+        Review.from_api_data(api_review) for api_review in api_reviews.get("review", [])
+    ]
+
+
+def _availability_details(data):
+    return AvailabilityDetails.from_api_data(data.get("avail_details", {}))
+
+
+def _component_events(data, lazy=False, keep_raw=True):
+    api_component_events = data.get("meta_event_component_events", {})
+    return [
+        Event.from_api_data(meta_event, lazy=lazy, keep_raw=keep_raw)
+        for meta_event in api_component_events.get("event", [])
+    ]
+
+
+def _lazy_component_events(data):
+    return _component_events(data, lazy=True)
+
+
+def _retained_raw(data, keep_raw):
+    if keep_raw is True:
+        return data
+    if not keep_raw:
+        return None
+    return {key: data[key] for key in keep_raw if key in data}
+
+
+@lazy_slots(
+    ("cost_range", _cost_range),
+    ("no_singles_cost_range", _no_singles_cost_range),
+    ("cost_range_details", _cost_range_details),
+    ("content", _content),
+    ("fields", _fields),
+    ("media", _media),
+    ("reviews", _reviews),
+    ("availability_details", _availability_details),
+    ("component_events", _lazy_component_events),
+)
 class Event(JSONMixin, object):
     """Describes a product in the ticketswitch system.
 
@@ -105,8 +209,84 @@ class Event(JSONMixin, object):
             for internal use only.
         lingo_code (str): a code for the type of event, e.g. theatre or
             attraction. This is for internal use only.
+
+    When created with ``lazy=True`` the cost ranges, content, fields,
+    media, reviews, availability details and component events are built
+    from :attr:`raw` the first time they are read rather than up front.
+
+    When created with ``keep_raw=False`` :attr:`raw` is :obj:`None`, and
+    when created with a list of keys it only contains those keys. Events
+    that don't keep all of their raw data are never lazy.
     """
 
+    __slots__ = (
+        "id",
+        "status",
+        "description",
+        "source",
+        "source_code",
+        "event_type",
+        "venue",
+        "classes",
+        "filters",
+        "postcode",
+        "city",
+        "city_code",
+        "country",
+        "country_code",
+        "latitude",
+        "longitude",
+        "max_running_time",
+        "min_running_time",
+        "show_performance_time",
+        "has_performances",
+        "is_seated",
+        "needs_departure_date",
+        "needs_duration",
+        "needs_performance",
+        "addon_events",
+        "upsell_events",
+        "upsell_list",
+        "cost_range",
+        "no_singles_cost_range",
+        "cost_range_details",
+        "content",
+        "fields",
+        "event_info",
+        "event_info_html",
+        "venue_addr",
+        "venue_addr_html",
+        "venue_info",
+        "venue_info_html",
+        "media",
+        "reviews",
+        "critic_review_percent",
+        "availability_details",
+        "component_events",
+        "valid_quantities",
+        "raw",
+        "is_add_on",
+        "is_auto_quantity_add_on",
+        "is_date_matched_add_on",
+        "is_time_matched_add_on",
+        "venue_code",
+        "area_code",
+        "venue_is_enforced",
+        "lingo_code",
+        "__dict__",
+        "__weakref__",
+    )
+
+    price_attributes = (
+        "cost_range",
+        "no_singles_cost_range",
+        "cost_range_details",
+        "availability_details",
+        "component_events",
+        "addon_events",
+        "upsell_events",
+    )
+
     def __init__(
         self,
         id_,
@@ -233,12 +413,18 @@ class Event(JSONMixin, object):
         self.lingo_code = lingo_code
 
     @classmethod
-    def class_dict_from_api_data(cls, data):
+    def class_dict_from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a dict of Event data from a raw ticketswitch API call
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a event.
+            lazy (bool): when :obj:`True` the attributes in
+                :attr:`lazy_attributes` are built on first access. Defaults
+                to :obj:`False`.
+            keep_raw (bool or list): :obj:`True` to keep all of the data
+                as :attr:`raw`, :obj:`False` to keep none of it, or a list of
+                the keys to keep. Defaults to :obj:`True`.
 
         Returns:
             dict: a new dict populated with the data from the api for creating
@@ -256,71 +442,20 @@ class Event(JSONMixin, object):
         # the raw field 'has_no_perfs' is a negative flag, so I'm inverting it
         has_performances = not data.get("has_no_perfs", False)
 
-        api_cost_range = data.get("cost_range", {})
-        api_no_singles_cost_range = api_cost_range.get("no_singles_cost_range", {})
-        cost_range = None
-        no_singles_cost_range = None
-
-        if api_cost_range:
-            api_cost_range["singles"] = True
-            cost_range = CostRange.from_api_data(api_cost_range)
-
-        if api_no_singles_cost_range:
-            api_no_singles_cost_range["singles"] = False
-            no_singles_cost_range = CostRange.from_api_data(api_no_singles_cost_range)
-
-        api_cost_range_details = data.get("cost_range_details", {})
-        ticket_type_list = api_cost_range_details.get("ticket_type", [])
-        cost_range_details = [
-            TicketType.from_api_data(ticket_type) for ticket_type in ticket_type_list
-        ]
-
-        api_content = data.get("structured_info", {})
-        content = {
-            key: Content.from_api_data(value) for key, value in api_content.items()
-        }
-
-        fields = {
-            field.get("custom_field_name"): Field.from_api_data(field)
-            for field in data.get("custom_fields", {})
-        }
-
-        media = {}
-        api_media = data.get("media", {})
-        for asset in api_media.get("media_asset", []):
-            new_media = Media.from_api_data(asset)
-            media[new_media.name] = new_media
-
-        api_video = data.get("video_iframe")
-        if api_video:
-            kwargs = {
-                "secure_complete_url": api_video.get("video_iframe_url_when_secure"),
-                "insecure_complete_url": api_video.get(
-                    "video_iframe_url_when_insecure"
-                ),
-                "caption": api_video.get("video_iframe_caption"),
-                "caption_html": api_video.get("video_iframe_caption_html"),
-                "width": api_video.get("video_iframe_width"),
-                "height": api_video.get("video_iframe_height"),
-                "name": "video",
+        if lazy and keep_raw is True:
+            lazy_kwargs = dict.fromkeys(cls.lazy_attributes, LAZY)
+        else:
+            lazy_kwargs = {
+                "cost_range": _cost_range(data),
+                "no_singles_cost_range": _no_singles_cost_range(data),
+                "cost_range_details": _cost_range_details(data),
+                "content": _content(data),
+                "fields": _fields(data),
+                "media": _media(data),
+                "reviews": _reviews(data),
+                "availability_details": _availability_details(data),
+                "component_events": _component_events(data, keep_raw=keep_raw),
             }
-            new_video = Media.from_api_data(kwargs)
-            media["video"] = new_video
-
-        api_reviews = data.get("reviews", {})
-        reviews = [
-            Review.from_api_data(api_review)
-            for api_review in api_reviews.get("review", [])
-        ]
-
-        availability_details = AvailabilityDetails.from_api_data(
-            data.get("avail_details", {})
-        )
-        api_component_events = data.get("meta_event_component_events", {})
-        component_events = [
-            Event.from_api_data(meta_event)
-            for meta_event in api_component_events.get("event", [])
-        ]
 
         lingo_code = None
         raw_lingo_data = data.get("lingo_data")
@@ -338,7 +473,6 @@ class Event(JSONMixin, object):
             "classes": data.get("classes"),
             # TODO: don't actually know what filters look like yet...
             "filters": data.get("custom_filter", []),
-            "fields": fields,
             "postcode": data.get("postcode"),
             "city": data.get("city_desc"),
             "city_code": data.get("city_code"),
@@ -355,9 +489,6 @@ class Event(JSONMixin, object):
             "needs_duration": data.get("need_duration", False),
             "needs_performance": data.get("need_performance", False),
             "upsell_list": data.get("event_upsell_list", {}).get("event_id", []),
-            "cost_range": cost_range,
-            "no_singles_cost_range": no_singles_cost_range,
-            "cost_range_details": cost_range_details,
             # extra info
             "event_info_html": data.get("event_info_html"),
             "event_info": data.get("event_info"),
@@ -365,14 +496,9 @@ class Event(JSONMixin, object):
             "venue_addr": data.get("venue_addr"),
             "venue_info": data.get("venue_info"),
             "venue_info_html": data.get("venue_info_html"),
-            "content": content,
-            "media": media,
-            "reviews": reviews,
             "critic_review_percent": data.get("critic_review_percent"),
-            "availability_details": availability_details,
-            "component_events": component_events,
             "valid_quantities": data.get("valid_quantities"),
-            "raw": data,
+            "raw": _retained_raw(data, keep_raw),
             "is_add_on": data.get("is_add_on", False),
             "is_auto_quantity_add_on": data.get("is_auto_quantity_add_on", False),
             "is_date_matched_add_on": data.get("is_date_matched_add_on", False),
@@ -381,16 +507,23 @@ class Event(JSONMixin, object):
             "area_code": data.get("area_code"),
             "lingo_code": lingo_code,
         }
+        kwargs.update(lazy_kwargs)
 
         return kwargs
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new Event object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a event.
+            lazy (bool): when :obj:`True` the attributes in
+                :attr:`lazy_attributes` are built on first access. Defaults
+                to :obj:`False`.
+            keep_raw (bool or list): :obj:`True` to keep all of the data
+                as :attr:`raw`, :obj:`False` to keep none of it, or a list of
+                the keys to keep. Defaults to :obj:`True`.
 
         Returns:
             :class:`Event <pyticketswitch.event.Event>`: a new
@@ -399,16 +532,22 @@ class Event(JSONMixin, object):
 
         """
 
-        kwargs = cls.class_dict_from_api_data(data)
+        kwargs = cls.class_dict_from_api_data(data, lazy=lazy, keep_raw=keep_raw)
         return cls(**kwargs)
 
     @classmethod
-    def from_events_by_id_api_data(cls, data):
+    def from_events_by_id_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new Event object from API data from the events_by_id call.
 
         Args:
             data (dict): the part of the response from the ticketswitch
                 `events_by_id` API call containing events and other data.
+            lazy (bool): when :obj:`True` the attributes in
+                :attr:`lazy_attributes` of the event, add-ons and upsells are
+                built on first access. Defaults to :obj:`False`.
+            keep_raw (bool or list): :obj:`True` to keep all of the data
+                as :attr:`raw`, :obj:`False` to keep none of it, or a list of
+                the keys to keep. Defaults to :obj:`True`.
 
         Returns:
             :class:`Event <pyticketswitch.event.Event>`: a new
@@ -417,17 +556,21 @@ class Event(JSONMixin, object):
 
         """
 
-        kwargs = cls.class_dict_from_api_data(data.get("event"))
+        kwargs = cls.class_dict_from_api_data(
+            data.get("event"), lazy=lazy, keep_raw=keep_raw
+        )
 
         if data.get("add_ons"):
             addons = [
-                Event.from_api_data(raw_addon) for raw_addon in data.get("add_ons")
+                Event.from_api_data(raw_addon, lazy=lazy, keep_raw=keep_raw)
+                for raw_addon in data.get("add_ons")
             ]
             kwargs.update(addon_events=addons)
 
         if data.get("upsells"):
             upsells = [
-                Event.from_api_data(raw_upsell) for raw_upsell in data.get("upsells")
+                Event.from_api_data(raw_upsell, lazy=lazy, keep_raw=keep_raw)
+                for raw_upsell in data.get("upsells")
             ]
             kwargs.update(upsell_events=upsells)
 
@@ -0,0 +1,208 @@
+import collections
+import datetime
+import threading
+
+from pyticketswitch.availability_calendar import AvailabilityCalendar
+
+
+def _min_combined_price(cost_range):
+    if cost_range is None:
+        return None
+    if cost_range.min_seatprice is None and cost_range.min_surcharge is None:
+        return None
+    return (cost_range.min_seatprice or 0) + (cost_range.min_surcharge or 0)
+
+
+def get_event_prices(event, months=None):
+    """Get the cheapest price of an event on each day it has availability.
+
+    Days and prices come from the availability details of the event when it
+    has them. Days from **months** that the availability details don't
+    cover are priced with the cost range of the month, or of the event when
+    the month doesn't have one.
+
+    Args:
+        event (:class:`Event <pyticketswitch.event.Event>`): the event.
+        months (list): :class:`Months <pyticketswitch.month.Month>` of the
+            event, as returned by :meth:`Client.get_months
+            <pyticketswitch.client.Client.get_months>`.
+
+    Returns:
+        dict: the cheapest prices indexed on :py:class:`datetime.date`. The
+        price is :obj:`None` when it isn't known.
+
+    """
+    prices = {}
+    if event.availability_details:
+        prices.update(AvailabilityCalendar.from_event(event).cheapest_prices())
+
+    event_price = _min_combined_price(event.cost_range)
+    for month in months or []:
+        price = _min_combined_price(month.cost_range)
+        if price is None:
+            price = event_price
+        for day in month.get_dates():
+            prices.setdefault(day, price)
+
+    return prices
+
+
+def _price_key(item):
+    event_id, price = item
+    return (price is None, price or 0, event_id)
+
+
+class EventIndex(object):
+    """Local index of the days that events have availability, and at what
+    price.
+
+    Answers "what's on" questions from events that have already been
+    fetched, without calling the API or looking through the availability
+    of every event. Add events again whenever they are refreshed, and only
+    their entries are replaced::
+
+        >>> index = EventIndex()
+        >>> events, meta = client.get_events(event_ids, availability=True)
+        >>> index.update(events)
+        >>> index.find(datetime.date(2017, 1, 14), max_price=50,
+        ...            city_code='london-uk')
+        OrderedDict([('6IF', 22.5), ('25DR', 35.0)])
+
+    Events can safely be added from several threads at once.
+
+    """
+
+    def __init__(self):
+        self._prices_by_date = {}
+        self._dates_by_event = {}
+        self._events = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._events)
+
+    def __contains__(self, event_id):
+        return event_id in self._events
+
+    def add_event(self, event, months=None):
+        """Add an event to the index, replacing any previous entries for it.
+
+        Args:
+            event (:class:`Event <pyticketswitch.event.Event>`): the event.
+            months (list): :class:`Months <pyticketswitch.month.Month>` of the
+                event.
+
+        """
+        prices = get_event_prices(event, months=months)
+        with self._lock:
+            self._remove(event.id)
+            self._events[event.id] = event
+            self._dates_by_event[event.id] = list(prices)
+            for day, price in prices.items():
+                self._prices_by_date.setdefault(day, {})[event.id] = price
+
+    def update(self, events, months_by_event=None):
+        """Add several events to the index.
+
+        Args:
+            events (list): :class:`Events <pyticketswitch.event.Event>`.
+            months_by_event (dict): lists of :class:`Months
+                <pyticketswitch.month.Month>` indexed on event ID.
+
+        """
+        months_by_event = months_by_event or {}
+        for event in events:
+            self.add_event(event, months=months_by_event.get(event.id))
+
+    def remove_event(self, event_id):
+        """Remove an event from the index.
+
+        Args:
+            event_id (str): the event ID. Unknown IDs are ignored.
+
+        """
+        with self._lock:
+            self._remove(event_id)
+
+    def _remove(self, event_id):
+        self._events.pop(event_id, None)
+        for day in self._dates_by_event.pop(event_id, ()):
+            events = self._prices_by_date[day]
+            del events[event_id]
+            if not events:
+                del self._prices_by_date[day]
+
+    def get_event(self, event_id):
+        """Get an event in the index.
+
+        Args:
+            event_id (str): the event ID.
+
+        Returns:
+            :class:`Event <pyticketswitch.event.Event>`: the event, or
+            :obj:`None` when it isn't in the index.
+
+        """
+        return self._events.get(event_id)
+
+    def get_dates(self, event_id):
+        """Get the days an event has availability.
+
+        Args:
+            event_id (str): the event ID.
+
+        Returns:
+            list: :py:class:`datetime.date` objects, in order.
+
+        """
+        return sorted(self._dates_by_event.get(event_id, ()))
+
+    def find(
+        self,
+        start,
+        end=None,
+        max_price=None,
+        city_code=None,
+        country_code=None,
+    ):
+        """Find the events with availability on a day or between two days.
+
+        Args:
+            start (datetime.date): the day, or the first day of the range.
+            end (datetime.date): the last day of the range. Defaults to
+                **start**.
+            max_price (float): only include events with availability at this
+                price or less. Events without a known price are left out.
+            city_code (str): only include events in this city.
+            country_code (str): only include events in this country.
+
+        Returns:
+            dict: the cheapest price of each event over the days, indexed on
+            event ID, cheapest first.
+
+        """
+        if end is None:
+            end = start
+
+        cheapest = {}
+        with self._lock:
+            day = start
+            while day <= end:
+                for event_id, price in self._prices_by_date.get(day, {}).items():
+                    if max_price is not None:
+                        if price is None or price > max_price:
+                            continue
+                    if event_id in cheapest:
+                        current = cheapest[event_id]
+                        if current is None or (price is not None and price < current):
+                            cheapest[event_id] = price
+                        continue
+                    event = self._events[event_id]
+                    if city_code is not None and event.city_code != city_code:
+                        continue
+                    if country_code is not None and event.country_code != country_code:
+                        continue
+                    cheapest[event_id] = price
+                day += datetime.timedelta(days=1)
+
+        return collections.OrderedDict(sorted(cheapest.items(), key=_price_key))
@@ -49,6 +49,18 @@ class BackendThrottleError(BackendError):
     pass
 
 
+class DeadlineExceededError(PyticketswitchError):
+    pass
+
+
+class QueueTimeoutError(DeadlineExceededError):
+    pass
+
+
+class CallInterruptedError(PyticketswitchError):
+    pass
+
+
 class CallbackGoneError(APIError):
     pass
 
@@ -59,3 +71,12 @@ class OrderUnavailableError(PyticketswitchError):
         super(OrderUnavailableError, self).__init__(msg, *args, **kwargs)
         self.reservation = reservation
         self.meta = meta
+
+
+class PartialResponseError(PyticketswitchError):
+
+    def __init__(self, msg, results=None, meta=None, errors=None, *args, **kwargs):
+        super(PartialResponseError, self).__init__(msg, *args, **kwargs)
+        self.results = results
+        self.meta = meta
+        self.errors = errors
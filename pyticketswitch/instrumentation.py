@@ -0,0 +1,344 @@
+import bisect
+import collections
+import functools
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+#: high resolution timer used to time requests.
+timer = getattr(time, "perf_counter", time.time)
+
+#: upper bounds in seconds of the buckets used by :class:`LatencyHistogram`.
+DEFAULT_BOUNDS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+)
+
+_local = threading.local()
+
+
+class RequestRecord(object):
+    """Measurements for a single request to the API.
+
+    Attributes:
+        endpoint (str): target API endpoint.
+        method (str): HTTP method of the request.
+        status_code (int): HTTP status code of the response, :obj:`None` when
+            no response was received.
+        bytes (int): size of the response body in bytes.
+        cached (bool): :obj:`True` when the response came from the client's
+            cache and no request was sent.
+        ttfb (float): seconds from sending the request until the response
+            headers arrived. :obj:`None` when not known.
+        total_time (float): seconds taken to send the request and read the
+            whole response.
+        decode_time (float): seconds taken to decode the JSON response and
+            check it for errors.
+        parse_time (float): seconds the client method that made the request
+            spent building objects from the response. :obj:`None` when the
+            request wasn't made by a client method or the method made
+            several requests and this wasn't the last one.
+        error (Exception): the error raised while making the request, if
+            any.
+
+    """
+
+    def __init__(self, endpoint, method, cached=False):
+        self.endpoint = endpoint
+        self.method = method
+        self.cached = cached
+        self.status_code = None
+        self.bytes = 0
+        self.ttfb = None
+        self.total_time = 0
+        self.decode_time = 0
+        self.parse_time = None
+        self.error = None
+
+    def __repr__(self):
+        return "<RequestRecord {}:{} {}>".format(
+            self.method, self.endpoint, self.status_code
+        )
+
+    def set_response(self, response, total_time):
+        """Record the raw response to the request.
+
+        Args:
+            response (:class:`requests.Response`): the raw response.
+            total_time (float): seconds taken to get the response.
+
+        """
+        self.status_code = response.status_code
+        self.bytes = len(response.content)
+        self.total_time = total_time
+        elapsed = getattr(response, "elapsed", None)
+        if elapsed is not None:
+            self.ttfb = elapsed.total_seconds()
+
+
+def report(observers, record):
+    """Pass a record to each observer, or to the enclosing client method.
+
+    While a method decorated with :func:`instrumented` is running on the
+    current thread the record is held until it returns, so that the time
+    the method spent parsing the response can be added to it.
+
+    Args:
+        observers (list): callables to pass the record to.
+        record (:class:`RequestRecord`): the record.
+
+    """
+    frames = getattr(_local, "frames", None)
+    if frames:
+        frames[-1].append(record)
+        return
+    notify(observers, record)
+
+
+def notify(observers, record):
+    """Pass a record to each observer.
+
+    Errors raised by observers are logged and otherwise ignored.
+
+    Args:
+        observers (list): callables to pass the record to.
+        record (:class:`RequestRecord`): the record.
+
+    """
+    for observer in observers:
+        try:
+            observer(record)
+        except Exception:
+            logger.exception("request observer %r failed", observer)
+
+
+def instrumented(method):
+    """Decorate a client method to measure time spent parsing responses.
+
+    The time the method takes, less the time taken by the requests it made,
+    is recorded as the **parse_time** of the last request.
+    """
+
+    @functools.wraps(method)
+    def wrapper(client, *args, **kwargs):
+        if not client.observers:
+            return method(client, *args, **kwargs)
+
+        frames = getattr(_local, "frames", None)
+        if frames is None:
+            frames = _local.frames = []
+
+        records = []
+        frames.append(records)
+        start = timer()
+        try:
+            return method(client, *args, **kwargs)
+        finally:
+            elapsed = timer() - start
+            frames.pop()
+            if records:
+                request_time = sum(r.total_time + r.decode_time for r in records)
+                records[-1].parse_time = max(0, elapsed - request_time)
+            for record in records:
+                notify(client.observers, record)
+
+    return wrapper
+
+
+class LatencyHistogram(object):
+    """Histogram of durations.
+
+    Attributes:
+        bounds (tuple): upper bounds in seconds of each bucket, in ascending
+            order. Durations above the last bound are counted in an overflow
+            bucket.
+        counts (list): number of durations in each bucket, including the
+            overflow bucket.
+        count (int): number of durations recorded.
+        total (float): sum of the durations recorded.
+        max (float): the longest duration recorded.
+
+    """
+
+    def __init__(self, bounds=DEFAULT_BOUNDS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, value):
+        """Record a duration.
+
+        Args:
+            value (float): the duration in seconds.
+
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self):
+        """float: the mean duration, or :obj:`None` when empty."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def quantile(self, q):
+        """Estimate a quantile of the recorded durations.
+
+        Args:
+            q (float): the quantile between 0 and 1, for example 0.99.
+
+        Returns:
+            float: the upper bound of the bucket containing the quantile, or
+            the longest duration when it falls in the overflow bucket.
+            :obj:`None` when empty.
+
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class EndpointStats(object):
+    """Aggregated measurements for requests to one endpoint.
+
+    Attributes:
+        requests (int): number of requests.
+        errors (int): number of requests that raised an error.
+        cached (int): number of requests served from the cache.
+        bytes (int): total size of the responses in bytes.
+        status_codes (:class:`collections.Counter`): number of responses
+            with each status code.
+        total_time (:class:`LatencyHistogram`): time to get responses.
+        ttfb (:class:`LatencyHistogram`): time to first byte of responses.
+        decode_time (:class:`LatencyHistogram`): time to decode responses.
+        parse_time (:class:`LatencyHistogram`): time to build objects from
+            responses.
+
+    """
+
+    def __init__(self, bounds=DEFAULT_BOUNDS):
+        self.requests = 0
+        self.errors = 0
+        self.cached = 0
+        self.bytes = 0
+        self.status_codes = collections.Counter()
+        self.total_time = LatencyHistogram(bounds)
+        self.ttfb = LatencyHistogram(bounds)
+        self.decode_time = LatencyHistogram(bounds)
+        self.parse_time = LatencyHistogram(bounds)
+
+    def add(self, record):
+        """Add a request to the stats.
+
+        Args:
+            record (:class:`RequestRecord`): the request.
+
+        """
+        self.requests += 1
+        if record.error is not None:
+            self.errors += 1
+        if record.status_code is not None:
+            self.status_codes[record.status_code] += 1
+        if record.parse_time is not None:
+            self.parse_time.add(record.parse_time)
+        if record.cached:
+            self.cached += 1
+            return
+
+        self.bytes += record.bytes
+        self.total_time.add(record.total_time)
+        self.decode_time.add(record.decode_time)
+        if record.ttfb is not None:
+            self.ttfb.add(record.ttfb)
+
+
+class RequestStats(object):
+    """Observer that aggregates request measurements per endpoint.
+
+    Pass an instance to a :class:`Client <pyticketswitch.client.Client>` as
+    one of its observers::
+
+        >>> stats = RequestStats()
+        >>> client = Client('demo', 'demopass', observers=[stats])
+        >>> events, meta = client.list_events()
+        >>> stats['events.v1'].total_time.quantile(0.99)
+        0.5
+
+    Attributes:
+        bounds (tuple): upper bounds in seconds of the histogram buckets.
+            Defaults to :data:`DEFAULT_BOUNDS`.
+        endpoints (dict): :class:`EndpointStats` indexed on endpoint.
+
+    """
+
+    def __init__(self, bounds=DEFAULT_BOUNDS):
+        self.bounds = bounds
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        with self._lock:
+            stats = self.endpoints.get(record.endpoint)
+            if stats is None:
+                stats = EndpointStats(self.bounds)
+                self.endpoints[record.endpoint] = stats
+            stats.add(record)
+
+    def __getitem__(self, endpoint):
+        return self.endpoints[endpoint]
+
+    def summary(self):
+        """Summarise the stats for each endpoint.
+
+        Returns:
+            dict: dictionaries of request and error counts and latency
+            percentiles in seconds, indexed on endpoint.
+
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "cached": stats.cached,
+                    "bytes": stats.bytes,
+                    "mean": stats.total_time.mean,
+                    "p50": stats.total_time.quantile(0.5),
+                    "p99": stats.total_time.quantile(0.99),
+                    "max": stats.total_time.max,
+                    "mean_decode_time": stats.decode_time.mean,
+                    "mean_parse_time": stats.parse_time.mean,
+                }
+                for endpoint, stats in self.endpoints.items()
+            }
+
+    def reset(self):
+        """Discard all stats."""
+        with self._lock:
+            self.endpoints = {}
@@ -0,0 +1,126 @@
+#: assign to a :class:`LazyAttribute` to build it from raw data on first access.
+LAZY = object()
+
+
+class LazyAttribute(object):
+    """Attribute built from an object's raw data the first time it's read.
+
+    Assigning :data:`LAZY` to the attribute defers building it until it's
+    read, at which point **build** is called with the object's ``raw`` data
+    and the result is kept. Assigning any other value sets the attribute as
+    normal::
+
+        >>> class Thing(object):
+        ...     parts = LazyAttribute('parts', build_parts)
+        ...     def __init__(self, parts=None, raw=None):
+        ...         self.parts = parts
+        ...         self.raw = raw
+        >>> thing = Thing(parts=LAZY, raw={'part': [1, 2, 3]})
+        >>> thing.parts  # calls build_parts(thing.raw)
+
+    Classes with ``__slots__`` can keep the value in a slot of the same name
+    instead of the instance ``__dict__``, see :func:`lazy_slots`.
+
+    Attributes:
+        name (str): the name of the attribute.
+        build (callable): builds the value from the raw data.
+        slot: the descriptor of the slot the value is kept in, or
+            :obj:`None` to keep it in the instance ``__dict__``.
+
+    """
+
+    def __init__(self, name, build, slot=None):
+        self.name = name
+        self.build = build
+        self.slot = slot
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        try:
+            return self._load(instance)
+        except (AttributeError, KeyError):
+            pass
+
+        value = self.build(instance.raw or {})
+        self._store(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        if value is not LAZY:
+            self._store(instance, value)
+        elif self.slot is not None:
+            if self.is_built(instance):
+                self.slot.__delete__(instance)
+        else:
+            instance.__dict__.pop(self.name, None)
+
+    def _load(self, instance):
+        if self.slot is None:
+            return instance.__dict__[self.name]
+        return self.slot.__get__(instance, type(instance))
+
+    def _store(self, instance, value):
+        if self.slot is None:
+            instance.__dict__[self.name] = value
+        else:
+            self.slot.__set__(instance, value)
+
+    def is_built(self, instance):
+        """Check if the attribute has a value yet.
+
+        Args:
+            instance: the object.
+
+        Returns:
+            bool: :obj:`True` when the attribute has been built or set.
+
+        """
+        try:
+            self._load(instance)
+        except (AttributeError, KeyError):
+            return False
+        return True
+
+
+def lazy_slots(*attributes):
+    """Class decorator that makes slots into lazy attributes.
+
+    A slot can't share its name with a class attribute, so slotted classes
+    declare their lazy attributes with this decorator rather than in the
+    class body::
+
+        >>> @lazy_slots(('parts', build_parts))
+        ... class Thing(object):
+        ...     __slots__ = ('parts', 'raw')
+
+    The names are also set as the class's ``lazy_attributes``.
+
+    Args:
+        *attributes (tuple): the name of each slot and the callable that
+            builds its value from raw data.
+
+    Returns:
+        callable: the class decorator.
+
+    """
+
+    def decorate(cls):
+        for name, build in attributes:
+            setattr(cls, name, LazyAttribute(name, build, slot=cls.__dict__[name]))
+        cls.lazy_attributes = tuple(name for name, _ in attributes)
+        return cls
+
+    return decorate
+
+
+def load_lazy_attributes(obj):
+    """Build any lazy attributes of an object that haven't been read yet.
+
+    Args:
+        obj: the object.
+
+    """
+    for name in getattr(obj, "lazy_attributes", ()):
+        getattr(obj, name)
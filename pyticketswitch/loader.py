@@ -0,0 +1,151 @@
+import threading
+
+from concurrent import futures
+
+from pyticketswitch import utils
+
+DEFAULT_MAX_BATCH_SIZE = 50
+
+
+class LoaderFuture(futures.Future):
+    """Future returned by :meth:`BatchLoader.load`.
+
+    Asking for the result of the future dispatches any lookups still waiting
+    on the loader, so it's never necessary to call
+    :meth:`BatchLoader.dispatch` before waiting on a result.
+    """
+
+    def __init__(self, loader):
+        super(LoaderFuture, self).__init__()
+        self._loader = loader
+
+    def result(self, timeout=None):
+        if not self.done():
+            self._loader.dispatch()
+        return super(LoaderFuture, self).result(timeout=timeout)
+
+    def exception(self, timeout=None):
+        if not self.done():
+            self._loader.dispatch()
+        return super(LoaderFuture, self).exception(timeout=timeout)
+
+
+class BatchLoader(object):
+    """Collects individual lookups and resolves them with batched calls.
+
+    Each call to :meth:`load` returns a future straight away. Keys are
+    collected until the loader is dispatched, at which point **batch_func**
+    is called once per chunk of at most **max_batch_size** keys and each
+    future is resolved from the returned dictionary::
+
+        >>> loader = client.event_loader()
+        >>> nutcracker = loader.load('6IF')
+        >>> swan_lake = loader.load('6IE')
+        >>> nutcracker.result()  # one call to get_events for both events
+        <Event 6IF:Matthew Bourne's Nutcracker TEST>
+
+    The loader is dispatched when:
+
+    - a result of one of its futures is requested,
+    - :meth:`dispatch` is called,
+    - the loader is used as a context manager and the block exits,
+    - **wait** seconds have passed since the first key was collected.
+
+    Attributes:
+        batch_func (callable): called with a list of keys and returns a
+            dictionary of results indexed on key. Keys missing from the
+            dictionary resolve to :obj:`None`, and keys whose result is an
+            exception raise it.
+        max_batch_size (int): the maximum number of keys passed to a single
+            call of **batch_func**. Defaults to 50.
+        wait (float): number of seconds to collect keys for before
+            automatically dispatching them. When :obj:`None` keys are only
+            dispatched as described above. Defaults to :obj:`None`.
+
+    """
+
+    def __init__(self, batch_func, max_batch_size=DEFAULT_MAX_BATCH_SIZE, wait=None):
+        self.batch_func = batch_func
+        self.max_batch_size = max_batch_size
+        self.wait = wait
+
+        self._pending = {}
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.dispatch()
+
+    def load(self, key):
+        """Look up a key.
+
+        Args:
+            key: the key to look up, for example an event ID.
+
+        Returns:
+            :class:`LoaderFuture`: resolves to the result for the key.
+
+        """
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = LoaderFuture(self)
+                self._pending[key] = future
+                self._start_timer()
+            return future
+
+    def load_many(self, keys):
+        """Look up several keys.
+
+        Args:
+            keys (list): the keys to look up.
+
+        Returns:
+            list: a :class:`LoaderFuture` for each key.
+
+        """
+        return [self.load(key) for key in keys]
+
+    def _start_timer(self):
+        if self.wait is None or self._timer is not None:
+            return
+        self._timer = threading.Timer(self.wait, self.dispatch)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def dispatch(self):
+        """Resolve all collected keys."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        for chunk in utils.chunked(list(pending), self.max_batch_size):
+            self._resolve(chunk, pending)
+
+    def _resolve(self, keys, pending):
+        for key in keys:
+            if not pending[key].set_running_or_notify_cancel():
+                del pending[key]
+
+        keys = [key for key in keys if key in pending]
+        if not keys:
+            return
+
+        try:
+            results = self.batch_func(keys)
+        except Exception as error:
+            for key in keys:
+                pending[key].set_exception(error)
+            return
+
+        for key in keys:
+            result = results.get(key)
+            if isinstance(result, Exception):
+                pending[key].set_exception(result)
+            else:
+                pending[key].set_result(result)
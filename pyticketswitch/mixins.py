@@ -2,44 +2,191 @@ import datetime
 import decimal
 import json
 
+import six
+
 from pyticketswitch import utils
+from pyticketswitch.lazy import load_lazy_attributes
 
 
-class JSONMixin(object):
-    """Adds json encoding functionality to objects."""
+def slot_names(cls):
+    """Get the names of the slots of a class and its bases.
+
+    Args:
+        cls (type): the class.
+
+    Returns:
+        tuple: the slot names.
+
+    """
+    try:
+        return _SLOT_NAMES[cls]
+    except KeyError:
+        pass
+
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, six.string_types):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("__dict__", "__weakref__") and name not in names:
+                names.append(name)
+
+    _SLOT_NAMES[cls] = tuple(names)
+    return _SLOT_NAMES[cls]
+
+
+_SLOT_NAMES = {}
+
+
+def iter_attributes(obj):
+    """Iterate over the attributes of an object.
+
+    Covers both attributes kept in slots and in the instance ``__dict__``.
+    Slots that haven't been set are skipped.
+
+    Args:
+        obj: the object.
+
+    Yields:
+        tuple: the name and value of each attribute.
+
+    """
+    for name in slot_names(type(obj)):
+        try:
+            value = getattr(obj, name)
+        except AttributeError:
+            continue
+        yield name, value
+
+    for item in getattr(obj, "__dict__", {}).items():
+        yield item
+
+
+# how values of each type are serialised, worked out the first time a type
+# is seen. None means the value is used as it is.
+_CONVERTERS = {}
+_ITERABLE_TYPES = {}
+_PLANS = {}
+
+
+def _isoformat(value, hide_none, hide_empty):
+    return value.isoformat()
 
-    def __jsondict__(self, hide_none=True, hide_empty=True):
 
-        def sanitise(obj):
-            if isinstance(obj, datetime.datetime):
-                return obj.isoformat()
+def _float(value, hide_none, hide_empty):
+    return float(value)
 
-            if isinstance(obj, datetime.date):
-                return obj.isoformat()
 
-            if isinstance(obj, decimal.Decimal):
-                return float(obj)
+def _custom_jsondict(value, hide_none, hide_empty):
+    return value.__jsondict__(hide_none=hide_none, hide_empty=hide_empty)
 
-            if hasattr(obj, "__jsondict__"):
-                return obj.__jsondict__(hide_none=hide_none, hide_empty=hide_empty)
 
-            if isinstance(obj, list):
-                return [sanitise(item) for item in obj]
+def _list(value, hide_none, hide_empty):
+    return [_sanitise(item, hide_none, hide_empty) for item in value]
 
-            if isinstance(obj, dict):
-                return {key: sanitise(value) for key, value in obj.items()}
 
-            return obj
+def _dict(value, hide_none, hide_empty):
+    return {key: _sanitise(item, hide_none, hide_empty) for key, item in value.items()}
 
-        return {
-            key: sanitise(obj)
-            for key, obj in self.__dict__.items()
+
+def _get_converter(cls):
+    if issubclass(cls, datetime.date):
+        converter = _isoformat
+    elif issubclass(cls, decimal.Decimal):
+        converter = _float
+    elif getattr(cls, "__jsondict__", None) is JSONMixin.__jsondict__:
+        converter = _serialise
+    elif hasattr(cls, "__jsondict__"):
+        converter = _custom_jsondict
+    elif issubclass(cls, list):
+        converter = _list
+    elif issubclass(cls, dict):
+        converter = _dict
+    else:
+        converter = None
+    _CONVERTERS[cls] = converter
+    return converter
+
+
+def _sanitise(value, hide_none, hide_empty):
+    cls = type(value)
+    try:
+        converter = _CONVERTERS[cls]
+    except KeyError:
+        converter = _get_converter(cls)
+    if converter is None:
+        return value
+    return converter(value, hide_none, hide_empty)
+
+
+def _is_iterable(cls):
+    try:
+        return _ITERABLE_TYPES[cls]
+    except KeyError:
+        _ITERABLE_TYPES[cls] = hasattr(cls, "__iter__")
+        return _ITERABLE_TYPES[cls]
+
+
+def _get_plan(cls):
+    try:
+        return _PLANS[cls]
+    except KeyError:
+        pass
+    _PLANS[cls] = (slot_names(cls), bool(getattr(cls, "lazy_attributes", ())))
+    return _PLANS[cls]
+
+
+def _serialise(obj, hide_none, hide_empty):
+    names, lazy = _get_plan(type(obj))
+    if lazy:
+        load_lazy_attributes(obj)
+
+    items = []
+    for name in names:
+        try:
+            items.append((name, getattr(obj, name)))
+        except AttributeError:
+            pass
+    instance_dict = getattr(obj, "__dict__", None)
+    if instance_dict:
+        items.extend(instance_dict.items())
+
+    result = {}
+    for name, value in items:
+        if value is None:
             # when hiding None's and the object is None, skip the object
-            if not (hide_none and obj is None)
-            # when hiding empty iterators and the object is an iterator and
-            # it's empty, skip the object.
-            if not (hide_empty and hasattr(obj, "__iter__") and not obj)
-        }
+            if not hide_none:
+                result[name] = None
+            continue
+
+        cls = type(value)
+        # when hiding empty iterators and the object is an iterator and it's
+        # empty, skip the object.
+        if hide_empty and _is_iterable(cls) and not value:
+            continue
+
+        try:
+            converter = _CONVERTERS[cls]
+        except KeyError:
+            converter = _get_converter(cls)
+        if converter is None:
+            result[name] = value
+        else:
+            result[name] = converter(value, hide_none, hide_empty)
+
+    return result
+
+
+class JSONMixin(object):
+    """Adds json encoding functionality to objects."""
+
+    __slots__ = ()
+
+    def __jsondict__(self, hide_none=True, hide_empty=True):
+        # the attributes of each class, and how to serialise each type of
+        # value, are only worked out once.
+        return _serialise(self, hide_none, hide_empty)
 
     def as_dict_for_json(self, hide_none=True, hide_empty=True):
         """Generate a json serialisable dictionary from the object
@@ -167,6 +314,20 @@ class SeatPricingMixin(object):
             seat/ticket when not on offer.
     """
 
+    __slots__ = (
+        "seatprice",
+        "surcharge",
+        "non_offer_seatprice",
+        "non_offer_surcharge",
+    )
+
+    price_attributes = (
+        "seatprice",
+        "surcharge",
+        "non_offer_seatprice",
+        "non_offer_surcharge",
+    )
+
     def __init__(
         self,
         seatprice=None,
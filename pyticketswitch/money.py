@@ -0,0 +1,140 @@
+"""Prices as whole numbers of a currency's minor units.
+
+Prices are returned by the API as decimal numbers, and are parsed as
+:py:class:`float` or, with ``use_decimal``, :py:class:`Decimal
+<decimal.Decimal>`. Floats can't represent most prices exactly, and adding
+up Decimals is slow. When a :class:`Client <pyticketswitch.client.Client>`
+is created with ``minor_units=True`` prices are converted to integers in the
+minor units of their currency, so that £35.50 becomes ``3550``, and all
+arithmetic, comparisons and sorting on them are exact and fast.
+
+Only the attributes listed in a class's ``price_attributes`` are converted.
+They are either amounts of money, including taxes, savings and commissions,
+or objects and lists of objects that have prices of their own. Percentages,
+availability and quantities are left as they are.
+
+"""
+
+import decimal
+
+import six
+
+#: the number of decimal places used when the currency isn't known.
+DEFAULT_PLACES = 2
+
+
+def to_minor_units(price, places=DEFAULT_PLACES):
+    """Convert a price to a whole number of minor units.
+
+    Args:
+        price (float): the price, as a :py:class:`float`, :py:class:`int`,
+            :py:class:`Decimal <decimal.Decimal>` or :py:class:`str`.
+        places (int): the number of decimal places of the currency.
+
+    Returns:
+        int: the price in minor units, rounded to the nearest minor unit, or
+        :obj:`None` when **price** is :obj:`None`.
+
+    """
+    if price is None:
+        return None
+
+    if places is None:
+        places = DEFAULT_PLACES
+    scale = 10**places
+
+    if isinstance(price, six.integer_types):
+        return price * scale
+    if isinstance(price, float):
+        return int(round(price * scale))
+
+    amount = decimal.Decimal(str(price)).scaleb(places)
+    return int(amount.to_integral_value(rounding=decimal.ROUND_HALF_EVEN))
+
+
+def from_minor_units(amount, places=DEFAULT_PLACES):
+    """Convert a whole number of minor units back to a price.
+
+    Args:
+        amount (int): the price in minor units.
+        places (int): the number of decimal places of the currency.
+
+    Returns:
+        :py:class:`Decimal <decimal.Decimal>`: the exact price, or :obj:`None`
+        when **amount** is :obj:`None`.
+
+    """
+    if amount is None:
+        return None
+
+    if places is None:
+        places = DEFAULT_PLACES
+    return decimal.Decimal(amount).scaleb(-places)
+
+
+def convert_prices(obj, places=None, currency_meta=None):
+    """Convert the prices of an object to minor units, in place.
+
+    Objects and lists of objects in the ``price_attributes`` of **obj** are
+    converted too, once each even when they are shared. Converting an object
+    again in a later call will scale its prices again.
+
+    Args:
+        obj: the object, or a list of objects.
+        places (int): the number of decimal places of the currency. Defaults
+            to the places of the default currency of **currency_meta**, or
+            to 2.
+        currency_meta (:class:`CurrencyMeta <pyticketswitch.currency.CurrencyMeta>`):
+            the currencies of the response the object came from. Objects
+            with a ``currency_code``, such as :class:`Bundles
+            <pyticketswitch.bundle.Bundle>`, are converted with the places
+            of their own currency, as are :class:`CostRanges
+            <pyticketswitch.cost_range.CostRange>` and :class:`AvailabilityDetails
+            <pyticketswitch.availability.AvailabilityDetails>` with a
+            ``currency``.
+
+    Lazy attributes in ``price_attributes`` are built so that they can be
+    converted.
+
+    """
+    if places is None:
+        places = _get_places(currency_meta, None, DEFAULT_PLACES)
+    _convert(obj, places, currency_meta, set())
+
+
+def _get_places(currency_meta, code, default):
+    if currency_meta is None:
+        return default
+    currency = currency_meta.get_currency(code)
+    if currency is None or currency.places is None:
+        return default
+    return currency.places
+
+
+def _convert(obj, places, currency_meta, seen):
+    if obj is None:
+        return
+
+    if isinstance(obj, (list, tuple)):
+        for item in obj:
+            _convert(item, places, currency_meta, seen)
+        return
+
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+
+    currency_code = getattr(obj, "currency_code", None) or getattr(
+        obj, "currency", None
+    )
+    if isinstance(currency_code, six.string_types) and currency_code:
+        places = _get_places(currency_meta, currency_code, places)
+
+    for name in getattr(obj, "price_attributes", ()):
+        value = getattr(obj, name, None)
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)) or hasattr(value, "price_attributes"):
+            _convert(value, places, currency_meta, seen)
+        else:
+            setattr(obj, name, to_minor_units(value, places))
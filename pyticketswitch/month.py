@@ -1,3 +1,4 @@
+import calendar
 import datetime
 
 from pyticketswitch.misc import MONTH_NUMBERS
@@ -21,6 +22,8 @@ class Month(JSONMixin, object):
 
     """
 
+    price_attributes = ("cost_range", "no_singles_cost_range")
+
     def __init__(
         self,
         month,
@@ -110,6 +113,20 @@ class Month(JSONMixin, object):
         adjusted_day = day + 1 if day < 6 else 0
         return bool(self._weekday_bitmask >> adjusted_day & 1)
 
+    def get_dates(self):
+        """Get the days of the month with availability.
+
+        Returns:
+            list: :py:class:`datetime.date` objects, in order.
+
+        """
+        days_in_month = calendar.monthrange(self.year, self.month)[1]
+        return [
+            datetime.date(year=self.year, month=self.month, day=day)
+            for day in bitmask_to_numbered_list(self._dates_bitmask)
+            if day <= days_in_month
+        ]
+
     def start_date(self):
         num_list = bitmask_to_numbered_list(self._dates_bitmask)
         if not num_list:
@@ -16,6 +16,25 @@ class Offer(JSONMixin, object):
 
     """
 
+    __slots__ = (
+        "seatprice",
+        "surcharge",
+        "original_surcharge",
+        "original_seatprice",
+        "absolute_saving",
+        "percentage_saving",
+        "__dict__",
+        "__weakref__",
+    )
+
+    price_attributes = (
+        "seatprice",
+        "surcharge",
+        "original_seatprice",
+        "original_surcharge",
+        "absolute_saving",
+    )
+
     def __init__(
         self,
         seatprice=None,
@@ -27,6 +27,18 @@ class TicketOrder(JSONMixin, object):
         raw_total_surcharge_tax_sub_component (float): total surcharge tax.
     """
 
+    price_attributes = (
+        "seatprice",
+        "surcharge",
+        "total_seatprice",
+        "total_surcharge",
+        "total_sale_combined",
+        "raw_combined_tax_component",
+        "raw_surcharge_tax_sub_component",
+        "raw_total_combined_tax_component",
+        "raw_total_surcharge_tax_sub_component",
+    )
+
     def __init__(
         self,
         code,
@@ -239,6 +251,20 @@ class Order(JSONMixin, object):
 
     """
 
+    price_attributes = (
+        "event",
+        "performance",
+        "total_seatprice",
+        "total_surcharge",
+        "total_sale_combined",
+        "total_sale_combined_tax_component",
+        "total_sale_surcharge_tax_sub_component",
+        "ticket_orders",
+        "send_method",
+        "gross_commission",
+        "user_commission",
+    )
+
     def __init__(
         self,
         item,
@@ -296,12 +322,18 @@ class Order(JSONMixin, object):
         self.reserve_failure_comment = reserve_failure_comment
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new **Order** object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a order.
+            lazy (bool): whether the event of the order is lazy, see
+                :meth:`Event.from_api_data
+                <pyticketswitch.event.Event.from_api_data>`. Defaults to
+                :obj:`False`.
+            keep_raw (bool or list): the raw data the event of the order
+                keeps. Defaults to :obj:`True`.
 
         Returns:
             :class:`Order <pyticketswitch.order.Order>`: a new
@@ -330,7 +362,7 @@ class Order(JSONMixin, object):
 
         raw_event = data.get("event")
         if raw_event:
-            event = Event.from_api_data(raw_event)
+            event = Event.from_api_data(raw_event, lazy=lazy, keep_raw=keep_raw)
             kwargs.update(event=event)
 
         raw_performance = data.get("performance")
@@ -47,6 +47,28 @@ class Performance(JSONMixin, object):
 
     """
 
+    __slots__ = (
+        "id",
+        "event_id",
+        "date_time",
+        "date_description",
+        "time_description",
+        "has_pool_seats",
+        "is_limited",
+        "cached_max_seats",
+        "cached_max_seats_is_real",
+        "cost_range",
+        "no_singles_cost_range",
+        "is_ghost",
+        "name",
+        "running_time",
+        "availability_details",
+        "__dict__",
+        "__weakref__",
+    )
+
+    price_attributes = ("cost_range", "no_singles_cost_range", "availability_details")
+
     def __init__(
         self,
         id_,
@@ -1,6 +1,7 @@
 from pyticketswitch.cost_range import CostRange
 from pyticketswitch.discount import Discount
-from pyticketswitch.seat import Seat, SeatBlock
+from pyticketswitch.seat import Seat, SeatBlock, index_seat_text
+from pyticketswitch.seat_inventory import SeatInventory
 from pyticketswitch.commission import Commission
 from pyticketswitch.mixins import JSONMixin, SeatPricingMixin
 
@@ -36,6 +37,9 @@ class PriceBand(SeatPricingMixin, JSONMixin, object):
             this are the contiguous seats that are available for purchase.
             :class:`SeatBlocks <pyticketswitch.seat.SeatBlock>` contain
             :class:`Seats <pyticketswitch.seat.Seat>`.
+        seat_inventory (:class:`SeatInventory <pyticketswitch.seat_inventory.SeatInventory>`):
+            compact store of the free seats, used instead of **seat_blocks**
+            when requested.
         user_commission (:class:`Commission <pyticketswitch.commission.Commission>`):
             the commission payable to the user on the sale of tickets in this
             price band. Only available when requested.
@@ -48,6 +52,38 @@ class PriceBand(SeatPricingMixin, JSONMixin, object):
 
     """
 
+    __slots__ = (
+        "code",
+        "description",
+        "cost_range",
+        "allows_leaving_single_seats",
+        "no_singles_cost_range",
+        "default_discount",
+        "example_seats",
+        "example_seats_are_real",
+        "seat_blocks",
+        "user_commission",
+        "discounts",
+        "availability",
+        "percentage_saving",
+        "absolute_saving",
+        "is_offer",
+        "tax_component",
+        "seat_inventory",
+        "__dict__",
+        "__weakref__",
+    )
+
+    price_attributes = SeatPricingMixin.price_attributes + (
+        "absolute_saving",
+        "tax_component",
+        "user_commission",
+        "cost_range",
+        "no_singles_cost_range",
+        "default_discount",
+        "discounts",
+    )
+
     def __init__(
         self,
         code,
@@ -70,6 +106,7 @@ class PriceBand(SeatPricingMixin, JSONMixin, object):
         absolute_saving=0,
         is_offer=None,
         tax_component=None,
+        seat_inventory=None,
     ):
 
         self.code = code
@@ -92,14 +129,18 @@ class PriceBand(SeatPricingMixin, JSONMixin, object):
         self.absolute_saving = absolute_saving
         self.is_offer = is_offer
         self.tax_component = tax_component
+        self.seat_inventory = seat_inventory
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, compact_seats=False):
         """Creates a new **PriceBand** object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a price band.
+            compact_seats (bool): keep free seats in a :class:`SeatInventory
+                <pyticketswitch.seat_inventory.SeatInventory>` rather than
+                as seat blocks. Defaults to :obj:`False`.
 
         Returns:
             :class:`PriceBand <pyticketswitch.order.PriceBand>`: a new
@@ -144,25 +185,37 @@ class PriceBand(SeatPricingMixin, JSONMixin, object):
 
         if seat_block_data:
             separators_by_row = seat_block_data.get("separators_by_row")
-            restricted_view_seats = seat_block_data.get("restricted_view_seats")
-            seats_by_text_message = seat_block_data.get("seats_by_text_message")
+            restricted_view_seats = set(
+                seat_block_data.get("restricted_view_seats") or ()
+            )
+            seat_text_by_id = index_seat_text(
+                seat_block_data.get("seats_by_text_message")
+            )
             blocks_by_row = seat_block_data.get("blocks_by_row")
 
-            seat_blocks = []
-            if blocks_by_row:
-                for row_id, row in blocks_by_row.items():
-                    for block in row:
-                        separator = separators_by_row.get(row_id)
-                        seat_block = SeatBlock.from_api_data(
-                            block=block,
-                            row_id=row_id,
-                            separator=separator,
-                            restricted_view_seats=restricted_view_seats,
-                            seats_by_text_message=seats_by_text_message,
-                        )
-                        seat_blocks.append(seat_block)
-
-            kwargs.update(seat_blocks=seat_blocks)
+            if compact_seats:
+                seat_inventory = SeatInventory.from_api_data(
+                    seat_block_data,
+                    restricted_view_seats=restricted_view_seats,
+                    seat_text_by_id=seat_text_by_id,
+                )
+                kwargs.update(seat_inventory=seat_inventory)
+            else:
+                seat_blocks = []
+                if blocks_by_row:
+                    for row_id, row in blocks_by_row.items():
+                        for block in row:
+                            separator = separators_by_row.get(row_id)
+                            seat_block = SeatBlock.from_api_data(
+                                block=block,
+                                row_id=row_id,
+                                separator=separator,
+                                restricted_view_seats=restricted_view_seats,
+                                seat_text_by_id=seat_text_by_id,
+                            )
+                            seat_blocks.append(seat_block)
+
+                kwargs.update(seat_blocks=seat_blocks)
 
         user_commission_data = data.get("predicted_user_commission")
         if user_commission_data:
@@ -185,6 +238,18 @@ class PriceBand(SeatPricingMixin, JSONMixin, object):
 
         return cls(**kwargs)
 
+    def get_seat_blocks(self):
+        """Get the free seat blocks
+
+        Returns:
+            list: list of :class:`SeatBlocks <pyticketswitch.seat.SeatBlock>`,
+            created from the :attr:`seat_inventory` when there is one.
+
+        """
+        if self.seat_inventory is not None:
+            return self.seat_inventory.get_seat_blocks()
+        return self.seat_blocks or []
+
     def get_seats(self):
         """Get all seats in child seat blocks
 
@@ -192,6 +257,9 @@ class PriceBand(SeatPricingMixin, JSONMixin, object):
             list: list of :class:`Seats <pyticketswitch.seat.Seat>`.
 
         """
+        if self.seat_inventory is not None:
+            return self.seat_inventory.get_seats()
+
         if not self.seat_blocks:
             return []
 
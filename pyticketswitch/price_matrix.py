@@ -0,0 +1,221 @@
+import collections
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+#: the columns of a price matrix, in order.
+COLUMNS = (
+    "ticket_type_code",
+    "price_band_code",
+    "discount_code",
+    "seatprice",
+    "surcharge",
+    "availability",
+    "tax",
+)
+
+_TEXT_COLUMNS = ("ticket_type_code", "price_band_code", "discount_code")
+
+
+class PriceMatrix(object):
+    """The prices of an availability response as parallel columns.
+
+    Each row is a discount of a price band of a ticket type, so the ticket
+    types returned by :meth:`Client.get_availability
+    <pyticketswitch.client.Client.get_availability>` can be sorted, filtered
+    and aggregated as a table, or with NumPy when it is installed::
+
+        >>> ticket_types, meta = client.get_availability(perf_id, discounts=True)
+        >>> matrix = PriceMatrix.from_ticket_types(ticket_types)
+        >>> matrix['seatprice'][:3]
+        [35.0, 25.0, 30.0]
+        >>> cheapest = matrix.sort_by('seatprice', 'surcharge')
+        >>> array = matrix.to_numpy()
+        >>> array[array['seatprice'] < 30]['price_band_code']
+        array(['B/pool', 'C/pool'], dtype='<U6')
+
+    Price bands without discounts get a single row, with the prices of their
+    default discount, or of the price band itself when it has no default
+    discount. The tax is the combined tax component of the same prices, so
+    with a client using ``minor_units`` every money column is in minor
+    units. The columns are listed in :data:`COLUMNS`.
+
+    """
+
+    def __init__(self, columns=None):
+        columns = columns or {}
+        lengths = set(len(column) for column in columns.values())
+        if len(lengths) > 1:
+            raise ValueError("columns must all be the same length")
+
+        # columns that aren't given are missing for every row
+        length = lengths.pop() if lengths else 0
+        self.columns = collections.OrderedDict(
+            (name, list(columns.get(name, [None] * length))) for name in COLUMNS
+        )
+
+    @classmethod
+    def from_ticket_types(cls, ticket_types):
+        """Creates a price matrix from ticket types.
+
+        Args:
+            ticket_types (list): :class:`TicketTypes
+                <pyticketswitch.ticket_type.TicketType>`, as returned by
+                :meth:`Client.get_availability
+                <pyticketswitch.client.Client.get_availability>`.
+
+        Returns:
+            :class:`PriceMatrix <pyticketswitch.price_matrix.PriceMatrix>`:
+            the price matrix.
+
+        """
+        ticket_type_codes = []
+        price_band_codes = []
+        discount_codes = []
+        seatprices = []
+        surcharges = []
+        availabilities = []
+        taxes = []
+
+        for ticket_type in ticket_types:
+            for price_band in ticket_type.price_bands or []:
+                discounts = price_band.discounts or [price_band.default_discount]
+                for discount in discounts:
+                    prices = price_band if discount is None else discount
+                    ticket_type_codes.append(ticket_type.code)
+                    price_band_codes.append(price_band.code)
+                    discount_codes.append(getattr(discount, "code", None))
+                    seatprices.append(prices.seatprice)
+                    surcharges.append(prices.surcharge)
+                    availabilities.append(prices.availability)
+                    taxes.append(prices.tax_component)
+
+        return cls(
+            {
+                "ticket_type_code": ticket_type_codes,
+                "price_band_code": price_band_codes,
+                "discount_code": discount_codes,
+                "seatprice": seatprices,
+                "surcharge": surcharges,
+                "availability": availabilities,
+                "tax": taxes,
+            }
+        )
+
+    def __len__(self):
+        return len(self.columns["ticket_type_code"])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __iter__(self):
+        return iter(self.rows())
+
+    def rows(self):
+        """Get the rows of the matrix.
+
+        Returns:
+            list: a tuple of the values of each row, in the order of
+            :data:`COLUMNS`.
+
+        """
+        return list(zip(*self.columns.values()))
+
+    def take(self, indexes):
+        """Get some of the rows of the matrix.
+
+        Args:
+            indexes (list): the indexes of the rows, in the order wanted.
+
+        Returns:
+            :class:`PriceMatrix <pyticketswitch.price_matrix.PriceMatrix>`: a
+            new matrix with the rows.
+
+        """
+        return PriceMatrix(
+            {
+                name: [column[index] for index in indexes]
+                for name, column in self.columns.items()
+            }
+        )
+
+    def where(self, **values):
+        """Get the rows with the given values.
+
+        Args:
+            **values: the wanted value of each column, indexed on column name.
+
+        Returns:
+            :class:`PriceMatrix <pyticketswitch.price_matrix.PriceMatrix>`: a
+            new matrix with the matching rows.
+
+        """
+        indexes = range(len(self))
+        for name, value in values.items():
+            column = self.columns[name]
+            indexes = [index for index in indexes if column[index] == value]
+        return self.take(indexes)
+
+    def sort_by(self, *names, **kwargs):
+        """Sort the rows of the matrix.
+
+        Missing values sort last, in either order.
+
+        Args:
+            *names: the columns to sort on, most significant first.
+            reverse (bool): sort in descending order. Defaults to
+                :obj:`False`.
+
+        Returns:
+            :class:`PriceMatrix <pyticketswitch.price_matrix.PriceMatrix>`: a
+            new matrix with the rows in order.
+
+        """
+        reverse = kwargs.get("reverse", False)
+
+        indexes = list(range(len(self)))
+        for name in reversed(names):
+            column = self.columns[name]
+            present = [index for index in indexes if column[index] is not None]
+            missing = [index for index in indexes if column[index] is None]
+            present.sort(key=column.__getitem__, reverse=reverse)
+            indexes = present + missing
+
+        return self.take(indexes)
+
+    def to_numpy(self):
+        """Get the matrix as a NumPy structured array.
+
+        Code columns are unicode strings. Price, availability and tax columns
+        are integers when all their values are whole numbers, as they are
+        with a client using ``minor_units``, and floats otherwise, with
+        missing values as ``nan``.
+
+        Returns:
+            :class:`numpy.ndarray`: a structured array with a field for each
+            column.
+
+        Raises:
+            ImportError: when NumPy isn't installed.
+
+        """
+        if numpy is None:
+            raise ImportError("PriceMatrix.to_numpy requires numpy")
+
+        dtype = []
+        values = []
+        for name, column in self.columns.items():
+            if name in _TEXT_COLUMNS:
+                column = [value or "" for value in column]
+                width = max([len(value) for value in column] + [1])
+                dtype.append((name, "U{}".format(width)))
+            elif all(isinstance(value, int) for value in column):
+                dtype.append((name, "i8"))
+            else:
+                column = [float("nan") if value is None else value for value in column]
+                dtype.append((name, "f8"))
+            values.append(column)
+
+        return numpy.array(list(zip(*values)), dtype=dtype)
@@ -46,6 +46,8 @@ class Reservation(Status):
 
     """
 
+    price_attributes = Status.price_attributes + ("unreserved_orders",)
+
     def __init__(
         self,
         unreserved_orders=None,
@@ -59,12 +61,18 @@ class Reservation(Status):
         self.input_contained_unavailable_order = input_contained_unavailable_order
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new **Reservation** object from ticketswitch API data.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a reservation.
+            lazy (bool): whether the events of the orders are lazy, see
+                :meth:`Event.from_api_data
+                <pyticketswitch.event.Event.from_api_data>`. Defaults to
+                :obj:`False`.
+            keep_raw (bool or list): the raw data the events of the orders
+                keep. Defaults to :obj:`True`.
 
         Returns:
             :class:`Reservation <pyticketswitch.order.Reservation>`: a new
@@ -73,13 +81,14 @@ class Reservation(Status):
 
         """
 
-        inst = super(Reservation, cls).from_api_data(data)
+        inst = super(Reservation, cls).from_api_data(data, lazy=lazy, keep_raw=keep_raw)
 
         unreserved_orders = []
         raw_unreserved_orders = data.get("unreserved_orders")
         if raw_unreserved_orders:
             unreserved_orders = [
-                Order.from_api_data(order) for order in raw_unreserved_orders
+                Order.from_api_data(order, lazy=lazy, keep_raw=keep_raw)
+                for order in raw_unreserved_orders
             ]
 
         inst.unreserved_orders = unreserved_orders
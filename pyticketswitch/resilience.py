@@ -0,0 +1,348 @@
+import logging
+import random
+import threading
+import time
+
+import requests
+
+from pyticketswitch import exceptions
+
+logger = logging.getLogger(__name__)
+
+#: read only endpoints that are safe to retry.
+IDEMPOTENT_ENDPOINTS = frozenset(
+    [
+        "test.v1",
+        "events.v1",
+        "events_by_id.v1",
+        "months.v1",
+        "performances.v1",
+        "performances_by_id.v1",
+        "availability.v1",
+        "send_methods.v1",
+        "discounts.v1",
+        "trolley.v1",
+        "upsells.v1",
+        "add_ons.v1",
+        "reserve_page_archive.v1",
+        "purchase_page_archive.v1",
+        "status.v1",
+        "trans_id_status.v1",
+    ]
+)
+
+#: errors raised while making a request that are worth retrying.
+RETRYABLE_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    exceptions.BackendError,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def backend_error_from_api_data(data):
+    """Get the error described by the backend flags in a response.
+
+    Args:
+        data (dict): the whole decoded response from the API.
+
+    Returns:
+        :class:`BackendError <pyticketswitch.exceptions.BackendError>`: the
+        error, or :obj:`None` when the response doesn't indicate a problem
+        with the backend system.
+
+    """
+    source_code = data.get("source_code")
+    if data.get("backend_is_down"):
+        return exceptions.BackendDownError(
+            "backend system {} is down".format(source_code)
+        )
+    if data.get("backend_is_broken"):
+        return exceptions.BackendBrokenError(
+            "backend system {} is broken".format(source_code)
+        )
+    if data.get("backend_throttle_failed"):
+        return exceptions.BackendThrottleError(
+            "call to backend system {} was throttled".format(source_code)
+        )
+    return None
+
+
+class CircuitBreaker(object):
+    """Tracks failures of a backend system and fails fast while it is down.
+
+    The breaker starts closed and allows all calls. After
+    **failure_threshold** consecutive failures it opens and rejects calls
+    until **reset_timeout** seconds have passed, when it becomes half open and
+    a single trial call is allowed through. A successful trial closes the
+    breaker, a failed one opens it again.
+
+    Attributes:
+        failure_threshold (int): consecutive failures before opening.
+        reset_timeout (float): seconds to stay open before allowing a trial
+            call.
+        state (str): one of ``closed``, ``open`` or ``half_open``.
+        failures (int): the current number of consecutive failures.
+
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30, clock=time.time):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Check if a call should be made.
+
+        Returns:
+            bool: :obj:`True` when the call should go ahead.
+
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+
+            # while half open another trial is only allowed once the current
+            # one has had reset_timeout seconds to report back.
+            now = self.clock()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+
+            self.state = HALF_OPEN
+            self._opened_at = now
+            return True
+
+    def record_success(self):
+        """Record a successful call."""
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        """Record a failed call."""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self._opened_at = self.clock()
+
+
+class ResiliencePolicy(object):
+    """Retries failed requests and fails fast when a backend system is down.
+
+    Pass an instance to a :class:`Client <pyticketswitch.client.Client>` to
+    apply it to every request::
+
+        >>> client = Client('demo', 'demopass', resilience=ResiliencePolicy())
+
+    Requests to idempotent endpoints are retried with jittered exponential
+    backoff when they fail with a network error or when the response
+    indicates the backend system is down, broken or throttled. When retries
+    are exhausted the last error is raised, so with a policy in place a
+    response flagging a backend problem raises a
+    :class:`BackendError <pyticketswitch.exceptions.BackendError>`.
+
+    Backend systems are identified by the ``source_code`` of responses. The
+    policy remembers which backend each event belongs to and keeps a
+    :class:`CircuitBreaker` per backend, so that while a backend is down
+    requests for its events and performances raise a
+    :class:`BackendDownError <pyticketswitch.exceptions.BackendDownError>`
+    without calling the API.
+
+    Attributes:
+        max_attempts (int): maximum number of attempts for idempotent
+            requests. Defaults to 3.
+        backoff (float): base delay in seconds between attempts. Defaults to
+            0.1.
+        max_backoff (float): maximum delay in seconds between attempts.
+            Defaults to 2.
+        idempotent_endpoints (set): endpoints whose ``GET`` requests may be
+            retried. Defaults to :data:`IDEMPOTENT_ENDPOINTS`.
+        failure_threshold (int): consecutive backend failures before failing
+            fast. Defaults to 5.
+        reset_timeout (float): seconds to fail fast for before trying the
+            backend again. Defaults to 30.
+
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff=0.1,
+        max_backoff=2.0,
+        idempotent_endpoints=IDEMPOTENT_ENDPOINTS,
+        failure_threshold=5,
+        reset_timeout=30,
+        clock=time.time,
+        sleep=time.sleep,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.idempotent_endpoints = idempotent_endpoints
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.sleep = sleep
+
+        self._breakers = {}
+        self._sources = {}
+        self._lock = threading.Lock()
+
+    def is_idempotent(self, endpoint, method):
+        """Check if a request is safe to retry.
+
+        Args:
+            endpoint (str): target API endpoint.
+            method (str): HTTP method of the request.
+
+        Returns:
+            bool: :obj:`True` when the request may be retried.
+
+        """
+        return method == "get" and endpoint in self.idempotent_endpoints
+
+    def get_backoff(self, attempt):
+        """Get the delay before the next attempt.
+
+        Args:
+            attempt (int): the number of the failed attempt, starting at 0.
+
+        Returns:
+            float: seconds to wait, chosen at random up to an exponentially
+            increasing cap.
+
+        """
+        cap = min(self.max_backoff, self.backoff * (2**attempt))
+        return random.uniform(0, cap)
+
+    def get_breaker(self, source_code):
+        """Get the circuit breaker for a backend system.
+
+        Args:
+            source_code (str): the code for the backend system.
+
+        Returns:
+            :class:`CircuitBreaker`: the breaker.
+
+        """
+        with self._lock:
+            breaker = self._breakers.get(source_code)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    failure_threshold=self.failure_threshold,
+                    reset_timeout=self.reset_timeout,
+                    clock=self.clock,
+                )
+                self._breakers[source_code] = breaker
+            return breaker
+
+    def get_source_code(self, params):
+        """Get the backend system a request is for, when known.
+
+        Args:
+            params (dict): parameters sent with the request.
+
+        Returns:
+            str: the source code, or :obj:`None` when it has not been seen
+            yet.
+
+        """
+        event_id = _event_id_from_params(params)
+        if not event_id:
+            return None
+        return self._sources.get(event_id)
+
+    def call(self, endpoint, params, method, func):
+        """Make a request according to the policy.
+
+        Args:
+            endpoint (str): target API endpoint.
+            params (dict): parameters sent with the request.
+            method (str): HTTP method of the request.
+            func (callable): makes the request and returns the decoded
+                response. Anything other than a :class:`dict`, such as a
+                response that is streamed, isn't checked for backend
+                problems.
+
+        Returns:
+            the result of **func**.
+
+        Raises:
+            BackendDownError: when the backend system for the request is
+                known to be down.
+            BackendError: when the response indicates a problem with the
+                backend system on the final attempt.
+
+        """
+        source_code = self.get_source_code(params)
+        if source_code and not self.get_breaker(source_code).allow():
+            raise exceptions.BackendDownError(
+                "backend system {} is down, not calling {}".format(
+                    source_code, endpoint
+                )
+            )
+
+        attempts = self.max_attempts if self.is_idempotent(endpoint, method) else 1
+        for attempt in range(attempts):
+            try:
+                contents = func()
+                error = None
+                if isinstance(contents, dict):
+                    self._learn_source_code(params, contents)
+                    error = backend_error_from_api_data(contents)
+            except RETRYABLE_ERRORS as exc:
+                error = exc
+
+            self._record(params, error)
+            if error is None:
+                return contents
+
+            if attempt + 1 < attempts:
+                delay = self.get_backoff(attempt)
+                logger.debug(
+                    "%s failed with %r, retrying in %.3fs", endpoint, error, delay
+                )
+                self.sleep(delay)
+
+        raise error
+
+    def _learn_source_code(self, params, contents):
+        event_id = _event_id_from_params(params)
+        source_code = contents.get("source_code")
+        if event_id and source_code:
+            with self._lock:
+                self._sources[event_id] = source_code
+
+    def _record(self, params, error):
+        source_code = self.get_source_code(params)
+        if not source_code:
+            return
+
+        breaker = self.get_breaker(source_code)
+        if isinstance(
+            error, (exceptions.BackendDownError, exceptions.BackendBrokenError)
+        ):
+            breaker.record_failure()
+        elif error is None:
+            breaker.record_success()
+
+
+def _event_id_from_params(params):
+    event_id = params.get("event_id")
+    if event_id:
+        return event_id
+
+    performance_id = params.get("perf_id")
+    if performance_id:
+        return performance_id.split("-")[0]
+
+    return None
@@ -11,6 +11,13 @@ class SeatBlock(JSONMixin, object):
 
     """
 
+    __slots__ = (
+        "length",
+        "seats",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(self, length, seats=None):
         self.length = length
         self.seats = seats
@@ -23,6 +30,7 @@ class SeatBlock(JSONMixin, object):
         separator="",
         restricted_view_seats=None,
         seats_by_text_message=None,
+        seat_text_by_id=None,
     ):
         """Creates a new SeatBlock object from API data from ticketswitch.
 
@@ -31,9 +39,13 @@ class SeatBlock(JSONMixin, object):
                 that concerns a seat block.
             row_id (str): the component of the seat ID corresponding to the row
             separator (str): the string separating row and column in the id
-            restricted_view_seats (list): seat IDs that have restricted view
+            restricted_view_seats (set): seat IDs that have restricted view.
+                Any container works, but a set is fastest.
             seats_by_text_message (dict): a mapping of seat text messages to
-                seat IDs
+                seat IDs. Ignored when **seat_text_by_id** is given.
+            seat_text_by_id (dict): seat text messages indexed on seat ID, as
+                returned by :func:`index_seat_text`. Pass this when parsing
+                several blocks to only index the messages once.
 
         Returns:
             :class:`SeatBlock <pyticketswitch.seat.SeatBlock>`: a new
@@ -41,35 +53,26 @@ class SeatBlock(JSONMixin, object):
             populated with the data from the api.
 
         """
+        if restricted_view_seats is None:
+            restricted_view_seats = ()
 
-        seats = []
-        for seat_id in block:
-
-            column = None
-            delimiter = separator
+        if seat_text_by_id is None:
+            seat_text_by_id = index_seat_text(seats_by_text_message)
 
-            if not delimiter:
-                delimiter = row_id
+        delimiter = separator
+        if not delimiter:
+            delimiter = row_id
 
-            split_id = seat_id.split(delimiter)
-            column = split_id[1]
-
-            restricted = False
-            restricted_text = ""
-
-            if seat_id in restricted_view_seats:
-                restricted = True
-
-            for seat_text, list_of_seats in seats_by_text_message.items():
-                if seat_id in list_of_seats:
-                    restricted_text = seat_text
+        seats = []
+        for seat_id in block:
+            column = seat_id.split(delimiter)[1]
             seat = Seat(
                 id_=seat_id,
                 row=row_id,
                 column=column,
                 separator=separator,
-                is_restricted=restricted,
-                seat_text=restricted_text,
+                is_restricted=seat_id in restricted_view_seats,
+                seat_text=seat_text_by_id.get(seat_id, ""),
             )
             seats.append(seat)
 
@@ -77,6 +80,25 @@ class SeatBlock(JSONMixin, object):
         return cls(**kwargs)
 
 
+def index_seat_text(seats_by_text_message):
+    """Index seat text messages on seat ID.
+
+    Args:
+        seats_by_text_message (dict): lists of seat IDs indexed on seat text
+            message, as returned by the API.
+
+    Returns:
+        dict: seat text messages indexed on seat ID. When a seat is listed
+        under more than one message the last one is used.
+
+    """
+    return {
+        seat_id: seat_text
+        for seat_text, seat_ids in (seats_by_text_message or {}).items()
+        for seat_id in seat_ids
+    }
+
+
 class Seat(JSONMixin, object):
     """Describes a seat in a venue.
 
@@ -97,6 +119,21 @@ class Seat(JSONMixin, object):
 
     """
 
+    __slots__ = (
+        "id",
+        "column",
+        "row",
+        "separator",
+        "is_restricted",
+        "seat_text",
+        "seat_text_code",
+        "barcode",
+        "seat_apple_wallet_urls",
+        "seat_google_pay_urls",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         id_=None,
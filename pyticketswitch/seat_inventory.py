@@ -0,0 +1,211 @@
+import array
+import re
+
+import six
+
+from pyticketswitch.seat import Seat, SeatBlock, index_seat_text
+
+_INTEGER = re.compile(r"(0|[1-9][0-9]*)$")
+
+
+class SeatInventory(object):
+    """Compact store of the free seat blocks of a price band.
+
+    Rather than a :class:`Seat <pyticketswitch.seat.Seat>` object for every
+    free seat, seats are kept in flat arrays: an interned row ID and
+    separator for each row, an integer column for each seat and a bit for
+    each restricted view seat. :class:`Seats <pyticketswitch.seat.Seat>` and
+    :class:`SeatBlocks <pyticketswitch.seat.SeatBlock>` are created when
+    they are asked for, so large inventories use a fraction of the memory::
+
+        >>> ticket_types, meta = client.get_availability(
+        ...     perf_id, seat_blocks=True, compact_seats=True)
+        >>> price_band = ticket_types[0].price_bands[0]
+        >>> len(price_band.seat_inventory)
+        48210
+        >>> price_band.get_seats()[0]
+        <Seat A1>
+
+    Columns that aren't plain integers, and seat IDs that can't be rebuilt
+    from their row, separator and column, are kept as strings.
+
+    """
+
+    def __init__(self):
+        self.rows = []
+        self._row_separators = []
+        self._row_prefixes = []
+        self._row_index = {}
+
+        self._block_rows = array.array("l")
+        self._block_starts = array.array("l", [0])
+
+        self._columns = array.array("l")
+        self._other_columns = []
+        self._other_ids = {}
+        self._restricted = bytearray()
+        self._seat_text = {}
+
+    @classmethod
+    def from_api_data(cls, data, restricted_view_seats=None, seat_text_by_id=None):
+        """Creates a new SeatInventory object from API data from ticketswitch.
+
+        Args:
+            data (dict): the ``free_seat_blocks`` part of a price band.
+            restricted_view_seats (set): seat IDs that have restricted view.
+                Defaults to those in **data**.
+            seat_text_by_id (dict): seat text messages indexed on seat ID.
+                Defaults to those in **data**.
+
+        Returns:
+            :class:`SeatInventory <pyticketswitch.seat_inventory.SeatInventory>`:
+            a new inventory populated with the data from the api.
+
+        """
+        if restricted_view_seats is None:
+            restricted_view_seats = set(data.get("restricted_view_seats") or ())
+        if seat_text_by_id is None:
+            seat_text_by_id = index_seat_text(data.get("seats_by_text_message"))
+
+        inventory = cls()
+        separators_by_row = data.get("separators_by_row") or {}
+        for row_id, row in (data.get("blocks_by_row") or {}).items():
+            for block in row:
+                inventory.add_block(
+                    row_id,
+                    separators_by_row.get(row_id),
+                    block,
+                    restricted_view_seats,
+                    seat_text_by_id,
+                )
+        return inventory
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __jsondict__(self, hide_none=True, hide_empty=True):
+        return [
+            block.__jsondict__(hide_none=hide_none, hide_empty=hide_empty)
+            for block in self.get_seat_blocks()
+        ]
+
+    def _get_row(self, row_id, separator, prefix):
+        key = (row_id, separator)
+        index = self._row_index.get(key)
+        if index is None:
+            index = len(self.rows)
+            self._row_index[key] = index
+            self.rows.append(_intern(row_id))
+            self._row_separators.append(_intern(separator))
+            self._row_prefixes.append(_intern(prefix))
+        return index
+
+    def add_block(
+        self,
+        row_id,
+        separator,
+        seat_ids,
+        restricted_view_seats=(),
+        seat_text_by_id=None,
+    ):
+        """Add a block of adjacent free seats.
+
+        Args:
+            row_id (str): the row of the seats.
+            separator (str): the string separating row and column in the
+                seat IDs.
+            seat_ids (list): the IDs of the seats, in order.
+            restricted_view_seats (set): seat IDs that have restricted view.
+            seat_text_by_id (dict): seat text messages indexed on seat ID.
+
+        """
+        if not seat_ids:
+            return
+
+        seat_text_by_id = seat_text_by_id or {}
+        delimiter = separator or row_id
+        row = None
+
+        for seat_id in seat_ids:
+            split_id = seat_id.split(delimiter)
+            prefix, column = split_id[0], split_id[1]
+            if row is None:
+                row = self._get_row(row_id, separator, prefix)
+
+            index = len(self._columns)
+            if _INTEGER.match(column):
+                self._columns.append(int(column))
+            else:
+                self._columns.append(-1 - len(self._other_columns))
+                self._other_columns.append(column)
+
+            expected = "".join([self._row_prefixes[row], delimiter, column])
+            if seat_id != expected:
+                self._other_ids[index] = seat_id
+
+            if index % 8 == 0:
+                self._restricted.append(0)
+            if seat_id in restricted_view_seats:
+                self._restricted[index >> 3] |= 1 << (index & 7)
+
+            seat_text = seat_text_by_id.get(seat_id)
+            if seat_text:
+                self._seat_text[index] = seat_text
+
+        self._block_rows.append(row)
+        self._block_starts.append(len(self._columns))
+
+    def _make_seat(self, index, row):
+        column = self._columns[index]
+        if column < 0:
+            column = self._other_columns[-1 - column]
+        else:
+            column = str(column)
+
+        row_id = self.rows[row]
+        separator = self._row_separators[row]
+        seat_id = self._other_ids.get(index)
+        if seat_id is None:
+            seat_id = "".join([self._row_prefixes[row], separator or row_id, column])
+
+        return Seat(
+            id_=seat_id,
+            row=row_id,
+            column=column,
+            separator=separator,
+            is_restricted=bool(self._restricted[index >> 3] >> (index & 7) & 1),
+            seat_text=self._seat_text.get(index, ""),
+        )
+
+    def get_seat_blocks(self):
+        """Get the free seat blocks.
+
+        Returns:
+            list: new :class:`SeatBlocks <pyticketswitch.seat.SeatBlock>`.
+
+        """
+        blocks = []
+        starts = self._block_starts
+        for block, row in enumerate(self._block_rows):
+            seats = [
+                self._make_seat(index, row)
+                for index in range(starts[block], starts[block + 1])
+            ]
+            blocks.append(SeatBlock(length=len(seats), seats=seats))
+        return blocks
+
+    def get_seats(self):
+        """Get all the free seats.
+
+        Returns:
+            list: new :class:`Seats <pyticketswitch.seat.Seat>`, block by
+            block.
+
+        """
+        return [seat for block in self.get_seat_blocks() for seat in block.seats]
+
+
+def _intern(value):
+    if isinstance(value, str):
+        return six.moves.intern(value)
+    return value
@@ -0,0 +1,405 @@
+import collections
+import heapq
+import re
+
+from pyticketswitch.mixins import JSONMixin
+
+DEFAULT_LIMIT = 5
+
+_DIGITS = re.compile(r"(\d+)")
+
+# the best rank of a run in the middle of a block, which doesn't leave a
+# single seat or include a restricted view seat, but splits the block in two.
+_BEST_MIDDLE_RANK = (False, 0, 2)
+
+
+def _column_key(seat):
+    # sort columns naturally, so that column 10 follows column 9
+    return [
+        int(part) if part.isdigit() else part
+        for part in _DIGITS.split(seat.column or "")
+    ]
+
+
+class SeatRun(JSONMixin, object):
+    """A run of adjacent free seats that could be selected together.
+
+    Attributes:
+        ticket_type_code (str): identifier of the ticket type.
+        price_band_code (str): identifier of the price band.
+        row (str): the row the seats are in.
+        seats (list): the :class:`Seats <pyticketswitch.seat.Seat>`, in
+            order.
+        restricted_seats (int): the number of seats with a restricted view.
+        leaves_single_seat (bool): indicates that selecting the seats would
+            leave a single free seat next to them.
+
+    """
+
+    __slots__ = (
+        "ticket_type_code",
+        "price_band_code",
+        "row",
+        "seats",
+        "restricted_seats",
+        "leaves_single_seat",
+    )
+
+    def __init__(
+        self,
+        ticket_type_code,
+        price_band_code,
+        row,
+        seats,
+        restricted_seats=0,
+        leaves_single_seat=False,
+    ):
+        self.ticket_type_code = ticket_type_code
+        self.price_band_code = price_band_code
+        self.row = row
+        self.seats = seats
+        self.restricted_seats = restricted_seats
+        self.leaves_single_seat = leaves_single_seat
+
+    @property
+    def seat_ids(self):
+        """list: the IDs of the seats, in order."""
+        return [seat.id for seat in self.seats]
+
+    def __repr__(self):
+        return "<SeatRun {}:{} {}>".format(
+            self.ticket_type_code, self.price_band_code, ",".join(self.seat_ids)
+        )
+
+
+class _Block(object):
+    """A free seat block, with a running count of restricted view seats."""
+
+    __slots__ = (
+        "ticket_type_code",
+        "price_band_code",
+        "singles",
+        "row",
+        "seats",
+        "restricted",
+    )
+
+    def __init__(self, ticket_type_code, price_band, seats):
+        self.ticket_type_code = ticket_type_code
+        self.price_band_code = price_band.code
+        self.singles = price_band.allows_leaving_single_seats
+        self.row = seats[0].row
+        self.seats = seats
+
+        # restricted[i] is the number of restricted view seats before seat i
+        self.restricted = [0]
+        for seat in seats:
+            self.restricted.append(self.restricted[-1] + bool(seat.is_restricted))
+
+
+class SeatMap(object):
+    """Index of the free seats of a performance for choosing seats.
+
+    Built from the ticket types returned by :meth:`Client.get_availability
+    <pyticketswitch.client.Client.get_availability>` with
+    ``seat_blocks=True``. Each free seat block is a run of adjacent seats in
+    a row, and a selection of seats is contiguous when the seats are next to
+    each other in the same block::
+
+        >>> ticket_types, meta = client.get_availability(perf_id, seat_blocks=True)
+        >>> seat_map = SeatMap.from_ticket_types(ticket_types, meta)
+        >>> runs = seat_map.find_seats(2, price_band_code='A/pool')
+        >>> runs[0].seat_ids
+        ['F12', 'F13']
+        >>> seat_map.leaves_single_seat(['F12', 'F13'])
+        False
+
+    Attributes:
+        rows (dict): free :class:`Seats <pyticketswitch.seat.Seat>` indexed
+            on row, with the seats of each row in column order.
+        contiguous_seat_selection_only (bool): only allow selections of
+            adjacent seats. Defaults to :obj:`True`.
+        must_select_whole_seat_block (bool): only allow selections of whole
+            seat blocks. Defaults to :obj:`False`.
+
+    """
+
+    def __init__(
+        self,
+        blocks=None,
+        contiguous_seat_selection_only=True,
+        must_select_whole_seat_block=False,
+    ):
+        self.contiguous_seat_selection_only = contiguous_seat_selection_only
+        self.must_select_whole_seat_block = must_select_whole_seat_block
+        self._blocks = list(blocks or [])
+        self._seats = {}
+
+        rows = collections.defaultdict(list)
+        for block in self._blocks:
+            for position, seat in enumerate(block.seats):
+                self._seats[seat.id] = (block, position)
+                rows[block.row].append(seat)
+
+        self.rows = collections.OrderedDict(
+            (row, sorted(seats, key=_column_key)) for row, seats in sorted(rows.items())
+        )
+
+    @classmethod
+    def from_ticket_types(cls, ticket_types, meta=None):
+        """Creates a new seat map from ticket types.
+
+        Args:
+            ticket_types (list): :class:`TicketTypes
+                <pyticketswitch.ticket_type.TicketType>` with seat blocks.
+            meta (:class:`AvailabilityMeta <pyticketswitch.availability.AvailabilityMeta>`):
+                the meta information from the same response, used for the
+                backend system's seat selection rules.
+
+        Returns:
+            :class:`SeatMap <pyticketswitch.seat_map.SeatMap>`: the seat
+            map.
+
+        """
+        blocks = [
+            _Block(ticket_type.code, price_band, seat_block.seats)
+            for ticket_type in ticket_types
+            for price_band in ticket_type.price_bands or []
+            for seat_block in price_band.get_seat_blocks()
+            if seat_block.seats
+        ]
+
+        kwargs = {}
+        if meta is not None:
+            kwargs.update(
+                contiguous_seat_selection_only=meta.contiguous_seat_selection_only,
+                must_select_whole_seat_block=bool(meta.must_select_whole_seat_block),
+            )
+
+        return cls(blocks, **kwargs)
+
+    def __len__(self):
+        return len(self._seats)
+
+    def __contains__(self, seat_id):
+        return seat_id in self._seats
+
+    def get_seat(self, seat_id):
+        """Get a free seat.
+
+        Args:
+            seat_id (str): the seat ID.
+
+        Returns:
+            :class:`Seat <pyticketswitch.seat.Seat>`: the seat, or
+            :obj:`None` when the seat isn't free.
+
+        """
+        try:
+            block, position = self._seats[seat_id]
+        except KeyError:
+            return None
+        return block.seats[position]
+
+    def find_seats(
+        self,
+        quantity,
+        ticket_type_code=None,
+        price_band_code=None,
+        limit=DEFAULT_LIMIT,
+        allow_restricted=True,
+    ):
+        """Find the best runs of adjacent free seats.
+
+        Runs are ranked so that those leaving a single free seat come last,
+        then by the number of restricted view seats, and then by how much
+        they split up the remaining free seats, so runs that fill a whole
+        block come before runs at the end of a block, which come before runs
+        in the middle. Runs that would leave a single seat are left out for
+        price bands that never allow it.
+
+        Args:
+            quantity (int): the number of seats.
+            ticket_type_code (str): only look in this ticket type.
+            price_band_code (str): only look in this price band.
+            limit (int): the maximum number of runs to return. Defaults to 5.
+            allow_restricted (bool): include runs with restricted view seats.
+                Defaults to :obj:`True`.
+
+        Returns:
+            list: up to **limit** :class:`SeatRuns
+            <pyticketswitch.seat_map.SeatRun>`, best first.
+
+        """
+        if quantity < 1:
+            return []
+
+        blocks = [
+            block
+            for block in self._blocks
+            if len(block.seats) >= quantity
+            if ticket_type_code is None or block.ticket_type_code == ticket_type_code
+            if price_band_code is None or block.price_band_code == price_band_code
+        ]
+        # runs at the ends of blocks usually rank best, so only look in the
+        # middle of blocks when they might make it into the results.
+        candidates = self._iter_candidates(blocks, quantity, allow_restricted, True)
+        best = heapq.nsmallest(limit, candidates)
+        if len(best) < limit or best[-1][0] >= _BEST_MIDDLE_RANK:
+            candidates = self._iter_candidates(blocks, quantity, allow_restricted)
+            best = heapq.nsmallest(limit, candidates)
+
+        return [self._run(blocks[index], start, quantity) for (_, index, start) in best]
+
+    def find_seats_by_price_band(
+        self,
+        quantity,
+        ticket_type_code=None,
+        limit=DEFAULT_LIMIT,
+        allow_restricted=True,
+    ):
+        """Find the best runs of adjacent free seats in each price band.
+
+        Args:
+            quantity (int): the number of seats.
+            ticket_type_code (str): only look in this ticket type.
+            limit (int): the maximum number of runs to return for each price
+                band. Defaults to 5.
+            allow_restricted (bool): include runs with restricted view seats.
+                Defaults to :obj:`True`.
+
+        Returns:
+            dict: lists of :class:`SeatRuns <pyticketswitch.seat_map.SeatRun>`,
+            best first, indexed on ticket type code and price band code.
+            Price bands without any runs are left out.
+
+        """
+        price_bands = collections.OrderedDict()
+        for block in self._blocks:
+            if ticket_type_code is None or block.ticket_type_code == ticket_type_code:
+                price_bands[(block.ticket_type_code, block.price_band_code)] = None
+
+        results = collections.OrderedDict()
+        for key in price_bands:
+            runs = self.find_seats(
+                quantity,
+                ticket_type_code=key[0],
+                price_band_code=key[1],
+                limit=limit,
+                allow_restricted=allow_restricted,
+            )
+            if runs:
+                results[key] = runs
+        return results
+
+    def _iter_candidates(self, blocks, quantity, allow_restricted, ends_only=False):
+        for index, block in enumerate(blocks):
+            length = len(block.seats)
+            if self.must_select_whole_seat_block and length != quantity:
+                continue
+
+            starts = range(length - quantity + 1)
+            if ends_only:
+                starts = sorted(set([0, length - quantity]))
+
+            restricted = block.restricted
+            for start in starts:
+                end = start + quantity
+                restricted_seats = restricted[end] - restricted[start]
+                if restricted_seats and not allow_restricted:
+                    continue
+
+                after = length - end
+                leaves_single = start == 1 or after == 1
+                if leaves_single and block.singles == "never":
+                    continue
+
+                fragments = (start > 0) + (after > 0)
+                rank = (leaves_single, restricted_seats, fragments)
+                yield rank, index, start
+
+    def _run(self, block, start, quantity):
+        end = start + quantity
+        after = len(block.seats) - end
+        seats = block.seats[start:end]
+        return SeatRun(
+            block.ticket_type_code,
+            block.price_band_code,
+            block.row,
+            seats,
+            restricted_seats=block.restricted[end] - block.restricted[start],
+            leaves_single_seat=start == 1 or after == 1,
+        )
+
+    def _positions(self, seat_ids):
+        positions = collections.OrderedDict()
+        for seat_id in seat_ids:
+            try:
+                block, position = self._seats[seat_id]
+            except KeyError:
+                raise ValueError("{} is not a free seat".format(seat_id))
+            positions.setdefault(id(block), (block, set()))[1].add(position)
+        return list(positions.values())
+
+    def leaves_single_seat(self, seat_ids):
+        """Check if selecting seats would leave a single free seat.
+
+        A single seat is left when a free seat next to the selection has no
+        other free seat next to it.
+
+        Args:
+            seat_ids (list): the IDs of the selected seats.
+
+        Returns:
+            bool: :obj:`True` when the selection leaves a single seat.
+
+        Raises:
+            ValueError: when a seat isn't free.
+
+        """
+        for block, selected in self._positions(seat_ids):
+            length = len(block.seats)
+            run = 0
+            for position in range(length + 1):
+                if position < length and position not in selected:
+                    run += 1
+                    continue
+                if run == 1:
+                    return True
+                run = 0
+        return False
+
+    def is_valid_selection(self, seat_ids):
+        """Check if seats can be selected together.
+
+        Selections must be of adjacent seats when the backend system only
+        allows contiguous selections, and of whole seat blocks when it only
+        allows whole blocks to be selected.
+
+        Args:
+            seat_ids (list): the IDs of the selected seats.
+
+        Returns:
+            bool: :obj:`True` when the seats can be selected together.
+
+        Raises:
+            ValueError: when a seat isn't free.
+
+        """
+        positions = self._positions(seat_ids)
+        if not positions:
+            return False
+
+        if self.must_select_whole_seat_block:
+            for block, selected in positions:
+                if len(selected) != len(block.seats):
+                    return False
+
+        if self.contiguous_seat_selection_only:
+            if len(positions) > 1:
+                return False
+            selected = positions[0][1]
+            if max(selected) - min(selected) + 1 != len(selected):
+                return False
+
+        return True
@@ -19,6 +19,8 @@ class SendMethod(JSONMixin, object):
         trans_fee_component (float): transaction fee added by repricing rule.
     """
 
+    price_attributes = ("cost", "send_cost_tax_component", "trans_fee_component")
+
     def __init__(
         self,
         code,
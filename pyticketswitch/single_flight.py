@@ -0,0 +1,89 @@
+import copy
+import threading
+
+from pyticketswitch import exceptions
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Coalesces concurrent identical calls into a single call.
+
+    While a call for a key is in flight, other threads calling :meth:`do`
+    with the same key wait for it to finish and share its result instead of
+    making their own call. Once the call has finished the next call for that
+    key will run again, results are not cached.
+
+    Attributes:
+        coalesced (int): number of calls that were served by another call
+            already in flight.
+
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args, **kwargs):
+        """Run a callable, or wait for an identical call already in flight.
+
+        Args:
+            key: hashable key identifying the call.
+            func (callable): the callable to run.
+            *args: positional arguments for the callable.
+            **kwargs: keyword arguments for the callable.
+
+        Returns:
+            the result of the callable.
+
+        Raises:
+            Exception: any exception raised by the callable. Each waiting
+                thread raises its own copy of the exception where possible.
+            CallInterruptedError: in waiting threads, when the call was
+                interrupted by something other than an :class:`Exception`,
+                such as :class:`KeyboardInterrupt` or :class:`SystemExit`.
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if isinstance(call.error, Exception):
+                raise _copy_error(call.error)
+            if call.error is not None:
+                raise exceptions.CallInterruptedError(
+                    "coalesced call was interrupted by {!r}".format(call.error)
+                )
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+
+def _copy_error(error):
+    try:
+        return copy.copy(error)
+    except Exception:
+        return error
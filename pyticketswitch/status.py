@@ -57,6 +57,8 @@ class Status(JSONMixin, object):
             about how to reenter the purchase process.
     """
 
+    price_attributes = ("trolley",)
+
     def __init__(
         self,
         status=None,
@@ -101,12 +103,18 @@ class Status(JSONMixin, object):
         self.purchase_result = purchase_result
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new Status object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a transactions state.
+            lazy (bool): whether the events of the orders are lazy, see
+                :meth:`Event.from_api_data
+                <pyticketswitch.event.Event.from_api_data>`. Defaults to
+                :obj:`False`.
+            keep_raw (bool or list): the raw data the events of the orders
+                keep. Defaults to :obj:`True`.
 
         Returns:
             :class:`Status <pyticketswitch.status.Status>`: a new
@@ -126,7 +134,7 @@ class Status(JSONMixin, object):
 
         kwargs = {
             "status": data.get("transaction_status"),
-            "trolley": Trolley.from_api_data(data),
+            "trolley": Trolley.from_api_data(data, lazy=lazy, keep_raw=keep_raw),
             "remote_site": data.get("remote_site"),
             "can_edit_address": data.get("can_edit_address"),
             "needs_agent_reference": data.get("needs_agent_reference"),
@@ -0,0 +1,315 @@
+import codecs
+import json
+import re
+
+from pyticketswitch import exceptions
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_START = "-0123456789"
+_NUMBER_CONTINUE = ".eE+-"
+_STRUCTURE = re.compile(r'["{}\[\]]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class _Reader(object):
+    """Reads JSON values from a stream of byte chunks."""
+
+    def __init__(self, chunks, decoder):
+        self.decoder = decoder
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+
+        # how far the value at pos has been scanned for its end, so that
+        # each chunk of a long value is only scanned once
+        self._scan_pos = 0
+        self._depth = 0
+        self._in_string = False
+
+    def fill(self):
+        """Read the next chunk into the buffer, returning False at the end."""
+        if self.eof:
+            return False
+
+        pos = self.pos
+        if pos:
+            self.buffer = self.buffer[pos:]
+            self.pos = 0
+            self._scan_pos -= pos
+
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self.buffer += self._text.decode(b"", final=True)
+            self.eof = True
+            return False
+
+        self.buffer += self._text.decode(chunk)
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character, "" at the end."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars):
+        """Consume the next character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(
+                "expected one of {!r} at position {}, got {!r}".format(
+                    chars, self.pos, char
+                )
+            )
+        self.pos += 1
+        return char
+
+    def scan(self):
+        """Check if the object, array or string at pos ends in the buffer.
+
+        Scanning carries on from where the last call stopped.
+        """
+        buffer = self.buffer
+        position = self._scan_pos
+        depth = self._depth
+        in_string = self._in_string
+        complete = False
+
+        while True:
+            if in_string:
+                match = _STRING_SPECIAL.search(buffer, position)
+                if match is None:
+                    position = len(buffer)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        # the escaped character is in the next chunk
+                        position = match.start()
+                        break
+                    position = match.end() + 1
+                    continue
+                position = match.end()
+                in_string = False
+                if not depth:
+                    complete = True
+                    break
+            else:
+                match = _STRUCTURE.search(buffer, position)
+                if match is None:
+                    position = len(buffer)
+                    break
+                position = match.end()
+                char = match.group()
+                if char == '"':
+                    in_string = True
+                elif char in "{[":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if not depth:
+                        complete = True
+                        break
+
+        self._scan_pos = position
+        self._depth = depth
+        self._in_string = in_string
+        return complete
+
+    def value(self):
+        """Decode the next complete value."""
+        if self.peek() in '{["':
+            self._scan_pos = self.pos
+            self._depth = 0
+            self._in_string = False
+            while not self.scan():
+                if not self.fill():
+                    break
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                if not self.fill():
+                    raise
+                continue
+
+            # a number near the end of the buffer, or followed by a character
+            # that can continue it, may carry on in the next chunk
+            if self.buffer[self.pos] in _NUMBER_START and not self.eof:
+                if end >= len(self.buffer) - 1 or self.buffer[end] in _NUMBER_CONTINUE:
+                    # decode again either way, as filling moves the buffer
+                    self.fill()
+                    continue
+
+            self.pos = end
+            return value
+
+
+def iter_json_list(chunks, path, document, parse_float=float):
+    """Iterate over the items of a list nested in a streamed JSON object.
+
+    Items are decoded and yielded one at a time as the stream is read, so
+    only the current item and the remaining values are held in memory.
+    Everything else in the object is decoded into **document** as it is
+    read, with an empty list in place of the streamed one.
+
+    Args:
+        chunks (iterable): chunks of the UTF-8 encoded JSON object, as
+            bytes.
+        path (tuple): keys leading to the list, for example
+            ``('results', 'event')``.
+        document (dict): populated with the rest of the object.
+        parse_float (callable): used to decode JSON numbers with decimal
+            places. Defaults to :class:`float`.
+
+    Yields:
+        the decoded items of the list.
+
+    Raises:
+        ValueError: when the stream is not a valid JSON object.
+
+    """
+    reader = _Reader(chunks, json.JSONDecoder(parse_float=parse_float))
+    for item in _iter_object(reader, tuple(path), document):
+        yield item
+
+    if reader.peek():
+        raise ValueError(
+            "extra data after JSON object at position {}".format(reader.pos)
+        )
+
+
+def _iter_object(reader, path, document):
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+        return
+
+    while True:
+        key = reader.value()
+        reader.expect(":")
+
+        items = None
+        if path and key == path[0]:
+            if len(path) == 1 and reader.peek() == "[":
+                document[key] = []
+                items = _iter_array(reader)
+            elif len(path) > 1 and reader.peek() == "{":
+                document[key] = {}
+                items = _iter_object(reader, path[1:], document[key])
+
+        if items is None:
+            document[key] = reader.value()
+        else:
+            for item in items:
+                yield item
+
+        if reader.expect(",}") == "}":
+            return
+
+
+def _iter_array(reader):
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
+
+
+class ResponseStream(object):
+    """Objects parsed one at a time from a list in a streamed response.
+
+    Iterating over the stream reads the response as it arrives and yields an
+    object for each item of the list as soon as it is complete, so peak
+    memory use is one item rather than the whole response. The response is
+    closed when iteration finishes, when :meth:`close` is called, or when the
+    stream is garbage collected::
+
+        >>> with client.stream_events(extra_info=True, media=True) as stream:
+        ...     for event in stream:
+        ...         index(event)
+        >>> stream.meta
+        <pyticketswitch.event.EventMeta object at 0x...>
+
+    A stream can only be iterated over once.
+
+    Attributes:
+        meta: meta information for the response, available once the stream
+            has been read to the end.
+        document (dict): the rest of the response, decoded as it is read.
+
+    """
+
+    def __init__(
+        self,
+        chunks,
+        path,
+        item_factory,
+        meta_factory=None,
+        parse_float=float,
+        check=None,
+        on_close=None,
+    ):
+        self.path = path
+        self.item_factory = item_factory
+        self.meta_factory = meta_factory
+        self.meta = None
+        self.document = {}
+        self._items = iter_json_list(chunks, path, self.document, parse_float)
+        self._check = check
+        self._on_close = on_close
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, "_on_close", None) is not None:
+            self.close()
+
+    def __iter__(self):
+        try:
+            for data in self._read():
+                yield self.item_factory(data)
+        finally:
+            self.close()
+
+    def _read(self):
+        try:
+            for data in self._items:
+                yield data
+        except ValueError as error:
+            raise exceptions.InvalidResponseError(
+                "Unable to parse streamed json data: {}".format(error)
+            )
+
+        if self._check is not None:
+            self._check(self.document)
+
+        if self.path[0] not in self.document:
+            raise exceptions.InvalidResponseError(
+                "got no {} key in json response".format(self.path[0])
+            )
+
+        if self.meta_factory is not None:
+            self.meta = self.meta_factory(self.document)
+
+    def close(self):
+        """Close the response."""
+        on_close, self._on_close = self._on_close, None
+        if on_close is not None:
+            on_close()
@@ -0,0 +1,347 @@
+import logging
+import math
+import threading
+import time
+
+from pyticketswitch import exceptions
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_TIMEOUT = 10
+
+
+class Limit(object):
+    """Describes how fast and how many requests may be made at once.
+
+    Attributes:
+        rate (float): sustained number of requests per second. When
+            :obj:`None` the rate is not limited. Defaults to :obj:`None`.
+        burst (int): number of requests that may be made at once before the
+            rate applies. Defaults to **rate** rounded up, or 1.
+        max_concurrent (int): maximum number of requests in flight at once.
+            When :obj:`None` concurrency is not limited. Defaults to
+            :obj:`None`.
+
+    """
+
+    def __init__(self, rate=None, burst=None, max_concurrent=None):
+        self.rate = rate
+        if burst is None and rate is not None:
+            burst = max(1, int(math.ceil(rate)))
+        self.burst = burst
+        self.max_concurrent = max_concurrent
+
+    def __repr__(self):
+        return "<Limit rate={} burst={} max_concurrent={}>".format(
+            self.rate, self.burst, self.max_concurrent
+        )
+
+
+class TokenBucket(object):
+    """Token bucket rate limiter.
+
+    The bucket holds up to **burst** tokens and is refilled at **rate**
+    tokens per second. Each request takes a token, waiting for one to be
+    added when the bucket is empty. Waiting requests reserve their token up
+    front so they are served in the order they arrived.
+
+    Attributes:
+        rate (float): tokens added per second.
+        burst (int): the maximum number of tokens in the bucket.
+
+    """
+
+    def __init__(self, rate, burst, clock=time.time, sleep=time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline):
+        """Take a token, waiting for one when necessary.
+
+        Args:
+            deadline (float): the time, as returned by the clock, by which the
+                token must be available.
+
+        Returns:
+            bool: :obj:`True` when a token was taken, :obj:`False` when one
+            wouldn't be available before the deadline.
+
+        """
+        wait = self.reserve(deadline)
+        if wait is None:
+            return False
+        if wait:
+            self.sleep(wait)
+        return True
+
+    def reserve(self, deadline):
+        """Take a token without waiting for it.
+
+        Args:
+            deadline (float): the time, as returned by the clock, by which the
+                token must be available.
+
+        Returns:
+            float: the number of seconds until the token is available, or
+            :obj:`None` when it wouldn't be available before the deadline, in
+            which case no token is taken.
+
+        """
+        with self._lock:
+            now = self.clock()
+            elapsed = max(0, now - self._updated)
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+            wait = 0
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                if now + wait > deadline:
+                    return None
+            self._tokens -= 1
+            return wait
+
+    def refund(self):
+        """Return a token taken with :meth:`reserve` that wasn't used."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+
+class Bulkhead(object):
+    """Caps the number of requests in flight at once.
+
+    Attributes:
+        max_concurrent (int): the maximum number of requests in flight.
+        active (int): the number of requests currently in flight.
+        waiting (int): the number of requests waiting for a slot.
+
+    """
+
+    def __init__(self, max_concurrent, clock=time.time):
+        self.max_concurrent = max_concurrent
+        self.clock = clock
+        self.active = 0
+        self.waiting = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, deadline):
+        """Take a slot, waiting for one to be released when necessary.
+
+        Args:
+            deadline (float): the time, as returned by the clock, by which the
+                slot must be available.
+
+        Returns:
+            bool: :obj:`True` when a slot was taken, :obj:`False` when one
+            didn't become available before the deadline.
+
+        """
+        with self._condition:
+            self.waiting += 1
+            try:
+                while self.active >= self.max_concurrent:
+                    remaining = deadline - self.clock()
+                    if remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                self.active += 1
+                return True
+            finally:
+                self.waiting -= 1
+
+    def release(self):
+        """Release a slot taken with :meth:`acquire`."""
+        with self._condition:
+            self.active -= 1
+            self._condition.notify()
+
+
+class Throttle(object):
+    """Rate limits and concurrency caps for requests to the API.
+
+    Pass an instance to a :class:`Client <pyticketswitch.client.Client>` to
+    keep one kind of traffic from starving another, for example so that a
+    catalogue crawler can't hold up reservations::
+
+        >>> throttle = Throttle(
+        ...     endpoint_limits={
+        ...         'events.v1': Limit(rate=5, max_concurrent=2),
+        ...         'reserve.v1': Limit(max_concurrent=20),
+        ...     },
+        ...     default_sub_user_limit=Limit(rate=10),
+        ... )
+        >>> client = Client('demo', 'demopass', throttle=throttle)
+
+    Limits apply separately to each endpoint and to each sub user, and a
+    request must satisfy both. Requests that can't be made straight away
+    queue until they can, or raise a
+    :class:`QueueTimeoutError <pyticketswitch.exceptions.QueueTimeoutError>`
+    when they would have to wait longer than **queue_timeout**.
+
+    Attributes:
+        endpoint_limits (dict): :class:`Limit` indexed on endpoint. Requests
+            to other endpoints are not limited.
+        sub_user_limits (dict): :class:`Limit` indexed on sub user.
+        default_sub_user_limit (:class:`Limit`): limit applied to each sub
+            user missing from **sub_user_limits**, including requests with no
+            sub user. When :obj:`None` those sub users are not limited.
+        queue_timeout (float): the maximum number of seconds a request may
+            wait before being made. Defaults to 10.
+
+    """
+
+    def __init__(
+        self,
+        endpoint_limits=None,
+        sub_user_limits=None,
+        default_sub_user_limit=None,
+        queue_timeout=DEFAULT_QUEUE_TIMEOUT,
+        clock=time.time,
+        sleep=time.sleep,
+    ):
+        self.endpoint_limits = endpoint_limits or {}
+        self.sub_user_limits = sub_user_limits or {}
+        self.default_sub_user_limit = default_sub_user_limit
+        self.queue_timeout = queue_timeout
+        self.clock = clock
+        self.sleep = sleep
+
+        self._buckets = {}
+        self._bulkheads = {}
+        self._lock = threading.Lock()
+
+    def get_limits(self, endpoint, sub_user=None):
+        """Get the limits that apply to a request.
+
+        Args:
+            endpoint (str): target API endpoint.
+            sub_user (str): the sub user making the request.
+
+        Returns:
+            list: tuples of a key identifying the limited traffic and its
+            :class:`Limit`.
+
+        """
+        limits = []
+
+        endpoint_limit = self.endpoint_limits.get(endpoint)
+        if endpoint_limit is not None:
+            limits.append((("endpoint", endpoint), endpoint_limit))
+
+        sub_user_limit = self.sub_user_limits.get(sub_user, self.default_sub_user_limit)
+        if sub_user_limit is not None:
+            limits.append((("sub_user", sub_user), sub_user_limit))
+
+        return limits
+
+    def get_bucket(self, key, limit):
+        """Get the token bucket for limited traffic.
+
+        Args:
+            key (tuple): identifies the limited traffic.
+            limit (:class:`Limit`): the limit for the traffic.
+
+        Returns:
+            :class:`TokenBucket`: the bucket, or :obj:`None` when the rate is
+            not limited.
+
+        """
+        if limit.rate is None:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(
+                    limit.rate, limit.burst, clock=self.clock, sleep=self.sleep
+                )
+                self._buckets[key] = bucket
+            return bucket
+
+    def get_bulkhead(self, key, limit):
+        """Get the bulkhead for limited traffic.
+
+        Args:
+            key (tuple): identifies the limited traffic.
+            limit (:class:`Limit`): the limit for the traffic.
+
+        Returns:
+            :class:`Bulkhead`: the bulkhead, or :obj:`None` when concurrency
+            is not limited.
+
+        """
+        if limit.max_concurrent is None:
+            return None
+        with self._lock:
+            bulkhead = self._bulkheads.get(key)
+            if bulkhead is None:
+                bulkhead = Bulkhead(limit.max_concurrent, clock=self.clock)
+                self._bulkheads[key] = bulkhead
+            return bulkhead
+
+    def call(self, endpoint, sub_user, func):
+        """Make a request once the limits allow it.
+
+        Args:
+            endpoint (str): target API endpoint.
+            sub_user (str): the sub user making the request.
+            func (callable): makes the request.
+
+        Returns:
+            the result of **func**.
+
+        Raises:
+            QueueTimeoutError: when the request would have to wait longer
+                than **queue_timeout**.
+
+        """
+        limits = self.get_limits(endpoint, sub_user)
+        if not limits:
+            return func()
+
+        deadline = self.clock() + self.queue_timeout
+        acquired = []
+        try:
+            for key, limit in limits:
+                bulkhead = self.get_bulkhead(key, limit)
+                if bulkhead is None:
+                    continue
+                if not bulkhead.acquire(deadline):
+                    raise self._timeout_error(endpoint, key)
+                acquired.append(bulkhead)
+
+            # take a token from every bucket before waiting for any of them,
+            # giving them back if one of the limits can't be met in time
+            reserved = []
+            wait = 0
+            for key, limit in limits:
+                bucket = self.get_bucket(key, limit)
+                if bucket is None:
+                    continue
+                bucket_wait = bucket.reserve(deadline)
+                if bucket_wait is None:
+                    for taken in reserved:
+                        taken.refund()
+                    raise self._timeout_error(endpoint, key)
+                reserved.append(bucket)
+                wait = max(wait, bucket_wait)
+
+            if wait:
+                self.sleep(wait)
+
+            return func()
+        finally:
+            for bulkhead in acquired:
+                bulkhead.release()
+
+    def _timeout_error(self, endpoint, key):
+        logger.debug("%s request queued too long on %s limit", endpoint, key)
+        return exceptions.QueueTimeoutError(
+            "{} request waited more than {}s for the {} {} limit".format(
+                endpoint, self.queue_timeout, key[0], key[1]
+            )
+        )
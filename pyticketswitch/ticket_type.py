@@ -17,6 +17,8 @@ class TicketType(JSONMixin, object):
 
     """
 
+    price_attributes = ("price_bands",)
+
     def __init__(self, code=None, description=None, price_bands=None):
 
         self.code = code
@@ -24,12 +26,16 @@ class TicketType(JSONMixin, object):
         self.price_bands = price_bands
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, compact_seats=False):
         """Creates a new PriceBand object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a price band.
+            compact_seats (bool): keep the free seats of each price band in a
+                :class:`SeatInventory
+                <pyticketswitch.seat_inventory.SeatInventory>`. Defaults to
+                :obj:`False`.
 
         Returns:
             :class:`PriceBand <pyticketswitch.price_band.PriceBand>`: a new
@@ -40,7 +46,9 @@ class TicketType(JSONMixin, object):
         price_bands = []
         api_price_bands = data.get("price_band", [])
         for single_band in api_price_bands:
-            price_bands.append(PriceBand.from_api_data(single_band))
+            price_bands.append(
+                PriceBand.from_api_data(single_band, compact_seats=compact_seats)
+            )
 
         kwargs = {
             "code": data.get("ticket_type_code", None),
@@ -30,6 +30,8 @@ class Trolley(JSONMixin, object):
             that was not available.
     """
 
+    price_attributes = ("bundles", "discarded_orders")
+
     def __init__(
         self,
         token=None,
@@ -53,12 +55,18 @@ class Trolley(JSONMixin, object):
         self.input_contained_unavailable_order = input_contained_unavailable_order
 
     @classmethod
-    def from_api_data(cls, data):
+    def from_api_data(cls, data, lazy=False, keep_raw=True):
         """Creates a new Trolley object from API data from ticketswitch.
 
         Args:
             data (dict): the part of the response from a ticketswitch API call
                 that concerns a trolley.
+            lazy (bool): whether the events of the orders are lazy, see
+                :meth:`Event.from_api_data
+                <pyticketswitch.event.Event.from_api_data>`. Defaults to
+                :obj:`False`.
+            keep_raw (bool or list): the raw data the events of the orders
+                keep. Defaults to :obj:`True`.
 
         Returns:
             :class:`Trolley <pyticketswitch.trolley.Trolley>`: a new
@@ -76,12 +84,16 @@ class Trolley(JSONMixin, object):
 
         raw_bundles = raw_contents.get("bundle", [])
 
-        bundles = [Bundle.from_api_data(bundle) for bundle in raw_bundles]
+        bundles = [
+            Bundle.from_api_data(bundle, lazy=lazy, keep_raw=keep_raw)
+            for bundle in raw_bundles
+        ]
 
         raw_discarded_orders = data.get("discarded_orders", [])
 
         discarded_orders = [
-            Order.from_api_data(order) for order in raw_discarded_orders
+            Order.from_api_data(order, lazy=lazy, keep_raw=keep_raw)
+            for order in raw_discarded_orders
         ]
 
         kwargs = {
@@ -1,11 +1,29 @@
+import collections
 import functools
+import re
+import threading
 import warnings
 
 from datetime import date, datetime
 from dateutil import parser
+from dateutil.tz import tzoffset, tzutc
 from decimal import Decimal
 from pyticketswitch.exceptions import InvalidParametersError
 
+#: the number of parsed datetime strings remembered by
+#: :func:`isostr_to_datetime`.
+DATETIME_CACHE_SIZE = 4096
+
+# the format of datetimes returned by the API, for example
+# 2016-09-16T19:30:00+01:00
+_ISO_DATETIME = re.compile(
+    r"(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(?:(Z)|([+-])(\d\d):?(\d\d))$"
+)
+
+_datetime_cache = collections.OrderedDict()
+_datetime_cache_lock = threading.Lock()
+_timezones = {}
+
 
 def date_range_str(start_date, end_date):
     """Convert a set of dates to string readable by the API
@@ -51,6 +69,11 @@ def date_range_str(start_date, end_date):
 def isostr_to_datetime(date_str):
     """Convert an iso datetime string to a :py:class:`datetime.datetime` object.
 
+    Strings in the format returned by the API are parsed directly, anything
+    else is left to :py:func:`dateutil.parser.parse`. The most recently
+    parsed strings are remembered, so repeated dates are only parsed once,
+    and datetimes with the same UTC offset share a tzinfo.
+
     Args:
         date_str (str): the string to convert.
 
@@ -65,10 +88,49 @@ def isostr_to_datetime(date_str):
     if not date_str:
         raise ValueError("{} is not a valid datetime string".format(date_str))
 
-    dt = parser.parse(date_str)
+    with _datetime_cache_lock:
+        dt = _datetime_cache.pop(date_str, None)
+        if dt is not None:
+            # reinsert to mark as most recently used
+            _datetime_cache[date_str] = dt
+            return dt
+
+    dt = _parse_isostr(date_str)
+
+    with _datetime_cache_lock:
+        _datetime_cache[date_str] = dt
+        while len(_datetime_cache) > DATETIME_CACHE_SIZE:
+            _datetime_cache.popitem(last=False)
+
     return dt
 
 
+def _parse_isostr(date_str):
+    match = _ISO_DATETIME.match(date_str)
+    if match is None:
+        return parser.parse(date_str)
+
+    groups = match.groups()
+    year, month, day, hour, minute, second = [int(part) for part in groups[:6]]
+    zulu, sign, offset_hours, offset_minutes = groups[6:]
+
+    offset = 0
+    if not zulu:
+        offset = int(offset_hours) * 3600 + int(offset_minutes) * 60
+        if sign == "-":
+            offset = -offset
+
+    return datetime(year, month, day, hour, minute, second, tzinfo=_timezone(offset))
+
+
+def _timezone(offset):
+    tz = _timezones.get(offset)
+    if tz is None:
+        tz = tzutc() if offset == 0 else tzoffset(None, offset)
+        _timezones[offset] = tz
+    return tz
+
+
 def yyyymmdd_to_date(date_str):
     """Convert a YYYYMMDDD formated date to python :py:class:`datetime.date` object.
 
@@ -84,6 +146,12 @@ def yyyymmdd_to_date(date_str):
     if not date_str:
         raise ValueError("{} is not a valid datetime string".format(date_str))
 
+    # the API always sends eight digits, which is much quicker to split up by
+    # hand than with strptime. Anything else is left to strptime.
+    if len(date_str) == 8 and date_str.isdigit():
+        year, month, day = date_str[:4], date_str[4:6], date_str[6:]
+        return datetime(int(year), int(month), int(day)).date()
+
     date = datetime.strptime(date_str, "%Y%m%d")
     if date:
         return date.date()
@@ -194,6 +262,9 @@ def add_prices(*prices):
         raise TypeError(
             "add_prices expected at least 2 arguments, got {}".format(len(prices))
         )
+    # prices in minor units are whole numbers and can be added as they are
+    if all(isinstance(price, int) for price in prices):
+        return sum(prices)
     converted = [Decimal(str(price)) if price is not None else None for price in prices]
     combined = sum(converted)
     if any(isinstance(price, Decimal) for price in prices):
@@ -205,6 +276,25 @@ def add_prices(*prices):
     return int(combined)
 
 
+def chunked(items, size):
+    """Split a list into consecutive chunks
+
+    Args:
+        items (list): the list to split.
+        size (int): the maximum length of each chunk.
+
+    Returns:
+        list: list of lists of at most **size** items each, in the original
+        order.
+
+    """
+    chunks = []
+    for start in range(0, len(items), size):
+        end = start + size
+        chunks.append(items[start:end])
+    return chunks
+
+
 def filter_none_from_parameters(params):
     """Removes parameters whos value is :obj:None
 
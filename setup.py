@@ -17,6 +17,7 @@ setup(
         'requests>=2.0.0',
         'python-dateutil>2.5.3',
         'six>=1.11.0',
+        'futures; python_version < "3"',
     ],
     classifiers=[
         'Development Status :: 5 - Production/Stable',
@@ -0,0 +1,56 @@
+import sys
+
+import pytest
+
+# the asyncio client and its tests use syntax that python 2 can't parse
+collect_ignore = []
+if sys.version_info < (3, 6):
+    collect_ignore.append('test_async_client.py')
+
+
+class FakeClock(object):
+    """Clock that only moves when told to, for code that takes a clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def day_mask():
+    """Build the bitmask of days of a month, as used for calendar masks."""
+
+    def build(*days):
+        return sum(1 << (day - 1) for day in days)
+
+    return build
+
+
+@pytest.fixture
+def paged_response():
+    """Build a page of a paginated list response."""
+
+    def build(result_key, items, page, pages):
+        return {
+            'results': {
+                result_key: items,
+                'paging_status': {
+                    'page_length': len(items),
+                    'page_number': page,
+                    'pages_remaining': pages - page - 1,
+                    'total_unpaged_results': len(items) * pages,
+                },
+            },
+        }
+
+    return build
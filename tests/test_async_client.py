@@ -0,0 +1,237 @@
+import asyncio
+import threading
+
+import pytest
+from mock import Mock
+from pyticketswitch import exceptions
+from pyticketswitch.async_client import AsyncClient
+from pyticketswitch.event import Event
+
+
+@pytest.fixture
+def client():
+    client = AsyncClient(user="bilbo", password="baggins", max_workers=4)
+    yield client
+    client.close()
+
+
+def run(awaitable):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
+
+
+class TestAsyncClient:
+
+    def test_defaults_to_pooled(self, client):
+        assert client.pooled is True
+        assert client.pool_size == 4
+
+    def test_list_events(self, client, monkeypatch):
+        response = {
+            'results': {
+                'event': [{'event_id': 'ABC1'}, {'event_id': 'DEF2'}],
+            },
+        }
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events, meta = run(client.list_events(keywords=['awesome']))
+
+        mock_make_request.assert_called_with('events.v1', {'keywords': 'awesome'})
+        assert [event.id for event in events] == ['ABC1', 'DEF2']
+        assert isinstance(events[0], Event)
+
+    def test_gather_many_calls(self, client, monkeypatch):
+        def fake_make_request(endpoint, params, **kwargs):
+            return {'events_by_id': {
+                params['event_id_list']: {
+                    'event': {'event_id': params['event_id_list']},
+                },
+            }}
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        async def get_events():
+            return await asyncio.gather(
+                *[client.get_event(event_id) for event_id in ('A', 'B', 'C')]
+            )
+
+        results = run(get_events())
+
+        assert [event.id for event, meta in results] == ['A', 'B', 'C']
+
+    def test_exceptions_are_propagated(self, client, monkeypatch):
+        mock_make_request = Mock(
+            side_effect=exceptions.APIError('oh noes', 8)
+        )
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with pytest.raises(exceptions.APIError):
+            run(client.get_availability('6IF-A8B'))
+
+    def test_close_shuts_down_executor(self, client):
+        executor = client.get_executor()
+        assert client.get_executor() is executor
+
+        client.close()
+
+        assert executor._shutdown
+        assert client.get_executor() is not executor
+
+    def test_async_context_manager(self, monkeypatch):
+        client = AsyncClient(user="bilbo", password="baggins")
+        close = Mock()
+        monkeypatch.setattr(client, 'close', close)
+
+        assert run(client.__aenter__()) is client
+        run(client.__aexit__(None, None, None))
+
+        close.assert_called_once_with()
+
+    def test_get_availability_many(self, client, monkeypatch):
+        def fake_make_request(endpoint, params, **kwargs):
+            if params['perf_id'] == 'BAD-1':
+                raise exceptions.APIError('no such performance', 8)
+            return {'availability': {'ticket_type': [
+                {'ticket_type_code': params['perf_id']},
+            ]}}
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        results = run(client.get_availability_many(['6IF-1', '6IF-2', 'BAD-1']))
+
+        assert set(results) == {'6IF-1', '6IF-2', 'BAD-1'}
+        ticket_types, meta = results['6IF-1']
+        assert ticket_types[0].code == '6IF-1'
+        assert isinstance(results['BAD-1'], exceptions.APIError)
+
+    def test_get_availability_many_deadline(self, client, monkeypatch):
+        release = threading.Event()
+
+        def fake_make_request(endpoint, params, **kwargs):
+            if params['perf_id'] == 'SLOW-1':
+                release.wait(5)
+            return {'availability': {}}
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        try:
+            results = run(client.get_availability_many(
+                ['FAST-1', 'SLOW-1'], deadline=0.1))
+        finally:
+            release.set()
+
+        ticket_types, meta = results['FAST-1']
+        assert ticket_types == []
+        assert isinstance(results['SLOW-1'], exceptions.DeadlineExceededError)
+
+    @pytest.mark.parametrize('prefetch', [0, 2])
+    def test_iter_events(self, client, monkeypatch, prefetch, paged_response):
+        def fake_make_request(endpoint, params, **kwargs):
+            page = params.get('page_no', 0)
+            return paged_response('event', [
+                {'event_id': '{}-{}'.format(page, i)} for i in range(2)
+            ], page, 4)
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        async def collect():
+            events = client.iter_events(page_length=2, prefetch=prefetch)
+            return [event.id async for event in events]
+
+        assert run(collect()) == [
+            '0-0', '0-1', '1-0', '1-1', '2-0', '2-1', '3-0', '3-1',
+        ]
+        assert mock_make_request.call_count == 4
+
+    def test_iter_performances(self, client, monkeypatch, paged_response):
+        def fake_make_request(endpoint, params, **kwargs):
+            page = params.get('page_no', 0)
+            return paged_response('performance', [
+                {'perf_id': '6IF-{}'.format(page), 'event_id': '6IF'},
+            ], page, 3)
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        async def collect():
+            performances = client.iter_performances('6IF')
+            return [performance.id async for performance in performances]
+
+        assert run(collect()) == ['6IF-0', '6IF-1', '6IF-2']
+
+    def test_event_loader(self, client, monkeypatch):
+        def fake_make_request(endpoint, params, **kwargs):
+            return {'events_by_id': {
+                event_id: {'event': {'event_id': event_id}}
+                for event_id in params['event_id_list'].split(',')
+                if event_id != 'BAD'
+            }}
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        async def load():
+            loader = client.event_loader(media=True)
+            return await asyncio.gather(
+                loader.load('6IF'), loader.load('6IE'), loader.load('BAD'))
+
+        nutcracker, swan_lake, missing = run(load())
+
+        assert nutcracker.id == '6IF'
+        assert swan_lake.id == '6IE'
+        assert missing is None
+        assert mock_make_request.call_count == 1
+        endpoint, params = mock_make_request.call_args[0]
+        assert endpoint == 'events_by_id.v1'
+        assert params['req_media_triplet_one'] is True
+
+    def test_performance_loader(self, client, monkeypatch):
+        def fake_make_request(endpoint, params, **kwargs):
+            return {'performances_by_id': {
+                performance_id: {'perf_id': performance_id, 'event_id': '6IF'}
+                for performance_id in params['perf_id_list'].split(',')
+            }}
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        async def load():
+            loader = client.performance_loader(max_batch_size=2)
+            return await asyncio.gather(
+                *loader.load_many(['6IF-1', '6IF-2', '6IF-3']))
+
+        performances = run(load())
+
+        assert [p.id for p in performances] == ['6IF-1', '6IF-2', '6IF-3']
+        assert mock_make_request.call_count == 2
+
+    def test_loader_raises_batch_errors(self, client, monkeypatch):
+        monkeypatch.setattr(client, 'make_request', Mock(
+            side_effect=exceptions.APIError('broken', 1)))
+
+        async def load():
+            return await client.event_loader().load('6IF')
+
+        with pytest.raises(exceptions.APIError):
+            run(load())
+
+    def test_get_availability_many_max_workers(self, client, monkeypatch):
+        lock = threading.Lock()
+        in_flight = []
+        seen = []
+
+        def fake_make_request(endpoint, params, **kwargs):
+            with lock:
+                in_flight.append(params['perf_id'])
+                seen.append(len(in_flight))
+            threading.Event().wait(0.02)
+            with lock:
+                in_flight.remove(params['perf_id'])
+            assert 'max_workers' not in params
+            return {'availability': {}}
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        performance_ids = ['6IF-{}'.format(i) for i in range(6)]
+        results = run(client.get_availability_many(
+            performance_ids, max_workers=2))
+
+        assert set(results) == set(performance_ids)
+        assert all(isinstance(result, tuple) for result in results.values())
+        assert max(seen) <= 2
@@ -407,6 +407,13 @@ class TestAvailabilityDetails:
         assert len(details) == 1
 
         assert details[0]._weekday_mask == 63
+        # 63 is sunday to friday, so everything but saturday
+        assert details[0].weekday_list == [
+            True, True, True, True, True, False, True,
+        ]
+        assert details[0].weekday_list == [
+            details[0].on_weekday(day) for day in range(7)
+        ]
 
     def test_from_api_data_adds_valid_quantities(self):
         data = {
@@ -467,6 +474,21 @@ class TestAvailabilityDetails:
         assert avail_details.is_available(2016, 12, 10) is False
         assert avail_details.is_available(2016, 12, 17) is False
 
+    def test_get_day_mask(self, avail_details):
+        start = datetime.date(2016, 12, 1)
+        mask = avail_details.get_day_mask(start)
+
+        # 1065287163 has the 1st, 2nd, 4th... of december, and 805306368 the
+        # 29th and 30th of november, which are before the start.
+        assert mask & 0b1111 == 0b1011
+        assert mask >> 31 & 1 == 1  # 1st january
+        assert mask.bit_length() - 1 == (
+            datetime.date(2017, 3, 27) - start).days
+
+    def test_get_day_mask_without_masks(self):
+        details = AvailabilityDetails()
+        assert details.get_day_mask(datetime.date(2017, 1, 1)) == 0
+
     def test_on_weekday(self):
         """
         mask is 7 bits representing the 7 days of the week. it's read right to
@@ -0,0 +1,182 @@
+import datetime
+from collections import OrderedDict
+
+import pytest
+from pyticketswitch.availability import AvailabilityDetails
+from pyticketswitch.availability_calendar import AvailabilityCalendar
+from pyticketswitch.event import Event
+
+
+@pytest.fixture
+def details(day_mask):
+    return [
+        AvailabilityDetails(
+            ticket_type='STALLS',
+            price_band='A',
+            seatprice=50,
+            surcharge=5,
+            calendar_masks={
+                2016: {12: day_mask(30, 31)},
+                2017: {1: day_mask(1, 2, 3)},
+            },
+        ),
+        AvailabilityDetails(
+            ticket_type='STALLS',
+            price_band='B',
+            seatprice=30,
+            surcharge=2.5,
+            calendar_masks={2017: {1: day_mask(2, 3, 10)}},
+        ),
+        AvailabilityDetails(
+            ticket_type='CIRCLE',
+            price_band='C',
+            seatprice=20,
+            surcharge=0,
+            calendar_masks={2017: {1: day_mask(3, 4), 2: day_mask(1)}},
+        ),
+        AvailabilityDetails(
+            ticket_type='CIRCLE',
+            price_band='D',
+            seatprice=10,
+            surcharge=0,
+            calendar_masks={2017: {1: 0}},
+        ),
+    ]
+
+
+@pytest.fixture
+def calendar(details):
+    return AvailabilityCalendar(details)
+
+
+class TestAvailabilityCalendar:
+
+    def test_start_and_end(self, calendar):
+        assert calendar.start == datetime.date(2016, 12, 1)
+        assert calendar.end == datetime.date(2017, 2, 1)
+        assert len(calendar) == 3
+
+    def test_empty(self):
+        calendar = AvailabilityCalendar([], start=datetime.date(2017, 1, 1))
+        assert not calendar
+        assert calendar.end is None
+        assert calendar.available_days() == []
+        assert calendar.cheapest_prices() == {}
+
+    def test_available_days(self, calendar):
+        assert calendar.available_days() == [
+            datetime.date(2016, 12, 30),
+            datetime.date(2016, 12, 31),
+            datetime.date(2017, 1, 1),
+            datetime.date(2017, 1, 2),
+            datetime.date(2017, 1, 3),
+            datetime.date(2017, 1, 4),
+            datetime.date(2017, 1, 10),
+            datetime.date(2017, 2, 1),
+        ]
+
+    def test_available_days_with_max_price(self, calendar):
+        assert calendar.available_days(max_price=32.5) == [
+            datetime.date(2017, 1, 2),
+            datetime.date(2017, 1, 3),
+            datetime.date(2017, 1, 4),
+            datetime.date(2017, 1, 10),
+            datetime.date(2017, 2, 1),
+        ]
+        assert calendar.available_days(max_price=5) == []
+
+    def test_available_days_in_range(self, calendar):
+        days = calendar.available_days(
+            start=datetime.date(2017, 1, 3),
+            end=datetime.date(2017, 1, 10),
+            max_price=25,
+        )
+        assert days == [datetime.date(2017, 1, 3), datetime.date(2017, 1, 4)]
+
+    def test_available_days_with_range_before_start(self, calendar):
+        days = calendar.available_days(
+            start=datetime.date(2016, 1, 1),
+            end=datetime.date(2016, 12, 30),
+        )
+        assert days == [datetime.date(2016, 12, 30)]
+        assert calendar.available_days(end=datetime.date(2016, 11, 1)) == []
+
+    def test_available_days_by_ticket_type_and_price_band(self, calendar):
+        assert calendar.available_days(ticket_type='CIRCLE') == [
+            datetime.date(2017, 1, 3),
+            datetime.date(2017, 1, 4),
+            datetime.date(2017, 2, 1),
+        ]
+        days = calendar.available_days(ticket_type='STALLS', price_band='B')
+        assert days == [
+            datetime.date(2017, 1, 2),
+            datetime.date(2017, 1, 3),
+            datetime.date(2017, 1, 10),
+        ]
+        days = calendar.available_days(ticket_type='STALLS', max_price=40)
+        assert len(days) == 3
+
+    def test_get_mask(self, calendar):
+        mask = calendar.get_mask(max_price=20)
+        assert mask == (1 << 33) | (1 << 34) | (1 << 62)
+
+    def test_is_available(self, calendar):
+        assert calendar.is_available(datetime.date(2017, 1, 1)) is True
+        assert calendar.is_available(datetime.date(2017, 1, 5)) is False
+        assert calendar.is_available(datetime.date(2016, 1, 1)) is False
+        assert calendar.is_available(datetime.date(2018, 1, 1)) is False
+        assert calendar.is_available(
+            datetime.date(2017, 1, 1), max_price=40) is False
+        assert calendar.is_available(
+            datetime.date(2017, 1, 2), price_band='B') is True
+
+    def test_cheapest_prices(self, calendar):
+        prices = calendar.cheapest_prices(end=datetime.date(2017, 1, 31))
+        assert prices == OrderedDict([
+            (datetime.date(2016, 12, 30), 55),
+            (datetime.date(2016, 12, 31), 55),
+            (datetime.date(2017, 1, 1), 55),
+            (datetime.date(2017, 1, 2), 32.5),
+            (datetime.date(2017, 1, 3), 20),
+            (datetime.date(2017, 1, 4), 20),
+            (datetime.date(2017, 1, 10), 32.5),
+        ])
+        assert list(prices) == sorted(prices)
+
+    def test_cheapest_prices_by_ticket_type(self, calendar):
+        prices = calendar.cheapest_prices(
+            start=datetime.date(2017, 1, 3), ticket_type='STALLS')
+        assert prices == {
+            datetime.date(2017, 1, 3): 32.5,
+            datetime.date(2017, 1, 10): 32.5,
+        }
+
+    def test_ignores_days_past_the_end_of_the_month(self, day_mask):
+        details = AvailabilityDetails(
+            seatprice=10,
+            surcharge=0,
+            calendar_masks={2017: {2: day_mask(28, 29, 30, 31)}},
+        )
+        calendar = AvailabilityCalendar([details])
+        assert calendar.available_days() == [datetime.date(2017, 2, 28)]
+
+    def test_with_start(self, details):
+        calendar = AvailabilityCalendar(
+            details, start=datetime.date(2017, 1, 3))
+        assert calendar.available_days(max_price=40) == [
+            datetime.date(2017, 1, 3),
+            datetime.date(2017, 1, 4),
+            datetime.date(2017, 1, 10),
+            datetime.date(2017, 2, 1),
+        ]
+
+    def test_from_events(self, details):
+        events = [
+            Event('ABC', availability_details=details),
+            Event('DEF', availability_details=[]),
+        ]
+        calendars = AvailabilityCalendar.from_events(events)
+
+        assert list(calendars) == ['ABC', 'DEF']
+        assert len(calendars['ABC'].available_days()) == 8
+        assert not calendars['DEF']
@@ -0,0 +1,84 @@
+import logging
+
+import pytest
+from mock import Mock
+from pyticketswitch.body_logging import BodyLogger
+
+
+@pytest.fixture
+def logger():
+    logger = Mock(spec=logging.Logger)
+    logger.isEnabledFor.return_value = True
+    return logger
+
+
+class TestBodyLogger:
+
+    def test_should_log_disabled_logger(self, logger):
+        logger.isEnabledFor.return_value = False
+        assert not BodyLogger().should_log(logger, 'events.v1')
+
+    def test_should_log_sample_rates(self, logger, monkeypatch):
+        body_logger = BodyLogger(
+            sample_rate=0.5,
+            endpoint_sample_rates={'events.v1': 0, 'purchase.v1': 1},
+        )
+        monkeypatch.setattr('random.random', Mock(return_value=0.4))
+
+        assert not body_logger.should_log(logger, 'events.v1')
+        assert body_logger.should_log(logger, 'purchase.v1')
+        assert body_logger.should_log(logger, 'trolley.v1')
+
+        monkeypatch.setattr('random.random', Mock(return_value=0.6))
+        assert not body_logger.should_log(logger, 'trolley.v1')
+
+    def test_format(self):
+        assert BodyLogger().format(b'{"a": 1}') == '{"a": 1}'
+
+    def test_format_truncates(self):
+        formatted = BodyLogger(max_bytes=5).format(b'0123456789')
+        assert formatted == '01234... (5 of 10 bytes)'
+
+    def test_format_without_limit(self):
+        assert BodyLogger(max_bytes=None).format(b'0' * 10000) == '0' * 10000
+
+    def test_format_redacts(self):
+        content = (
+            b'{"customer": {"first_name": "Fred", "email_address": '
+            b'"fred@example.com", "country_code": "uk", '
+            b'"last_name": "Bloggs \\"the\\" Builder"}}'
+        )
+        assert BodyLogger().format(content) == (
+            '{"customer": {"first_name": "[redacted]", "email_address": '
+            '"[redacted]", "country_code": "uk", '
+            '"last_name": "[redacted]"}}'
+        )
+
+    def test_format_redacts_truncated_values(self):
+        content = b'{"card_number": "4111111111111111"}'
+        formatted = BodyLogger(max_bytes=22).format(content)
+        assert '41111' not in formatted
+        assert formatted.startswith('{"card_number": "[redacted]"')
+
+    def test_format_custom_redacted_fields(self):
+        body_logger = BodyLogger(redacted_fields={'secret'})
+        assert body_logger.format(b'{"secret": "x", "phone": "1"}') == (
+            '{"secret": "[redacted]", "phone": "1"}'
+        )
+
+    def test_log(self, logger):
+        response = Mock(content=b'{"a": 1}')
+        BodyLogger().log(logger, 'events.v1', response)
+        logger.debug.assert_called_once_with(
+            '%s response: %s', 'events.v1', '{"a": 1}',
+        )
+
+    def test_log_does_no_work_when_disabled(self, logger):
+        logger.isEnabledFor.return_value = False
+        body_logger = BodyLogger()
+        body_logger.format = Mock()
+
+        body_logger.log(logger, 'events.v1', Mock())
+
+        body_logger.format.assert_not_called()
+        logger.debug.assert_not_called()
@@ -0,0 +1,122 @@
+from pyticketswitch.cache import ResponseCache, make_cache_key
+
+
+class TestMakeCacheKey:
+
+    def test_params_order_does_not_matter(self):
+        key_one = make_cache_key('events.v1', {'a': 1, 'b': 2})
+        key_two = make_cache_key('events.v1', {'b': 2, 'a': 1})
+        assert key_one == key_two
+
+    def test_ignores_tracking_id(self):
+        key_one = make_cache_key('events.v1', {'a': 1})
+        key_two = make_cache_key(
+            'events.v1', {'a': 1, 'tsw_session_track_id': 'xyz'})
+        assert key_one == key_two
+
+    def test_includes_user_and_language(self):
+        key = make_cache_key('events.v1', {'sub_id': 'belfast'},
+                             user='bilbo', language='en-GB')
+        assert key == (
+            'events.v1', 'bilbo', 'en-GB', (('sub_id', 'belfast'),))
+        assert key != make_cache_key('events.v1', {'sub_id': 'belfast'},
+                                     user='bilbo', language='de')
+
+
+class TestResponseCache:
+
+    def test_get_ttl(self):
+        cache = ResponseCache(ttls={'events.v1': 10, 'trolley.v1': 10})
+        assert cache.get_ttl('events.v1') == 10
+        assert cache.get_ttl('months.v1') is None
+        assert cache.get_ttl('trolley.v1') is None
+
+    def test_get_ttl_with_default_ttl(self):
+        cache = ResponseCache(ttls={}, default_ttl=5)
+        assert cache.get_ttl('availability.v1') == 5
+        assert cache.get_ttl('purchase.v1') is None
+
+    def test_set_and_get(self):
+        cache = ResponseCache()
+        key = make_cache_key('events.v1', {})
+        cache.set(key, {'results': {}}, size=10)
+
+        assert cache.get(key) == {'results': {}}
+        assert cache.hits == 1
+        assert cache.misses == 0
+        assert cache.total_bytes == 10
+
+    def test_get_missing(self):
+        cache = ResponseCache()
+        assert cache.get(make_cache_key('events.v1', {})) is None
+        assert cache.misses == 1
+
+    def test_set_uncached_endpoint(self):
+        cache = ResponseCache()
+        key = make_cache_key('reserve.v1', {})
+        cache.set(key, {'trolley_contents': {}})
+
+        assert len(cache) == 0
+
+    def test_expiry(self, clock):
+        cache = ResponseCache(ttls={'events.v1': 60}, clock=clock)
+        key = make_cache_key('events.v1', {})
+        cache.set(key, {'results': {}}, size=10)
+
+        clock.now += 59
+        assert cache.get(key) == {'results': {}}
+
+        clock.now += 1
+        assert cache.get(key) is None
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+
+    def test_lru_eviction_by_entries(self):
+        cache = ResponseCache(max_entries=2)
+        key_one = make_cache_key('events.v1', {'page_no': 1})
+        key_two = make_cache_key('events.v1', {'page_no': 2})
+        key_three = make_cache_key('events.v1', {'page_no': 3})
+
+        cache.set(key_one, 1)
+        cache.set(key_two, 2)
+        cache.get(key_one)
+        cache.set(key_three, 3)
+
+        assert cache.get(key_one) == 1
+        assert cache.get(key_two) is None
+        assert cache.get(key_three) == 3
+        assert cache.evictions == 1
+
+    def test_lru_eviction_by_bytes(self):
+        cache = ResponseCache(max_bytes=100)
+        key_one = make_cache_key('events.v1', {'page_no': 1})
+        key_two = make_cache_key('events.v1', {'page_no': 2})
+
+        cache.set(key_one, 1, size=60)
+        cache.set(key_two, 2, size=60)
+
+        assert cache.get(key_one) is None
+        assert cache.get(key_two) == 2
+        assert cache.total_bytes == 60
+
+    def test_set_larger_than_max_bytes(self):
+        cache = ResponseCache(max_bytes=100)
+        cache.set(make_cache_key('events.v1', {}), 1, size=101)
+        assert len(cache) == 0
+
+    def test_set_replaces(self):
+        cache = ResponseCache()
+        key = make_cache_key('events.v1', {})
+        cache.set(key, 1, size=10)
+        cache.set(key, 2, size=20)
+
+        assert cache.get(key) == 2
+        assert cache.total_bytes == 20
+
+    def test_clear(self):
+        cache = ResponseCache()
+        cache.set(make_cache_key('events.v1', {}), 1, size=10)
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
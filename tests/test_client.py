@@ -1,7 +1,10 @@
 import decimal
+import gc
 import pytest
 import json
 import requests
+import threading
+import time
 from datetime import datetime
 from mock import Mock
 import pyticketswitch
@@ -14,6 +17,11 @@ from pyticketswitch.customer import Customer
 from pyticketswitch.payment_methods import CardDetails, RedirectionDetails
 from pyticketswitch.status import Status
 from pyticketswitch.callout import Callout
+from pyticketswitch.cache import ResponseCache
+from pyticketswitch.resilience import ResiliencePolicy
+from pyticketswitch.throttle import Limit, Throttle
+from pyticketswitch.instrumentation import RequestStats
+from pyticketswitch.event import Event
 
 
 
@@ -455,6 +463,39 @@ class TestClient:
             'req_src_info': True,
         }
 
+    def test_list_events_lazy(self, client, monkeypatch):
+        response = {
+            'results': {
+                'event': [
+                    {
+                        'event_id': 'ABC123',
+                        'custom_fields': [{'custom_field_name': 'foo'}],
+                    },
+                ],
+            },
+        }
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+        client.lazy_events = True
+
+        events, meta = client.list_events()
+
+        assert not Event.fields.is_built(events[0])
+        assert list(events[0].fields) == ['foo']
+
+    def test_list_events_keep_raw(self, client, monkeypatch):
+        response = {'results': {'event': [{'event_id': 'ABC123'}]}}
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+        client.keep_raw = False
+
+        events, meta = client.list_events()
+        assert events[0].raw is None
+
+        events, meta = client.list_events(keep_raw=['event_id'])
+        assert events[0].raw == {'event_id': 'ABC123'}
+        mock_make_request.assert_called_with('events.v1', {})
+
     def test_list_events(self, client, monkeypatch):
         response = {
             'results': {
@@ -490,6 +531,53 @@ class TestClient:
         assert 'gbp' in meta.currencies
         assert meta.default_currency_code == 'gbp'
 
+
+    def test_list_events_with_minor_units(self, monkeypatch):
+        client = Client(
+            user='bilbo', password='baggins', minor_units=True, lazy_events=True)
+        response = {
+            'results': {
+                'event': [
+                    {
+                        'event_id': 'ABC123',
+                        'cost_range': {
+                            'min_seatprice': 20.5,
+                            'min_surcharge': 2.25,
+                            'range_currency_code': 'gbp',
+                            'best_value_offer': {
+                                'offer_seatprice': 15,
+                                'offer_surcharge': 2.25,
+                            },
+                        },
+                    },
+                    {
+                        'event_id': 'DEF456',
+                        'cost_range': {
+                            'min_seatprice': 3000,
+                            'min_surcharge': 150,
+                            'range_currency_code': 'jpy',
+                        },
+                    },
+                ],
+            },
+            'currency_code': 'gbp',
+            'currency_details': {
+                'gbp': {'currency_code': 'gbp', 'currency_places': 2},
+                'jpy': {'currency_code': 'jpy', 'currency_places': 0},
+            },
+        }
+        monkeypatch.setattr(client, 'make_request', Mock(return_value=response))
+
+        events, meta = client.list_events()
+
+        event_one, event_two = events
+        assert event_one.cost_range.min_seatprice == 2050
+        assert event_one.cost_range.min_surcharge == 225
+        assert event_one.cost_range.best_value_offer.seatprice == 1500
+        assert event_one.cost_range.best_value_offer.surcharge == 225
+        assert event_two.cost_range.min_seatprice == 3000
+        assert event_two.cost_range.min_surcharge == 150
+
     def test_list_events_with_keywords(self, client, mock_make_request):
         client.list_events(keywords=['awesome', 'stuff'])
 
@@ -643,6 +731,25 @@ class TestClient:
         assert 'gbp' in meta.currencies
         assert meta.default_currency_code == 'gbp'
 
+    def test_get_events_keep_raw(self, client, monkeypatch):
+        response = {
+            'events_by_id': {
+                'ABC123': {
+                    'event': {'event_id': 'ABC123'},
+                },
+            },
+        }
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events, meta = client.get_events(['ABC123'], keep_raw=False)
+
+        mock_make_request.assert_called_with(
+            'events_by_id.v1',
+            {'event_id_list': 'ABC123'},
+        )
+        assert events['ABC123'].raw is None
+
     def test_get_events_event_list(self, client, mock_make_request_for_events):
         client.get_events(['6IF', '25DR', '3ENO'])
 
@@ -736,6 +843,38 @@ class TestClient:
         assert months[2].month == 2
         assert months[2].year == 2017
 
+
+    def test_get_months_with_minor_units(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', minor_units=True)
+        response = {
+            'results': {
+                'month': [{
+                    'month': 'dec',
+                    'year': 2016,
+                    'cost_range': {
+                        'min_seatprice': 20.5,
+                        'max_seatprice': 45,
+                        'range_currency_code': 'gbp',
+                        'no_singles_cost_range': {
+                            'min_seatprice': 25.5,
+                            'range_currency_code': 'gbp',
+                        },
+                    },
+                }],
+            },
+            'currency_code': 'gbp',
+            'currency_details': {
+                'gbp': {'currency_code': 'gbp', 'currency_places': 2},
+            },
+        }
+        monkeypatch.setattr(client, 'make_request', Mock(return_value=response))
+
+        months = client.get_months('ABC123')
+
+        assert months[0].cost_range.min_seatprice == 2050
+        assert months[0].cost_range.max_seatprice == 4500
+        assert months[0].no_singles_cost_range.min_seatprice == 2550
+
     def test_get_months_no_results(self, client, monkeypatch, fake_func):
         response = {}
         monkeypatch.setattr(client, 'make_request', fake_func(response))
@@ -968,6 +1107,50 @@ class TestClient:
         assert 'gbp' in meta.currencies
         assert meta.default_currency_code == 'gbp'
 
+
+    def test_get_performances_with_minor_units(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', minor_units=True)
+        response = {
+            'performances_by_id': {
+                'ABC123-1': {
+                    'perf_id': 'ABC123-1',
+                    'event_id': 'ABC123',
+                    'cost_range': {
+                        'min_seatprice': 20.5,
+                        'min_surcharge': 2.25,
+                        'range_currency_code': 'gbp',
+                    },
+                    'avail_details': {
+                        'ticket_type': [{
+                            'ticket_type_code': 'STALLS',
+                            'price_band': [{
+                                'price_band_code': 'A/pool',
+                                'avail_detail': [{
+                                    'seatprice': 30.5,
+                                    'surcharge': 3.25,
+                                    'avail_currency_code': 'gbp',
+                                }],
+                            }],
+                        }],
+                    },
+                },
+            },
+            'currency_code': 'gbp',
+            'currency_details': {
+                'gbp': {'currency_code': 'gbp', 'currency_places': 2},
+            },
+        }
+        monkeypatch.setattr(client, 'make_request', Mock(return_value=response))
+
+        performances, meta = client.get_performances(['ABC123-1'])
+
+        performance = performances['ABC123-1']
+        assert performance.cost_range.min_seatprice == 2050
+        assert performance.cost_range.min_surcharge == 225
+        details = performance.availability_details[0]
+        assert details.seatprice == 3050
+        assert details.surcharge == 325
+
     def test_get_performances_no_performances(self, client, monkeypatch, fake_func):
         response = {}
         monkeypatch.setattr(client, 'make_request', fake_func(response))
@@ -1066,7 +1249,7 @@ class TestClient:
 
         mock_make_request.assert_called_with('availability.v1', {
             'perf_id': 'ABC123-1',
-        })
+        }, timeout=None)
 
         assert meta.contiguous_seat_selection_only is True
         assert meta.must_select_whole_seat_block is True
@@ -1106,7 +1289,7 @@ class TestClient:
         mock_make_request_for_availability.assert_called_with('availability.v1', {
             'perf_id': '6IF-1',
             'no_of_seats': 2,
-        })
+        }, timeout=None)
 
     def test_get_availability_with_discounts(self, client, mock_make_request_for_availability):
         client.get_availability('6IF-1', discounts=True)
@@ -1114,7 +1297,7 @@ class TestClient:
         mock_make_request_for_availability.assert_called_with('availability.v1', {
             'perf_id': '6IF-1',
             'add_discounts': True
-        })
+        }, timeout=None)
 
     def test_get_availability_with_example_seats(self, client, mock_make_request_for_availability):
         client.get_availability('6IF-1', example_seats=True)
@@ -1122,7 +1305,7 @@ class TestClient:
         mock_make_request_for_availability.assert_called_with('availability.v1', {
             'perf_id': '6IF-1',
             'add_example_seats': True
-        })
+        }, timeout=None)
 
     def test_get_availability_with_seat_blocks(self, client, mock_make_request_for_availability):
         client.get_availability('6IF-1', seat_blocks=True)
@@ -1130,7 +1313,71 @@ class TestClient:
         mock_make_request_for_availability.assert_called_with('availability.v1', {
             'perf_id': '6IF-1',
             'add_seat_blocks': True
-        })
+        }, timeout=None)
+
+    def test_get_availability_with_compact_seats(self, client, monkeypatch):
+        response = {
+            'availability': {
+                'ticket_type': [{
+                    'ticket_type_code': 'CIRCLE',
+                    'price_band': [{
+                        'price_band_code': 'A',
+                        'free_seat_blocks': {
+                            'blocks_by_row': {'A': [['A1', 'A2']]},
+                            'separators_by_row': {'A': ''},
+                        },
+                    }],
+                }],
+            },
+        }
+        monkeypatch.setattr(client, 'make_request', Mock(return_value=response))
+
+        ticket_types, meta = client.get_availability(
+            '6IF-1', seat_blocks=True, compact_seats=True)
+
+        price_band = ticket_types[0].price_bands[0]
+        assert price_band.seat_blocks is None
+        assert [seat.id for seat in price_band.get_seats()] == ['A1', 'A2']
+
+    def test_get_availability_with_minor_units(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', minor_units=True)
+        response = {
+            'currency_code': 'gbp',
+            'currency_details': {
+                'gbp': {'currency_code': 'gbp', 'currency_places': 2},
+            },
+            'availability': {
+                'ticket_type': [{
+                    'ticket_type_code': 'CIRCLE',
+                    'price_band': [{
+                        'price_band_code': 'A',
+                        'sale_seatprice': 25.5,
+                        'sale_surcharge': 2.25,
+                        'sale_combined_tax_component': 1.25,
+                        'absolute_saving': 4.5,
+                        'predicted_user_commission': {
+                            'amount_including_vat': 1.2,
+                            'amount_excluding_vat': 1.0,
+                            'commission_currency_code': 'gbp',
+                        },
+                    }],
+                }],
+            },
+        }
+        monkeypatch.setattr(client, 'make_request', Mock(return_value=response))
+
+        ticket_types, meta = client.get_availability('6IF-1')
+
+        price_band = ticket_types[0].price_bands[0]
+        assert price_band.seatprice == 2550
+        assert price_band.combined_price() == 2775
+        assert price_band.default_discount.surcharge == 225
+        assert price_band.tax_component == 125
+        assert price_band.default_discount.absolute_saving == 450
+        assert price_band.user_commission.including_vat == 120
+        assert price_band.user_commission.excluding_vat == 100
+        assert meta.get_currency().price_as_string(
+            price_band.combined_price(), minor_units=True) == '27.75'
 
     def test_get_availability_with_user_commission(self, client, mock_make_request_for_availability):
         client.get_availability('6IF-1', user_commission=True)
@@ -1138,7 +1385,7 @@ class TestClient:
         mock_make_request_for_availability.assert_called_with('availability.v1', {
             'perf_id': '6IF-1',
             'req_predicted_commission': True,
-        })
+        }, timeout=None)
 
     def test_get_availability_no_availability(self, client, monkeypatch):
         response = {
@@ -1184,6 +1431,30 @@ class TestClient:
 
         assert meta.get_currency().code == 'gbp'
 
+    def test_get_send_methods_with_minor_units(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', minor_units=True)
+        response = {
+            'currency_code': 'gbp',
+            'currency_details': {
+                'gbp': {'currency_code': 'gbp', 'currency_places': 2},
+            },
+            'send_methods': {
+                'send_method': [{
+                    'send_code': 'POST',
+                    'send_cost': 3.5,
+                    'send_cost_tax_component': 0.5,
+                    'trans_fee_component': 0.25,
+                }],
+            },
+        }
+        monkeypatch.setattr(client, 'make_request', Mock(return_value=response))
+
+        send_methods, meta = client.get_send_methods('ABC123-1')
+
+        assert send_methods[0].cost == 350
+        assert send_methods[0].send_cost_tax_component == 50
+        assert send_methods[0].trans_fee_component == 25
+
     def test_get_send_methods_bad_data(self, client, monkeypatch):
         mock_make_request = Mock(return_value={})
         monkeypatch.setattr(client, 'make_request', mock_make_request)
@@ -1328,6 +1599,72 @@ class TestClient:
         assert 'gbp' in meta.currencies
         assert meta.default_currency_code == 'gbp'
 
+
+    def test_get_trolley_lazy_and_keep_raw(self, client, monkeypatch):
+        response = {
+            'trolley_contents': {
+                'bundle': [{
+                    'bundle_source_code': 'ext_test0',
+                    'order': [{
+                        'item_number': 1,
+                        'event': {
+                            'event_id': '6IF',
+                            'custom_fields': [{'custom_field_name': 'foo'}],
+                        },
+                    }],
+                }],
+            },
+            'discarded_orders': [{
+                'item_number': 2,
+                'event': {'event_id': '6IE'},
+            }],
+        }
+        monkeypatch.setattr(client, 'make_request', Mock(return_value=response))
+        client.lazy_events = True
+
+        trolley, meta = client.get_trolley()
+
+        event = trolley.bundles[0].orders[0].event
+        assert not Event.fields.is_built(event)
+        assert list(event.fields) == ['foo']
+
+        client.keep_raw = ['event_id']
+
+        trolley, meta = client.get_trolley()
+
+        assert trolley.bundles[0].orders[0].event.raw == {'event_id': '6IF'}
+        assert trolley.discarded_orders[0].event.raw == {'event_id': '6IE'}
+
+    def test_get_trolley_with_minor_units(self, monkeypatch):
+        client = Client(user='bilbo', password='baggins', minor_units=True)
+        response = {
+            'trolley_contents': {
+                'bundle': [{
+                    'bundle_source_code': 'ext_test0',
+                    'bundle_total_cost': 5700,
+                    'currency_code': 'jpy',
+                    'order': [{
+                        'item_number': 1,
+                        'total_sale_seatprice': 5200,
+                        'total_sale_surcharge': 500,
+                    }],
+                }],
+            },
+            'trolley_token': 'DEF456',
+            'currency_code': 'gbp',
+            'currency_details': {
+                'gbp': {'currency_code': 'gbp', 'currency_places': 2},
+                'jpy': {'currency_code': 'jpy', 'currency_places': 0},
+            },
+        }
+        monkeypatch.setattr(client, 'make_request', Mock(return_value=response))
+
+        trolley, meta = client.get_trolley()
+
+        bundle = trolley.bundles[0]
+        assert bundle.total == 5700
+        assert bundle.orders[0].total_seatprice == 5200
+
     def test_get_trolley_with_unavailable_order(self, client, monkeypatch):
         """
         This test is to check that an unavailable order doesn't raise
@@ -1387,6 +1724,28 @@ class TestClient:
         assert event_two.id == 'JKL012'
         assert upsell_meta.total_results == 2
 
+
+    def test_get_upsells_lazy_and_keep_raw(self, client, monkeypatch):
+        response = {'results': {'event': [
+            {'event_id': 'GHI789', 'custom_fields': [{'custom_field_name': 'foo'}]},
+        ]}}
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+        client.lazy_events = True
+
+        upsell_events, upsell_meta = client.get_upsells(token='foobar')
+
+        assert not Event.fields.is_built(upsell_events[0])
+        assert list(upsell_events[0].fields) == ['foo']
+
+        upsell_events, upsell_meta = client.get_upsells(
+            token='foobar', keep_raw=['event_id'])
+
+        assert upsell_events[0].raw == {'event_id': 'GHI789'}
+        mock_make_request.assert_called_with('upsells.v1', {
+            'trolley_token': 'foobar',
+        })
+
     def test_get_addons(self, client, monkeypatch):
         # fakes
         response = {
@@ -1419,6 +1778,29 @@ class TestClient:
 
         assert addon_meta.total_results == 10
 
+
+    def test_get_addons_lazy_and_keep_raw(self, client, monkeypatch):
+        response = {'results': {'event': [
+            {'event_id': 'ABC123', 'custom_fields': [{'custom_field_name': 'foo'}]},
+        ]}}
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+        client.lazy_events = True
+        client.keep_raw = False
+
+        addon_events, addon_meta = client.get_addons(token='foobar')
+
+        assert addon_events[0].raw is None
+        assert list(addon_events[0].fields) == ['foo']
+
+        addon_events, addon_meta = client.get_addons(token='foobar', keep_raw=True)
+
+        assert not Event.fields.is_built(addon_events[0])
+        assert addon_events[0].raw['event_id'] == 'ABC123'
+        mock_make_request.assert_called_with('add_ons.v1', {
+            'trolley_token': 'foobar',
+        })
+
     def test_make_reservation(self, client, monkeypatch):
         response = {
             'reserved_trolley': {
@@ -2222,3 +2604,859 @@ class TestClient:
         assert cancellation_result.is_fully_cancelled()
         assert cancellation_result.cancelled_item_numbers == [1]
         assert 'gbp' in meta.currencies
+
+
+class TestClientPooling:
+
+    def test_get_session_not_pooled_returns_new_sessions(self, client):
+        assert client.get_session() is not client.get_session()
+
+    def test_get_session_pooled_reuses_session(self):
+        client = Client('bilbo', 'baggins', pooled=True, pool_size=3)
+        session = client.get_session()
+        client.cleanup_session(session)
+
+        assert client.get_session() is session
+        adapter = session.get_adapter('https://api.ticketswitch.com')
+        assert adapter._pool_maxsize == 3
+
+    def test_cleanup_session_pooled_does_not_close(self, monkeypatch):
+        client = Client('bilbo', 'baggins', pooled=True)
+        session = client.get_session()
+        close = Mock()
+        monkeypatch.setattr(session, 'close', close)
+
+        client.cleanup_session(session)
+
+        close.assert_not_called()
+        assert client._session_in_flight == 0
+
+    def test_get_session_pooled_recycles_idle_session(self, monkeypatch):
+        client = Client('bilbo', 'baggins', pooled=True, pool_idle_timeout=30)
+        session = client.get_session()
+        client.cleanup_session(session)
+        client._session_last_used -= 60
+
+        assert client.get_session() is not session
+
+    def test_get_session_pooled_keeps_idle_session_in_use(self):
+        client = Client('bilbo', 'baggins', pooled=True, pool_idle_timeout=30)
+        session = client.get_session()
+        client._session_last_used -= 60
+
+        assert client.get_session() is session
+
+    def test_close(self, monkeypatch):
+        client = Client('bilbo', 'baggins', pooled=True)
+        session = client.get_session()
+        client.cleanup_session(session)
+        close = Mock()
+        monkeypatch.setattr(session, 'close', close)
+
+        client.close()
+
+        close.assert_called_once_with()
+        assert client.get_session() is not session
+
+    def test_close_waits_for_requests_in_flight(self, monkeypatch):
+        client = Client('bilbo', 'baggins', pooled=True)
+        session = client.get_session()
+        client.get_session()
+        close = Mock()
+        monkeypatch.setattr(session, 'close', close)
+
+        client.close()
+
+        close.assert_not_called()
+        new_session = client.get_session()
+        assert new_session is not session
+        assert client._session_in_flight == 1
+
+        client.cleanup_session(session)
+        close.assert_not_called()
+        client.cleanup_session(session)
+        close.assert_called_once_with()
+
+        client.cleanup_session(new_session)
+        assert client._session_in_flight == 0
+
+    def test_close_without_session(self, client):
+        client.close()
+
+    def test_context_manager_closes(self, monkeypatch):
+        close = Mock()
+        with Client('bilbo', 'baggins', pooled=True) as client:
+            monkeypatch.setattr(client, 'close', close)
+
+        close.assert_called_once_with()
+
+    def test_make_request_cleans_up_session_on_error(self, client, monkeypatch):
+        session = Mock(spec=requests.Session)
+        session.get = Mock(side_effect=requests.ConnectionError)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        with pytest.raises(requests.ConnectionError):
+            client.make_request('events.v1', {})
+
+        session.close.assert_called_once_with()
+
+
+class TestGetAvailabilityMany:
+
+    def test_get_availability_many(self, client, monkeypatch):
+        def fake_make_request(endpoint, params, **kwargs):
+            if params['perf_id'] == 'BAD-1':
+                raise exceptions.APIError('no such performance', 8)
+            return {'availability': {'ticket_type': [
+                {'ticket_type_code': params['perf_id']},
+            ]}}
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        results = client.get_availability_many(['6IF-1', '6IF-2', 'BAD-1'])
+
+        assert set(results) == {'6IF-1', '6IF-2', 'BAD-1'}
+        ticket_types, meta = results['6IF-1']
+        assert ticket_types[0].code == '6IF-1'
+        ticket_types, meta = results['6IF-2']
+        assert ticket_types[0].code == '6IF-2'
+        assert isinstance(results['BAD-1'], exceptions.APIError)
+
+    def test_get_availability_many_passes_arguments(self, client, mock_make_request_for_availability):
+        client.get_availability_many(['6IF-1'], timeout=5, number_of_seats=2)
+
+        mock_make_request_for_availability.assert_called_with('availability.v1', {
+            'perf_id': '6IF-1',
+            'no_of_seats': 2,
+        }, timeout=5)
+
+    def test_get_availability_many_deduplicates(self, client, mock_make_request_for_availability):
+        results = client.get_availability_many(['6IF-1', '6IF-1'])
+
+        assert list(results) == ['6IF-1']
+        assert mock_make_request_for_availability.call_count == 1
+
+    def test_get_availability_many_with_no_performances(self, client, mock_make_request_for_availability):
+        assert client.get_availability_many([]) == {}
+        mock_make_request_for_availability.assert_not_called()
+
+    def test_get_availability_many_deadline(self, client, monkeypatch):
+        release = threading.Event()
+
+        def fake_make_request(endpoint, params, **kwargs):
+            if params['perf_id'] == 'SLOW-1':
+                release.wait(5)
+            return {'availability': {}}
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        try:
+            results = client.get_availability_many(
+                ['FAST-1', 'SLOW-1'], deadline=0.1)
+        finally:
+            release.set()
+
+        ticket_types, meta = results['FAST-1']
+        assert ticket_types == []
+        assert isinstance(results['SLOW-1'], exceptions.DeadlineExceededError)
+
+
+class TestIterPages:
+
+    def test_iter_events(self, client, monkeypatch, paged_response):
+        def fake_make_request(endpoint, params, **kwargs):
+            page = params.get('page_no', 0)
+            return paged_response('event', [
+                {'event_id': '{}-{}'.format(page, i)} for i in range(2)
+            ], page, 4)
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events = client.iter_events(page_length=2, keywords=['awesome'])
+
+        assert [event.id for event in events] == [
+            '0-0', '0-1', '1-0', '1-1', '2-0', '2-1', '3-0', '3-1',
+        ]
+        assert mock_make_request.call_count == 4
+        mock_make_request.assert_any_call('events.v1', {
+            'keywords': 'awesome',
+            'page_no': 3,
+            'page_len': 2,
+        })
+
+    def test_iter_events_single_page(self, client, monkeypatch, paged_response):
+        mock_make_request = Mock(return_value=paged_response(
+            'event', [{'event_id': 'ABC1'}], 0, 1))
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events = list(client.iter_events())
+
+        assert [event.id for event in events] == ['ABC1']
+        assert mock_make_request.call_count == 1
+
+    def test_iter_performances_without_prefetch(self, client, monkeypatch, paged_response):
+        def fake_make_request(endpoint, params, **kwargs):
+            page = params.get('page_no', 0)
+            return paged_response('performance', [
+                {'perf_id': '6IF-{}'.format(page), 'event_id': '6IF'},
+            ], page, 3)
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        performances = client.iter_performances('6IF', prefetch=0)
+
+        assert [performance.id for performance in performances] == [
+            '6IF-0', '6IF-1', '6IF-2',
+        ]
+        mock_make_request.assert_called_with('performances.v1', {
+            'event_id': '6IF',
+            'page_no': 2,
+        })
+
+    def test_iter_performances_stops_early(self, client, monkeypatch, paged_response):
+        def fake_make_request(endpoint, params, **kwargs):
+            page = params.get('page_no', 0)
+            return paged_response('performance', [
+                {'perf_id': '6IF-{}'.format(page), 'event_id': '6IF'},
+            ], page, 100)
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        performances = client.iter_performances('6IF', prefetch=3)
+        assert next(performances).id == '6IF-0'
+        assert next(performances).id == '6IF-1'
+        performances.close()
+
+        assert mock_make_request.call_count <= 5
+
+
+class TestClientCache:
+
+    def make_session(self, monkeypatch, client):
+        fake_response = FakeResponse(status_code=200, json={'results': {}})
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=fake_response)
+        session.post = Mock(return_value=fake_response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+        return session
+
+    def test_make_request_caches_get(self, monkeypatch):
+        cache = ResponseCache()
+        client = Client('bilbo', 'baggins', cache=cache)
+        session = self.make_session(monkeypatch, client)
+
+        assert client.make_request('events.v1', {'a': 1}) == {'results': {}}
+        assert client.make_request('events.v1', {'a': 1}) == {'results': {}}
+
+        assert session.get.call_count == 1
+        assert cache.hits == 1
+
+    def test_make_request_cache_keyed_on_params(self, monkeypatch):
+        client = Client('bilbo', 'baggins', cache=ResponseCache())
+        session = self.make_session(monkeypatch, client)
+
+        client.make_request('events.v1', {'a': 1})
+        client.make_request('events.v1', {'a': 2})
+
+        assert session.get.call_count == 2
+
+    def test_make_request_does_not_cache_post(self, monkeypatch):
+        cache = ResponseCache(default_ttl=60, never_cache=())
+        client = Client('bilbo', 'baggins', cache=cache)
+        session = self.make_session(monkeypatch, client)
+
+        client.make_request('reserve.v1', {}, method=POST)
+        client.make_request('reserve.v1', {}, method=POST)
+
+        assert session.post.call_count == 2
+        assert len(cache) == 0
+
+    def test_make_request_does_not_cache_uncached_endpoint(self, monkeypatch):
+        cache = ResponseCache()
+        client = Client('bilbo', 'baggins', cache=cache)
+        session = self.make_session(monkeypatch, client)
+
+        client.make_request('status.v1', {})
+        client.make_request('status.v1', {})
+
+        assert session.get.call_count == 2
+        assert cache.misses == 0
+
+    def test_make_request_does_not_cache_errors(self, monkeypatch):
+        cache = ResponseCache()
+        client = Client('bilbo', 'baggins', cache=cache)
+        fake_response = FakeResponse(status_code=500, json={})
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=fake_response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        with pytest.raises(exceptions.InvalidResponseError):
+            client.make_request('events.v1', {})
+
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize('flag', [
+        'backend_is_down', 'backend_is_broken', 'backend_throttle_failed',
+    ])
+    def test_make_request_does_not_cache_backend_errors(self, monkeypatch, flag):
+        cache = ResponseCache()
+        client = Client('bilbo', 'baggins', cache=cache)
+        fake_response = FakeResponse(status_code=200, json={'results': {}, flag: True})
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=fake_response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        client.make_request('events.v1', {})
+        client.make_request('events.v1', {})
+
+        assert session.get.call_count == 2
+        assert len(cache) == 0
+
+    def test_make_request_caches_after_resilience_retry(self, monkeypatch):
+        cache = ResponseCache()
+        client = Client(
+            'bilbo', 'baggins', cache=cache,
+            resilience=ResiliencePolicy(sleep=Mock()),
+        )
+        session = Mock(spec=requests.Session)
+        session.get = Mock(side_effect=[
+            FakeResponse(status_code=200, json={'backend_is_down': True}),
+            FakeResponse(status_code=200, json={'results': {}}),
+        ])
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        assert client.make_request('events.v1', {}) == {'results': {}}
+        assert client.make_request('events.v1', {}) == {'results': {}}
+
+        assert session.get.call_count == 2
+        assert len(cache) == 1
+
+
+class TestClientCoalescing:
+
+    def test_make_request_coalesces_identical_gets(self, monkeypatch):
+        client = Client('bilbo', 'baggins', coalesce=True)
+        started = threading.Event()
+        release = threading.Event()
+
+        def fake_get(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return FakeResponse(status_code=200, json={'results': {}})
+
+        session = Mock(spec=requests.Session)
+        session.get = Mock(side_effect=fake_get)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                client.make_request('events.v1', {'event_id_list': '6IF'})))
+            for _ in range(3)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        while client._single_flight.coalesced < 2:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert session.get.call_count == 1
+        assert results == [{'results': {}}] * 3
+
+    def test_make_request_does_not_coalesce_posts(self, monkeypatch):
+        client = Client('bilbo', 'baggins', coalesce=True)
+        single_flight = Mock()
+        monkeypatch.setattr(client, '_single_flight', single_flight)
+        session = Mock(spec=requests.Session)
+        session.post = Mock(return_value=FakeResponse(json={'a': 'b'}))
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        assert client.make_request('reserve.v1', {}, method=POST) == {'a': 'b'}
+        single_flight.do.assert_not_called()
+
+
+class TestClientLoaders:
+
+    def test_event_loader(self, client, monkeypatch):
+        response = {'events_by_id': {
+            '6IF': {'event': {'event_id': '6IF'}},
+            '6IE': {'event': {'event_id': '6IE'}},
+        }}
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        loader = client.event_loader(media=False, with_addons=True)
+        futures = loader.load_many(['6IF', '6IE', 'NOPE'])
+        events = [future.result() for future in futures]
+
+        mock_make_request.assert_called_once_with('events_by_id.v1', {
+            'event_id_list': '6IF,6IE,NOPE',
+            'add_add_ons': True,
+        })
+        assert events[0].id == '6IF'
+        assert events[1].id == '6IE'
+        assert events[2] is None
+
+    def test_performance_loader(self, client, monkeypatch):
+        response = {'performances_by_id': {
+            '6IF-A7N': {'perf_id': '6IF-A7N', 'event_id': '6IF'},
+        }}
+        mock_make_request = Mock(return_value=response)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with client.performance_loader(max_batch_size=1) as loader:
+            performance = loader.load('6IF-A7N')
+            missing = loader.load('6IF-A7P')
+
+        assert performance.result().id == '6IF-A7N'
+        assert missing.result() is None
+        assert mock_make_request.call_count == 2
+
+
+class TestGetByIdChunking:
+
+    def fake_events_by_id(self, fail=()):
+        def fake_make_request(endpoint, params, **kwargs):
+            event_ids = params['event_id_list'].split(',')
+            if set(event_ids) & set(fail):
+                raise exceptions.APIError('oh noes', 8)
+            return {
+                'events_by_id': {
+                    event_id: {'event': {'event_id': event_id}}
+                    for event_id in event_ids
+                },
+                'currency_code': 'gbp',
+                'currency_details': {
+                    event_ids[0]: {'currency_code': event_ids[0]},
+                },
+            }
+        return Mock(side_effect=fake_make_request)
+
+    def test_get_events_not_chunked(self, client, monkeypatch):
+        mock_make_request = self.fake_events_by_id()
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events, meta = client.get_events(['A', 'B', 'C'])
+
+        assert sorted(events) == ['A', 'B', 'C']
+        assert mock_make_request.call_count == 1
+
+    def test_get_events_chunked(self, client, monkeypatch):
+        mock_make_request = self.fake_events_by_id()
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events, meta = client.get_events(
+            ['A', 'B', 'C', 'D', 'E'], chunk_size=2, media=True)
+
+        assert sorted(events) == ['A', 'B', 'C', 'D', 'E']
+        assert mock_make_request.call_count == 3
+        assert sorted(meta.currencies) == ['A', 'C', 'E']
+        assert meta.default_currency_code == 'gbp'
+        event_id_lists = sorted(
+            call[0][1]['event_id_list']
+            for call in mock_make_request.call_args_list
+        )
+        assert event_id_lists == ['A,B', 'C,D', 'E']
+        assert all(
+            call[0][1]['req_media_square'] is True
+            for call in mock_make_request.call_args_list
+        )
+
+    def test_get_events_chunked_merges_meta(self, client, monkeypatch):
+        def fake_make_request(endpoint, params, **kwargs):
+            event_ids = params['event_id_list'].split(',')
+            response = {
+                'events_by_id': {
+                    event_id: {'event': {'event_id': event_id}}
+                    for event_id in event_ids
+                },
+                'currency_details': {
+                    'gbp': {'currency_code': 'gbp'},
+                },
+            }
+            if event_ids[0] != 'A':
+                response['currency_code'] = 'gbp'
+                response['desired_currency_code'] = 'usd'
+                response['currency_details']['usd'] = {'currency_code': 'usd'}
+            return response
+        monkeypatch.setattr(client, 'make_request', fake_make_request)
+
+        events, meta = client.get_events(['A', 'B', 'C'], chunk_size=2)
+
+        assert meta.__jsondict__() == {
+            'currencies': {
+                'gbp': {'code': 'gbp'},
+                'usd': {'code': 'usd'},
+            },
+            'default_currency_code': 'gbp',
+            'desired_currency_code': 'usd',
+        }
+
+    def test_get_events_with_iterables(self, client, monkeypatch):
+        mock_make_request = self.fake_events_by_id()
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events, meta = client.get_events(iter(['A', 'B', 'C']))
+        assert sorted(events) == ['A', 'B', 'C']
+
+        events, meta = client.get_events({'A', 'B', 'C'}, chunk_size=2)
+        assert sorted(events) == ['A', 'B', 'C']
+        assert mock_make_request.call_count == 3
+
+    def test_get_events_chunked_with_client_chunk_size(self, monkeypatch):
+        client = Client('bilbo', 'baggins', id_chunk_size=1)
+        mock_make_request = self.fake_events_by_id()
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        events, meta = client.get_events(['A', 'B'])
+
+        assert sorted(events) == ['A', 'B']
+        assert mock_make_request.call_count == 2
+
+    def test_get_events_chunk_fails(self, client, monkeypatch):
+        mock_make_request = self.fake_events_by_id(fail=['C'])
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with pytest.raises(exceptions.PartialResponseError) as excinfo:
+            client.get_events(['A', 'B', 'C', 'D', 'E'], chunk_size=2)
+
+        error = excinfo.value
+        assert sorted(error.results) == ['A', 'B', 'E']
+        assert sorted(error.errors) == ['C', 'D']
+        assert isinstance(error.errors['C'], exceptions.APIError)
+        assert sorted(error.meta.currencies) == ['A', 'E']
+
+    def test_get_events_all_chunks_fail(self, client, monkeypatch):
+        mock_make_request = self.fake_events_by_id(fail=['A', 'C'])
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        with pytest.raises(exceptions.APIError):
+            client.get_events(['A', 'B', 'C'], chunk_size=2)
+
+    def test_get_performances_chunked(self, client, monkeypatch):
+        def fake_make_request(endpoint, params, **kwargs):
+            return {'performances_by_id': {
+                perf_id: {'perf_id': perf_id, 'event_id': '6IF'}
+                for perf_id in params['perf_id_list'].split(',')
+            }}
+        mock_make_request = Mock(side_effect=fake_make_request)
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        performances, meta = client.get_performances(
+            ['6IF-1', '6IF-2', '6IF-3'], chunk_size=2)
+
+        assert sorted(performances) == ['6IF-1', '6IF-2', '6IF-3']
+        assert mock_make_request.call_count == 2
+
+    def test_event_loader_with_partial_failure(self, client, monkeypatch):
+        mock_make_request = self.fake_events_by_id(fail=['C'])
+        monkeypatch.setattr(client, 'make_request', mock_make_request)
+
+        loader = client.event_loader(chunk_size=2)
+        futures = loader.load_many(['A', 'B', 'C'])
+
+        assert futures[0].result().id == 'A'
+        assert futures[1].result().id == 'B'
+        with pytest.raises(exceptions.APIError):
+            futures[2].result()
+
+
+class TestClientResilience:
+
+    def test_make_request_retries_connection_errors(self, monkeypatch):
+        policy = ResiliencePolicy(sleep=Mock())
+        client = Client('bilbo', 'baggins', resilience=policy)
+        fake_response = FakeResponse(status_code=200, json={'results': {}})
+        session = Mock(spec=requests.Session)
+        session.get = Mock(side_effect=[requests.ConnectionError, fake_response])
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        assert client.make_request('events.v1', {}) == {'results': {}}
+        assert session.get.call_count == 2
+
+    def test_make_request_raises_backend_errors(self, monkeypatch):
+        policy = ResiliencePolicy(max_attempts=2, sleep=Mock())
+        client = Client('bilbo', 'baggins', resilience=policy)
+        fake_response = FakeResponse(
+            status_code=200,
+            json={'backend_is_down': True, 'source_code': 'ext_test0'},
+        )
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=fake_response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        with pytest.raises(exceptions.BackendDownError):
+            client.make_request('availability.v1', {'perf_id': '6IF-A8B'})
+
+        assert session.get.call_count == 2
+
+
+class TestClientThrottle:
+
+    def test_make_request_applies_sub_user_limits(self, monkeypatch):
+        throttle = Throttle(sub_user_limits={'frodo': Limit(rate=1)})
+        call = Mock(side_effect=lambda endpoint, sub_user, func: func())
+        monkeypatch.setattr(throttle, 'call', call)
+        client = Client('bilbo', 'baggins', sub_user='frodo', throttle=throttle)
+        fake_response = FakeResponse(status_code=200, json={'results': {}})
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=fake_response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        assert client.make_request('events.v1', {}) == {'results': {}}
+
+        assert call.call_args[0][:2] == ('events.v1', 'frodo')
+        assert session.get.call_count == 1
+
+    def test_make_request_queue_timeout(self, monkeypatch):
+        throttle = Throttle(
+            endpoint_limits={'events.v1': Limit(rate=0.01)}, queue_timeout=0,
+        )
+        client = Client('bilbo', 'baggins', throttle=throttle)
+        fake_response = FakeResponse(status_code=200, json={'results': {}})
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=fake_response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        client.make_request('events.v1', {})
+        with pytest.raises(exceptions.QueueTimeoutError):
+            client.make_request('events.v1', {})
+
+        assert session.get.call_count == 1
+
+
+class TestClientObservers:
+
+    def make_session(self, monkeypatch, client, status_code=200, json=None):
+        fake_response = FakeResponse(status_code=status_code, json=json)
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=fake_response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+        return session
+
+    def test_make_request_reports_record(self, monkeypatch):
+        observer = Mock()
+        client = Client('bilbo', 'baggins', observers=[observer])
+        self.make_session(monkeypatch, client, json={'results': {}})
+
+        client.make_request('events.v1', {})
+
+        record = observer.call_args[0][0]
+        assert record.endpoint == 'events.v1'
+        assert record.method == GET
+        assert record.status_code == 200
+        assert record.bytes == len('{"results": {}}')
+        assert record.total_time >= 0
+        assert record.decode_time >= 0
+        assert record.parse_time is None
+        assert record.error is None
+
+    def test_make_request_reports_errors(self, monkeypatch):
+        observer = Mock()
+        client = Client('bilbo', 'baggins', observers=[observer])
+        self.make_session(monkeypatch, client, status_code=500, json={})
+
+        with pytest.raises(exceptions.InvalidResponseError):
+            client.make_request('events.v1', {})
+
+        record = observer.call_args[0][0]
+        assert record.status_code == 500
+        assert isinstance(record.error, exceptions.InvalidResponseError)
+
+    def test_make_request_reports_cache_hits(self, monkeypatch):
+        observer = Mock()
+        client = Client(
+            'bilbo', 'baggins', cache=ResponseCache(), observers=[observer],
+        )
+        self.make_session(monkeypatch, client, json={'results': {}})
+
+        client.make_request('events.v1', {})
+        client.make_request('events.v1', {})
+
+        assert [call[0][0].cached for call in observer.call_args_list] == [
+            False, True,
+        ]
+
+    def test_client_method_reports_parse_time(self, monkeypatch):
+        stats = RequestStats()
+        client = Client('bilbo', 'baggins', observers=[stats])
+        self.make_session(monkeypatch, client, json={
+            'results': {'event': [{'event_id': 'ABC1'}]},
+        })
+
+        events, meta = client.list_events()
+
+        assert stats['events.v1'].requests == 1
+        assert stats['events.v1'].parse_time.count == 1
+
+    def test_test_reports_parse_time(self, monkeypatch):
+        stats = RequestStats()
+        client = Client('bilbo', 'baggins', observers=[stats])
+        self.make_session(monkeypatch, client, json={'user_info': {'user_id': 'bilbo'}})
+
+        client.test()
+
+        assert stats['test.v1'].parse_time.count == 1
+
+
+class TestClientBodyLogging:
+
+    def test_make_request_logs_body(self, monkeypatch):
+        body_logger = Mock()
+        client = Client('bilbo', 'baggins', body_logger=body_logger)
+        fake_response = FakeResponse(status_code=200, json={'results': {}})
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=fake_response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+
+        client.make_request('events.v1', {})
+
+        body_logger.log.assert_called_once_with(
+            pyticketswitch.client.logger, 'events.v1', fake_response,
+        )
+
+
+class FakeStreamResponse(FakeResponse):
+
+    def __init__(self, *args, **kwargs):
+        super(FakeStreamResponse, self).__init__(*args, **kwargs)
+        self.close = Mock()
+
+    def iter_content(self, chunk_size=1):
+        content = self.content.encode('utf-8')
+        for start in range(0, len(content), chunk_size):
+            yield content[start:start + chunk_size]
+
+
+class TestClientStreaming:
+
+    def make_session(self, monkeypatch, client, response):
+        session = Mock(spec=requests.Session)
+        session.get = Mock(return_value=response)
+        monkeypatch.setattr(client, 'get_session', Mock(return_value=session))
+        cleanup = Mock()
+        monkeypatch.setattr(client, 'cleanup_session', cleanup)
+        return session, cleanup
+
+    def test_stream_events(self, client, monkeypatch):
+        response = FakeStreamResponse(json={
+            'results': {
+                'event': [{'event_id': 'ABC1'}, {'event_id': 'DEF2'}],
+                'paging_status': {'total_unpaged_results': 2},
+            },
+        })
+        session, cleanup = self.make_session(monkeypatch, client, response)
+
+        stream = client.stream_events(keywords=['awesome'], page_length=50)
+        events = list(stream)
+
+        assert [event.id for event in events] == ['ABC1', 'DEF2']
+        assert stream.meta.total_results == 2
+        params = session.get.call_args[1]['params']
+        assert params['keywords'] == 'awesome'
+        assert params['page_len'] == 50
+        assert session.get.call_args[1]['stream'] is True
+        response.close.assert_called_once_with()
+        cleanup.assert_called_once_with(session)
+
+    def test_stream_performances(self, client, monkeypatch):
+        response = FakeStreamResponse(json={
+            'results': {'performance': [{'perf_id': '6IF-A1'}]},
+        })
+        session, _ = self.make_session(monkeypatch, client, response)
+
+        stream = client.stream_performances('6IF', page=2)
+
+        assert [perf.id for perf in stream] == ['6IF-A1']
+        params = session.get.call_args[1]['params']
+        assert params['event_id'] == '6IF'
+        assert params['page_no'] == 2
+
+    def test_stream_request_api_error(self, client, monkeypatch):
+        response = FakeStreamResponse(json={
+            'error_code': 8, 'error_desc': 'bad data',
+        })
+        self.make_session(monkeypatch, client, response)
+
+        with pytest.raises(exceptions.APIError):
+            list(client.stream_events())
+
+        response.close.assert_called_once_with()
+
+    def test_stream_request_bad_status(self, client, monkeypatch):
+        response = FakeStreamResponse(status_code=500, json={})
+        session, cleanup = self.make_session(monkeypatch, client, response)
+
+        with pytest.raises(exceptions.InvalidResponseError):
+            client.stream_events()
+
+        response.close.assert_called_once_with()
+        cleanup.assert_called_once_with(session)
+
+    def test_stream_events_close_early(self, client, monkeypatch):
+        response = FakeStreamResponse(json={
+            'results': {'event': [{'event_id': 'ABC1'}, {'event_id': 'DEF2'}]},
+        })
+        self.make_session(monkeypatch, client, response)
+
+        with client.stream_events() as stream:
+            event = next(iter(stream))
+
+        assert event.id == 'ABC1'
+        response.close.assert_called_once_with()
+
+    def test_stream_never_read_releases_session(self, monkeypatch):
+        client = Client('bilbo', 'baggins', pooled=True)
+        session = client.get_session()
+        client.cleanup_session(session)
+        response = FakeStreamResponse(json={'results': {'event': []}})
+        monkeypatch.setattr(session, 'get', Mock(return_value=response))
+
+        stream = client.stream_events()
+        assert client._session_in_flight == 1
+
+        del stream
+        gc.collect()
+
+        response.close.assert_called_once_with()
+        assert client._session_in_flight == 0
+
+    def test_stream_request_is_retried(self, monkeypatch):
+        client = Client(
+            'bilbo', 'baggins',
+            resilience=ResiliencePolicy(sleep=Mock()),
+            observers=[Mock()],
+        )
+        response = FakeStreamResponse(json={
+            'results': {'performance': [{'perf_id': '6IF-A1'}]},
+        })
+        session, _ = self.make_session(monkeypatch, client, response)
+        session.get.side_effect = [requests.ConnectionError, response]
+
+        stream = client.stream_performances('6IF')
+
+        assert [perf.id for perf in stream] == ['6IF-A1']
+        assert session.get.call_count == 2
+        observer = client.observers[0]
+        first, second = [call[0][0] for call in observer.call_args_list]
+        assert isinstance(first.error, requests.ConnectionError)
+        assert second.status_code == 200
+        assert second.bytes == len(response.content)
+        assert second.error is None
+
+    def test_stream_request_is_throttled(self, monkeypatch):
+        throttle = Throttle(
+            endpoint_limits={'events.v1': Limit(rate=0.01)}, queue_timeout=0,
+        )
+        client = Client('bilbo', 'baggins', throttle=throttle)
+        response = FakeStreamResponse(json={'results': {'event': []}})
+        session, _ = self.make_session(monkeypatch, client, response)
+
+        with client.stream_events():
+            pass
+        with pytest.raises(exceptions.QueueTimeoutError):
+            client.stream_events()
+
+        assert session.get.call_count == 1
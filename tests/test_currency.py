@@ -89,6 +89,18 @@ class TestCurrency:
         price = currency.price_as_string(13.1)
         assert price == '13.100BD'
 
+    def test_price_as_string_with_minor_units(self):
+        currency = Currency('bhd', places=3, post_symbol='BD')
+
+        assert currency.price_as_string(13100, minor_units=True) == '13.100BD'
+        assert currency.price_as_string(None, minor_units=True) == '0.000BD'
+
+    def test_minor_units(self):
+        currency = Currency('gbp', places=2)
+
+        assert currency.to_minor_units(13.1) == 1310
+        assert str(currency.from_minor_units(1310)) == '13.10'
+
     def test_price_from_string_with_pre_symbol(self):
 
         currency = Currency(
@@ -333,3 +333,76 @@ class TestEvent:
         assert event.upsell_events
         assert event.venue_is_enforced is False
         assert event.valid_quantities == [2, 4, 6, 8]
+
+    def test_from_api_data_lazy(self, data, monkeypatch):
+        event = Event.from_api_data(data, lazy=True)
+
+        for name in Event.lazy_attributes:
+            assert not getattr(Event, name).is_built(event)
+
+        assert event.id == 'ABC1'
+        assert event.venue == 'Top Notch Theater'
+
+        assert len(event.content) == 1
+        assert len(event.media) == 2
+        assert len(event.reviews) == 1
+        assert len(event.fields) == 2
+        assert event.cost_range.min_seatprice == \
+            Event.from_api_data(data).cost_range.min_seatprice
+        assert len(event.cost_range_details) == 1
+
+        assert Event.media.is_built(event)
+        assert event.media is event.media
+
+        component = event.component_events[0]
+        assert component.id == 'META123'
+        assert not Event.content.is_built(component)
+
+    def test_lazy_matches_eager(self, data):
+        eager = Event.from_api_data(data).as_dict_for_json()
+        lazy = Event.from_api_data(data, lazy=True).as_dict_for_json()
+        assert lazy == eager
+
+    def test_lazy_attribute_can_be_set(self, data):
+        event = Event.from_api_data(data, lazy=True)
+        event.reviews = []
+        assert event.reviews == []
+
+    def test_from_events_by_id_api_data_lazy(self, data):
+        raw_data = {
+            'event': data,
+            'add_ons': [{'event_id': 'FOO', 'structured_info': {}}],
+        }
+
+        event = Event.from_events_by_id_api_data(raw_data, lazy=True)
+
+        assert not Event.media.is_built(event)
+        assert not Event.media.is_built(event.addon_events[0])
+        assert len(event.media) == 2
+
+    def test_from_api_data_without_raw(self, data):
+        event = Event.from_api_data(data, keep_raw=False)
+        assert event.raw is None
+        assert event.component_events[0].raw is None
+        assert len(event.media) == 2
+
+    def test_from_api_data_with_raw_keys(self, data):
+        event = Event.from_api_data(data, keep_raw=['event_id', 'missing'])
+        assert event.raw == {'event_id': data['event_id']}
+
+    def test_from_api_data_lazy_without_raw_is_eager(self, data):
+        event = Event.from_api_data(data, lazy=True, keep_raw=False)
+        assert event.raw is None
+        assert Event.media.is_built(event)
+        assert len(event.media) == 2
+
+    def test_from_events_by_id_api_data_without_raw(self, data):
+        raw_data = {
+            'event': data,
+            'add_ons': [{'event_id': 'FOO', 'structured_info': {}}],
+        }
+
+        event = Event.from_events_by_id_api_data(raw_data, keep_raw=False)
+
+        assert event.raw is None
+        assert event.addon_events[0].raw is None
@@ -0,0 +1,175 @@
+import datetime
+import threading
+
+import pytest
+
+from pyticketswitch.availability import AvailabilityDetails
+from pyticketswitch.cost_range import CostRange
+from pyticketswitch.event import Event
+from pyticketswitch.event_index import EventIndex, get_event_prices
+from pyticketswitch.month import Month
+
+
+@pytest.fixture
+def make_event(day_mask):
+
+    def build(event_id, prices_by_day, city_code='london-uk', **kwargs):
+        details = [
+            AvailabilityDetails(
+                ticket_type='STALLS',
+                price_band=str(price),
+                seatprice=price,
+                surcharge=0,
+                calendar_masks={2017: {1: day_mask(*days)}},
+            )
+            for price, days in prices_by_day.items()
+        ]
+        return Event(
+            event_id,
+            city_code=city_code,
+            availability_details=details,
+            **kwargs
+        )
+
+    return build
+
+
+class TestGetEventPrices:
+
+    def test_from_availability_details(self, make_event):
+        event = make_event('ABC', {20: [14], 30: [14, 15]})
+        assert get_event_prices(event) == {
+            datetime.date(2017, 1, 14): 20,
+            datetime.date(2017, 1, 15): 30,
+        }
+
+    def test_from_months(self, day_mask):
+        event = Event(
+            'ABC',
+            cost_range=CostRange(min_seatprice=25, min_surcharge=2.5),
+        )
+        months = [
+            Month(1, 2017, dates_bitmask=day_mask(14)),
+            Month(
+                2, 2017,
+                dates_bitmask=day_mask(1),
+                cost_range=CostRange(min_seatprice=15, min_surcharge=0),
+            ),
+        ]
+        assert get_event_prices(event, months) == {
+            datetime.date(2017, 1, 14): 27.5,
+            datetime.date(2017, 2, 1): 15,
+        }
+
+    def test_availability_details_take_precedence_over_months(self, make_event, day_mask):
+        event = make_event('ABC', {20: [14]})
+        months = [Month(1, 2017, dates_bitmask=day_mask(14, 15))]
+        assert get_event_prices(event, months) == {
+            datetime.date(2017, 1, 14): 20,
+            datetime.date(2017, 1, 15): None,
+        }
+
+
+class TestEventIndex:
+
+    def test_find(self, make_event):
+        index = EventIndex()
+        index.update([
+            make_event('ABC', {40: [14]}),
+            make_event('DEF', {20: [14], 60: [15]}),
+            make_event('GHI', {10: [15]}),
+        ])
+
+        assert len(index) == 3
+        assert 'ABC' in index
+        assert list(index.find(datetime.date(2017, 1, 14)).items()) == [
+            ('DEF', 20), ('ABC', 40),
+        ]
+        assert index.find(datetime.date(2017, 1, 16)) == {}
+
+    def test_find_with_max_price(self, make_event):
+        index = EventIndex()
+        index.update([
+            make_event('ABC', {40: [14]}),
+            make_event('DEF', {20: [14], 60: [15]}),
+            make_event('GHI', {10: [15]}),
+        ])
+
+        result = index.find(datetime.date(2017, 1, 15), max_price=50)
+
+        assert result == {'GHI': 10}
+
+    def test_find_range(self, make_event):
+        index = EventIndex()
+        index.update([
+            make_event('ABC', {40: [14]}),
+            make_event('DEF', {60: [14], 20: [16]}),
+        ])
+
+        result = index.find(
+            datetime.date(2017, 1, 14), end=datetime.date(2017, 1, 16))
+
+        assert list(result.items()) == [('DEF', 20), ('ABC', 40)]
+
+    def test_find_by_city_and_country(self, make_event):
+        index = EventIndex()
+        index.update([
+            make_event('ABC', {40: [14]}, country_code='uk'),
+            make_event('DEF', {20: [14]}, city_code='new-york-us'),
+        ])
+        day = datetime.date(2017, 1, 14)
+
+        assert list(index.find(day, city_code='london-uk')) == ['ABC']
+        assert list(index.find(day, country_code='uk')) == ['ABC']
+        assert index.find(day, city_code='paris-fr') == {}
+
+    def test_unknown_prices_come_last(self, make_event, day_mask):
+        index = EventIndex()
+        index.add_event(make_event('ABC', {40: [14]}))
+        index.add_event(
+            Event('DEF'), months=[Month(1, 2017, dates_bitmask=day_mask(14))])
+        day = datetime.date(2017, 1, 14)
+
+        assert list(index.find(day).items()) == [('ABC', 40), ('DEF', None)]
+        assert list(index.find(day, max_price=100)) == ['ABC']
+
+    def test_add_event_replaces_previous_entries(self, make_event):
+        index = EventIndex()
+        index.add_event(make_event('ABC', {40: [14, 15]}))
+        index.add_event(make_event('ABC', {30: [15, 16]}))
+
+        assert len(index) == 1
+        assert index.find(datetime.date(2017, 1, 14)) == {}
+        assert index.find(datetime.date(2017, 1, 15)) == {'ABC': 30}
+        assert index.get_dates('ABC') == [
+            datetime.date(2017, 1, 15),
+            datetime.date(2017, 1, 16),
+        ]
+
+    def test_remove_event(self, make_event):
+        index = EventIndex()
+        event = make_event('ABC', {40: [14]})
+        index.add_event(event)
+        assert index.get_event('ABC') is event
+
+        index.remove_event('ABC')
+        index.remove_event('DEF')
+
+        assert len(index) == 0
+        assert index.get_event('ABC') is None
+        assert index.get_dates('ABC') == []
+        assert index._prices_by_date == {}
+
+    def test_add_events_from_several_threads(self, make_event):
+        index = EventIndex()
+        events = [make_event(str(number), {number: [14]}) for number in range(50)]
+        threads = [
+            threading.Thread(target=index.add_event, args=(event,))
+            for event in events
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(index.find(datetime.date(2017, 1, 14))) == 50
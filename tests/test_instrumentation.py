@@ -0,0 +1,174 @@
+import datetime
+
+import pytest
+from mock import Mock
+from pyticketswitch.instrumentation import (
+    EndpointStats, LatencyHistogram, RequestRecord, RequestStats,
+    instrumented, report,
+)
+
+
+def make_record(endpoint='events.v1', total_time=0.1, **kwargs):
+    record = RequestRecord(endpoint, 'get')
+    record.total_time = total_time
+    for key, value in kwargs.items():
+        setattr(record, key, value)
+    return record
+
+
+class FakeClient(object):
+
+    def __init__(self, observers):
+        self.observers = observers
+        self.requests = []
+
+    def request(self, record):
+        report(self.observers, record)
+
+    @instrumented
+    def method(self, *records):
+        for record in records:
+            self.request(record)
+        return 'result'
+
+    @instrumented
+    def broken(self, record):
+        self.request(record)
+        raise ValueError('oh noes')
+
+
+class TestRequestRecord:
+
+    def test_set_response(self):
+        response = Mock(
+            status_code=200,
+            content=b'{"a": 1}',
+            elapsed=datetime.timedelta(milliseconds=30),
+        )
+        record = RequestRecord('events.v1', 'get')
+
+        record.set_response(response, 0.05)
+
+        assert record.status_code == 200
+        assert record.bytes == 8
+        assert record.ttfb == 0.03
+        assert record.total_time == 0.05
+
+
+class TestReport:
+
+    def test_report_outside_client_method(self):
+        observer = Mock()
+        record = make_record()
+
+        report([observer], record)
+
+        observer.assert_called_once_with(record)
+        assert record.parse_time is None
+
+    def test_failing_observer_is_ignored(self):
+        observer = Mock()
+        report([Mock(side_effect=ValueError), observer], make_record())
+        assert observer.call_count == 1
+
+
+class TestInstrumented:
+
+    def test_records_parse_time(self):
+        observer = Mock()
+        client = FakeClient([observer])
+        first = make_record(total_time=0)
+        second = make_record(total_time=0)
+
+        assert client.method(first, second) == 'result'
+
+        assert observer.call_count == 2
+        assert first.parse_time is None
+        assert second.parse_time >= 0
+
+    def test_reports_on_error(self):
+        observer = Mock()
+        client = FakeClient([observer])
+        record = make_record()
+
+        with pytest.raises(ValueError):
+            client.broken(record)
+
+        observer.assert_called_once_with(record)
+
+    def test_no_observers(self):
+        client = FakeClient([])
+        assert client.method(make_record()) == 'result'
+
+
+class TestLatencyHistogram:
+
+    def test_add(self):
+        histogram = LatencyHistogram(bounds=(0.1, 1))
+        histogram.add(0.05)
+        histogram.add(0.1)
+        histogram.add(0.5)
+        histogram.add(3)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.total == pytest.approx(3.65)
+        assert histogram.max == 3
+        assert histogram.mean == pytest.approx(0.9125)
+
+    def test_quantile(self):
+        histogram = LatencyHistogram(bounds=(0.1, 1))
+        for value in [0.05] * 90 + [0.5] * 9 + [5]:
+            histogram.add(value)
+
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.99) == 1
+        assert histogram.quantile(1) == 5
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        assert histogram.mean is None
+        assert histogram.quantile(0.5) is None
+
+
+class TestEndpointStats:
+
+    def test_add(self):
+        stats = EndpointStats()
+        stats.add(make_record(status_code=200, bytes=100, ttfb=0.01, parse_time=0.2))
+        stats.add(make_record(status_code=500, error=ValueError()))
+        stats.add(make_record(cached=True, total_time=0))
+
+        assert stats.requests == 3
+        assert stats.errors == 1
+        assert stats.cached == 1
+        assert stats.bytes == 100
+        assert stats.status_codes == {200: 1, 500: 1}
+        assert stats.total_time.count == 2
+        assert stats.ttfb.count == 1
+        assert stats.parse_time.count == 1
+
+
+class TestRequestStats:
+
+    def test_aggregates_per_endpoint(self):
+        stats = RequestStats()
+        stats(make_record('events.v1', total_time=0.2))
+        stats(make_record('events.v1', total_time=0.4, error=ValueError()))
+        stats(make_record('reserve.v1', total_time=2))
+
+        assert stats['events.v1'].requests == 2
+        assert stats['reserve.v1'].requests == 1
+
+        summary = stats.summary()
+        assert summary['events.v1']['requests'] == 2
+        assert summary['events.v1']['errors'] == 1
+        assert summary['events.v1']['mean'] == pytest.approx(0.3)
+        assert summary['events.v1']['p99'] == 0.4
+        assert summary['reserve.v1']['max'] == 2
+
+    def test_reset(self):
+        stats = RequestStats()
+        stats(make_record())
+        stats.reset()
+        assert stats.endpoints == {}
@@ -0,0 +1,94 @@
+from mock import Mock
+from pyticketswitch.lazy import LAZY, LazyAttribute, lazy_slots, load_lazy_attributes
+
+
+build = Mock(side_effect=lambda data: data.get('parts'))
+
+
+class Thing(object):
+
+    parts = LazyAttribute('parts', build)
+    lazy_attributes = ('parts',)
+
+    def __init__(self, parts=None, raw=None):
+        self.parts = parts
+        self.raw = raw
+
+
+@lazy_slots(('parts', build))
+class SlottedThing(object):
+
+    __slots__ = ('parts', 'raw')
+
+    def __init__(self, parts=None, raw=None):
+        self.parts = parts
+        self.raw = raw
+
+
+class TestLazyAttribute:
+
+    def setup_method(self, method):
+        build.reset_mock()
+
+    def test_builds_on_first_access(self):
+        thing = Thing(parts=LAZY, raw={'parts': [1, 2]})
+        build.assert_not_called()
+
+        assert thing.parts == [1, 2]
+        assert thing.parts == [1, 2]
+        build.assert_called_once_with({'parts': [1, 2]})
+
+    def test_set_value(self):
+        thing = Thing(parts=[3], raw={'parts': [1, 2]})
+        assert thing.parts == [3]
+        build.assert_not_called()
+
+    def test_without_raw_data(self):
+        thing = Thing(parts=LAZY)
+        assert thing.parts is None
+        build.assert_called_once_with({})
+
+    def test_class_access(self):
+        assert isinstance(Thing.parts, LazyAttribute)
+
+    def test_load_lazy_attributes(self):
+        thing = Thing(parts=LAZY, raw={'parts': [1]})
+        load_lazy_attributes(thing)
+        assert thing.__dict__['parts'] == [1]
+
+    def test_is_built(self):
+        thing = Thing(parts=LAZY, raw={'parts': [1]})
+        assert not Thing.parts.is_built(thing)
+        thing.parts
+        assert Thing.parts.is_built(thing)
+
+
+class TestLazySlots:
+
+    def setup_method(self, method):
+        build.reset_mock()
+
+    def test_builds_on_first_access(self):
+        thing = SlottedThing(parts=LAZY, raw={'parts': [1, 2]})
+        build.assert_not_called()
+        assert not SlottedThing.parts.is_built(thing)
+
+        assert thing.parts == [1, 2]
+        assert thing.parts == [1, 2]
+        build.assert_called_once_with({'parts': [1, 2]})
+        assert SlottedThing.parts.is_built(thing)
+
+    def test_set_value(self):
+        thing = SlottedThing(parts=[3], raw={'parts': [1, 2]})
+        assert thing.parts == [3]
+        build.assert_not_called()
+
+    def test_reset(self):
+        thing = SlottedThing(parts=[3], raw={'parts': [1, 2]})
+        thing.parts = LAZY
+        thing.parts = LAZY
+        assert thing.parts == [1, 2]
+
+    def test_lazy_attributes(self):
+        assert SlottedThing.lazy_attributes == ('parts',)
+        assert not hasattr(SlottedThing(), '__dict__')
@@ -0,0 +1,93 @@
+import threading
+import pytest
+from mock import Mock
+from pyticketswitch import exceptions
+from pyticketswitch.loader import BatchLoader
+
+
+def fake_batch(keys):
+    return {key: key.lower() for key in keys if key != 'MISSING'}
+
+
+class TestBatchLoader:
+
+    def test_load_batches_keys(self):
+        batch_func = Mock(side_effect=fake_batch)
+        loader = BatchLoader(batch_func)
+
+        futures = loader.load_many(['A', 'B', 'C'])
+        batch_func.assert_not_called()
+
+        assert [future.result() for future in futures] == ['a', 'b', 'c']
+        batch_func.assert_called_once_with(['A', 'B', 'C'])
+
+    def test_load_missing_key_resolves_to_none(self):
+        loader = BatchLoader(fake_batch)
+        assert loader.load('MISSING').result() is None
+
+    def test_load_same_key_returns_same_future(self):
+        loader = BatchLoader(fake_batch)
+        assert loader.load('A') is loader.load('A')
+
+    def test_load_chunks_keys(self):
+        batch_func = Mock(side_effect=fake_batch)
+        loader = BatchLoader(batch_func, max_batch_size=2)
+
+        futures = loader.load_many(['A', 'B', 'C'])
+        loader.dispatch()
+
+        assert [future.result() for future in futures] == ['a', 'b', 'c']
+        assert batch_func.call_count == 2
+        batch_func.assert_any_call(['A', 'B'])
+        batch_func.assert_any_call(['C'])
+
+    def test_context_manager_dispatches(self):
+        batch_func = Mock(side_effect=fake_batch)
+        with BatchLoader(batch_func) as loader:
+            future = loader.load('A')
+            batch_func.assert_not_called()
+
+        assert future.done()
+        assert future.result() == 'a'
+
+    def test_errors_set_on_each_future(self):
+        error = exceptions.APIError('oh noes', 8)
+        loader = BatchLoader(Mock(side_effect=error))
+
+        futures = loader.load_many(['A', 'B'])
+
+        assert futures[0].exception() is error
+        with pytest.raises(exceptions.APIError):
+            futures[1].result()
+
+    def test_cancelled_futures_are_skipped(self):
+        batch_func = Mock(side_effect=fake_batch)
+        loader = BatchLoader(batch_func)
+
+        cancelled = loader.load('A')
+        cancelled.cancel()
+        future = loader.load('B')
+
+        assert future.result() == 'b'
+        batch_func.assert_called_once_with(['B'])
+
+    def test_new_batch_after_dispatch(self):
+        batch_func = Mock(side_effect=fake_batch)
+        loader = BatchLoader(batch_func)
+
+        assert loader.load('A').result() == 'a'
+        assert loader.load('B').result() == 'b'
+        assert batch_func.call_count == 2
+
+    def test_wait_dispatches_automatically(self):
+        dispatched = threading.Event()
+
+        def batch_func(keys):
+            dispatched.set()
+            return fake_batch(keys)
+
+        loader = BatchLoader(batch_func, wait=0.01)
+        future = loader.load('A')
+
+        assert dispatched.wait(5)
+        assert future.result(timeout=5) == 'a'
@@ -1,8 +1,17 @@
 import pytest
 import datetime
+import weakref
 from dateutil.tz import tzoffset
 from decimal import Decimal
-from pyticketswitch.mixins import JSONMixin, PaginationMixin, SeatPricingMixin
+from pyticketswitch.mixins import JSONMixin, PaginationMixin, SeatPricingMixin, slot_names
+from pyticketswitch.availability import AvailabilityDetails
+from pyticketswitch.cost_range import CostRange
+from pyticketswitch.discount import Discount
+from pyticketswitch.event import Event
+from pyticketswitch.offer import Offer
+from pyticketswitch.performance import Performance
+from pyticketswitch.price_band import PriceBand
+from pyticketswitch.seat import Seat, SeatBlock
 
 
 class TestJSONMixin:
@@ -109,6 +118,120 @@ class TestJSONMixin:
         result = obj.as_dict_for_json()
         assert result == {'bar': 'hello world!'}
 
+    def test_slots(self):
+
+        class Slotted(JSONMixin, object):
+            __slots__ = ('bar', 'baz', 'unset')
+
+            def __init__(self, bar, baz):
+                self.bar = bar
+                self.baz = baz
+
+        obj = Slotted('hello world!', None)
+        assert obj.__jsondict__() == {'bar': 'hello world!'}
+        assert obj.__jsondict__(hide_none=False) == {
+            'bar': 'hello world!',
+            'baz': None,
+        }
+        assert not hasattr(obj, '__dict__')
+
+    def test_slots_and_dict(self):
+
+        class Slotted(JSONMixin, object):
+            __slots__ = ('bar',)
+
+        class Unslotted(Slotted):
+            pass
+
+        obj = Unslotted()
+        obj.bar = 1
+        obj.baz = 2
+        assert obj.__jsondict__() == {'bar': 1, 'baz': 2}
+
+    def test_subclasses_of_known_types(self):
+
+        class Price(Decimal):
+            pass
+
+        class Items(list):
+            pass
+
+        class Mapping(dict):
+            pass
+
+        obj = self.Foo(Items([
+            Price('1.5'),
+            Mapping({'date': datetime.date(2017, 1, 25)}),
+        ]))
+        assert obj.__jsondict__() == {
+            'bar': [1.5, {'date': '2017-01-25'}],
+        }
+
+    def test_sub_object_with_own_jsondict(self):
+
+        class Custom(JSONMixin, object):
+
+            def __jsondict__(self, hide_none=True, hide_empty=True):
+                return ['custom', hide_none, hide_empty]
+
+        obj = self.Foo([Custom()])
+        assert obj.__jsondict__() == {'bar': [['custom', True, True]]}
+        assert obj.__jsondict__(hide_none=False, hide_empty=False) == {
+            'bar': [['custom', False, False]],
+        }
+
+    def test_tuples_are_left_alone(self):
+        obj = self.Foo((datetime.date(2017, 1, 25),))
+        assert obj.__jsondict__() == {'bar': (datetime.date(2017, 1, 25),)}
+
+    def test_same_class_with_different_attributes(self):
+        first = self.Foo(1)
+        second = self.Foo(2)
+        second.baz = []
+        assert first.__jsondict__() == {'bar': 1}
+        assert second.__jsondict__(hide_empty=False) == {'bar': 2, 'baz': []}
+        assert second.__jsondict__() == {'bar': 2}
+
+
+def test_slot_names():
+
+    class Foo(object):
+        __slots__ = ('foo', '__weakref__')
+
+    class Bar(Foo):
+        __slots__ = 'bar'
+
+    class Baz(Bar):
+        pass
+
+    assert slot_names(Baz) == ('foo', 'bar')
+    assert slot_names(object) == ()
+
+
+def test_models_are_slotted():
+    objects = [
+        Seat(),
+        SeatBlock(0),
+        PriceBand('A', None),
+        Discount('ADULT'),
+        Offer(),
+        CostRange(),
+        AvailabilityDetails(),
+        Performance('6IF-1', '6IF'),
+        Event('6IF'),
+    ]
+    for obj in objects:
+        assert obj.__dict__ == {}, obj
+        assert weakref.ref(obj)() is obj
+
+
+def test_models_accept_extra_attributes():
+    event = Event('6IF')
+    event.score = 5
+
+    assert event.score == 5
+    assert event.__jsondict__()['score'] == 5
+
 
 class TestPaginationMixin:
 
@@ -0,0 +1,202 @@
+import decimal
+
+import pytest
+from pyticketswitch import money
+from pyticketswitch.bundle import Bundle
+from pyticketswitch.commission import Commission
+from pyticketswitch.cost_range import CostRange
+from pyticketswitch.currency import Currency, CurrencyMeta
+from pyticketswitch.discount import Discount
+from pyticketswitch.offer import Offer
+from pyticketswitch.order import Order, TicketOrder
+from pyticketswitch.price_band import PriceBand
+from pyticketswitch.send_method import SendMethod
+from pyticketswitch.ticket_type import TicketType
+from pyticketswitch.trolley import Trolley
+
+
+@pytest.fixture
+def currency_meta():
+    return CurrencyMeta(
+        currencies={
+            'gbp': Currency('gbp', places=2),
+            'jpy': Currency('jpy', places=0),
+            'kwd': Currency('kwd', places=3),
+        },
+        default_currency_code='gbp',
+    )
+
+
+class TestToMinorUnits:
+
+    @pytest.mark.parametrize('price,places,expected', [
+        (35.5, 2, 3550),
+        (0.29, 2, 29),
+        (1.005, 2, 100),
+        (20, 2, 2000),
+        (decimal.Decimal('19.99'), 2, 1999),
+        ('4.125', 3, 4125),
+        (1500, 0, 1500),
+        (12.5, None, 1250),
+    ])
+    def test_to_minor_units(self, price, places, expected):
+        result = money.to_minor_units(price, places)
+        assert result == expected
+        assert isinstance(result, int)
+
+    def test_to_minor_units_with_none(self):
+        assert money.to_minor_units(None, 2) is None
+
+    def test_from_minor_units(self):
+        assert money.from_minor_units(3550, 2) == decimal.Decimal('35.50')
+        assert str(money.from_minor_units(3550, 2)) == '35.50'
+        assert money.from_minor_units(4125, 3) == decimal.Decimal('4.125')
+        assert money.from_minor_units(None) is None
+
+
+class TestConvertPrices:
+
+    def test_price_bands(self):
+        discount = Discount(
+            'ADULT', seatprice=25.5, surcharge=2.25,
+            non_offer_seatprice=30, non_offer_surcharge=2.25,
+        )
+        price_band = PriceBand(
+            'A',
+            discount,
+            seatprice=25.5,
+            surcharge=2.25,
+            discounts=[discount],
+            cost_range=CostRange(
+                min_seatprice=20.0,
+                min_surcharge=1.5,
+                best_value_offer=Offer(seatprice=18.0, surcharge=1.5),
+            ),
+        )
+
+        money.convert_prices([TicketType('STALLS', price_bands=[price_band])])
+
+        assert price_band.seatprice == 2550
+        assert price_band.surcharge == 225
+        assert price_band.non_offer_seatprice is None
+        assert price_band.combined_price() == 2775
+        assert discount.non_offer_combined_price() == 3225
+        assert price_band.cost_range.get_min_combined_price() == 2150
+        assert price_band.cost_range.max_seatprice is None
+        assert price_band.cost_range.best_value_offer.seatprice == 1800
+        # the default discount is also in the discounts, but is only
+        # converted once
+        assert discount.seatprice == 2550
+
+    def test_uses_places_of_default_currency(self, currency_meta):
+        currency_meta.default_currency_code = 'kwd'
+        price_band = PriceBand('A', None, seatprice=1.125, surcharge=0.5)
+
+        money.convert_prices(price_band, currency_meta=currency_meta)
+
+        assert price_band.combined_price() == 1625
+
+    def test_trolley_uses_currency_of_each_bundle(self, currency_meta):
+        ticket_order = TicketOrder(
+            'ADULT',
+            seatprice=25.5,
+            surcharge=2.25,
+            total_seatprice=51.0,
+            total_surcharge=4.5,
+        )
+        order = Order(
+            1,
+            ticket_orders=[ticket_order],
+            total_seatprice=51.0,
+            total_surcharge=4.5,
+            send_method=SendMethod('COBO', cost=1.5),
+        )
+        trolley = Trolley(
+            bundles=[
+                Bundle('ext_test0', orders=[order], total=57.0,
+                       currency_code='gbp'),
+                Bundle('ext_test1', total=1500, currency_code='jpy'),
+            ],
+            discarded_orders=[Order(2, total_seatprice=10)],
+        )
+
+        money.convert_prices(trolley, currency_meta=currency_meta)
+
+        assert ticket_order.combined_price() == 2775
+        assert ticket_order.total_combined_price() == 5550
+        assert order.total_including_send_cost() == 5700
+        assert trolley.bundles[0].total == 5700
+        assert trolley.bundles[1].total == 1500
+        assert trolley.discarded_orders[0].total_seatprice == 1000
+
+    def test_taxes_savings_and_commissions(self, currency_meta):
+        commission = Commission(1.2, 1.0, 'gbp')
+        discount = Discount(
+            'ADULT', seatprice=25.5, surcharge=2.25, absolute_saving=4.5,
+            tax_component=1.25, gross_commission=commission,
+            user_commission=commission, percentage_saving=15,
+        )
+        price_band = PriceBand(
+            'A', discount, seatprice=25.5, surcharge=2.25,
+            absolute_saving=4.5, tax_component=1.25,
+            user_commission=Commission(120, 100, 'jpy'),
+            cost_range=CostRange(
+                min_combined_combined_tax_component=1.0,
+                max_combined_surcharge_tax_sub=0.5,
+                best_value_offer=Offer(absolute_saving=4.5),
+            ),
+        )
+        ticket_order = TicketOrder(
+            'ADULT', raw_combined_tax_component=1.25,
+            raw_total_combined_tax_component=2.5,
+        )
+        bundle = Bundle(
+            'ext_test0',
+            orders=[Order(
+                1,
+                ticket_orders=[ticket_order],
+                total_sale_combined_tax_component=2.5,
+                user_commission=commission,
+                send_method=SendMethod(
+                    'POST', cost=3.5, send_cost_tax_component=0.5,
+                    trans_fee_component=0.25,
+                ),
+            )],
+            send_cost_tax_component=0.5,
+            total_combined_tax_component=3.0,
+        )
+
+        money.convert_prices(
+            [price_band, bundle], currency_meta=currency_meta)
+
+        assert price_band.tax_component == 125
+        assert price_band.absolute_saving == 450
+        assert price_band.user_commission.including_vat == 120
+        assert discount.tax_component == 125
+        assert discount.absolute_saving == 450
+        assert discount.percentage_saving == 15
+        # the commission is shared, but only converted once
+        assert commission.including_vat == 120
+        assert commission.excluding_vat == 100
+        cost_range = price_band.cost_range
+        assert cost_range.min_combined_combined_tax_component == 100
+        assert cost_range.max_combined_surcharge_tax_sub == 50
+        assert cost_range.best_value_offer.absolute_saving == 450
+        assert ticket_order.raw_combined_tax_component == 125
+        assert ticket_order.raw_total_combined_tax_component == 250
+        order = bundle.orders[0]
+        assert order.total_sale_combined_tax_component == 250
+        assert order.send_method.cost == 350
+        assert order.send_method.send_cost_tax_component == 50
+        assert order.send_method.trans_fee_component == 25
+        assert bundle.send_cost_tax_component == 50
+        assert bundle.total_combined_tax_component == 300
+
+    def test_sorting_is_exact(self):
+        price_bands = [
+            PriceBand('A', None, seatprice=0.3, surcharge=0.0),
+            PriceBand('B', None, seatprice=0.1, surcharge=0.2),
+        ]
+        money.convert_prices(price_bands)
+
+        assert price_bands[0].combined_price() == price_bands[1].combined_price()
@@ -93,3 +93,14 @@ class TestMonth:
 
     def test_end_date_with_none(self):
         assert Month(1, 2020, dates_bitmask=None).end_date() is None
+
+    def test_get_dates(self):
+        # 0b1100000000000000000000000000101 is the 1st, 3rd, 30th and 31st
+        month = Month(2, 2020, dates_bitmask=0b1100000000000000000000000000101)
+        assert month.get_dates() == [
+            datetime.date(2020, 2, 1),
+            datetime.date(2020, 2, 3),
+        ]
+
+    def test_get_dates_with_none(self):
+        assert Month(1, 2020, dates_bitmask=None).get_dates() == []
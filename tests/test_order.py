@@ -467,3 +467,20 @@ class TestOrder:
         assert order.gross_commission.excluding_vat == 18.75
         assert order.gross_commission.currency_code == "gbp"
 
+    def test_from_api_data_with_lazy_event(self):
+        data = {
+            "item_number": 1,
+            "event": {
+                "event_id": "6IF",
+                "custom_fields": [{"custom_field_name": "foo"}],
+            },
+        }
+        order = Order.from_api_data(data, lazy=True, keep_raw=True)
+
+        assert not Event.fields.is_built(order.event)
+        assert list(order.event.fields) == ["foo"]
+
+        order = Order.from_api_data(data, keep_raw=False)
+
+        assert order.event.raw is None
+        assert list(order.event.fields) == ["foo"]
@@ -0,0 +1,153 @@
+import decimal
+
+import pytest
+from pyticketswitch import money, price_matrix
+from pyticketswitch.discount import Discount
+from pyticketswitch.price_band import PriceBand
+from pyticketswitch.price_matrix import PriceMatrix
+from pyticketswitch.ticket_type import TicketType
+
+
+@pytest.fixture
+def ticket_types():
+    return [
+        TicketType('STALLS', price_bands=[
+            PriceBand('A', None, discounts=[
+                Discount('ADULT', seatprice=35.0, surcharge=4.0,
+                         availability=6, tax_component=1.5),
+                Discount('CHILD', seatprice=25.0, surcharge=4.0,
+                         availability=2),
+            ]),
+            PriceBand('B', Discount('ADULT', seatprice=30.0, surcharge=3.5,
+                                    availability=10)),
+        ]),
+        TicketType('CIRCLE', price_bands=[
+            PriceBand('A', None, seatprice=20.0, surcharge=2.5, availability=4),
+        ]),
+    ]
+
+
+@pytest.fixture
+def matrix(ticket_types):
+    return PriceMatrix.from_ticket_types(ticket_types)
+
+
+class TestPriceMatrix:
+
+    def test_from_ticket_types(self, matrix):
+        assert len(matrix) == 4
+        assert list(matrix.columns) == list(price_matrix.COLUMNS)
+        assert matrix['ticket_type_code'] == [
+            'STALLS', 'STALLS', 'STALLS', 'CIRCLE',
+        ]
+        assert matrix['price_band_code'] == ['A', 'A', 'B', 'A']
+        assert matrix['discount_code'] == ['ADULT', 'CHILD', 'ADULT', None]
+        assert matrix['seatprice'] == [35.0, 25.0, 30.0, 20.0]
+        assert matrix['surcharge'] == [4.0, 4.0, 3.5, 2.5]
+        assert matrix['availability'] == [6, 2, 10, 4]
+        assert matrix['tax'] == [1.5, None, None, None]
+
+    def test_rows(self, matrix):
+        assert matrix.rows()[1] == (
+            'STALLS', 'A', 'CHILD', 25.0, 4.0, 2, None,
+        )
+        assert list(matrix) == matrix.rows()
+
+    def test_columns_must_be_the_same_length(self):
+        with pytest.raises(ValueError):
+            PriceMatrix({'seatprice': [1.0, 2.0], 'surcharge': [1.0]})
+
+    def test_empty(self):
+        matrix = PriceMatrix.from_ticket_types([TicketType('STALLS')])
+        assert len(matrix) == 0
+        assert matrix.rows() == []
+
+    def test_where(self, matrix):
+        result = matrix.where(ticket_type_code='STALLS', discount_code='ADULT')
+        assert result['price_band_code'] == ['A', 'B']
+        assert len(matrix) == 4
+
+    def test_sort_by(self, matrix):
+        result = matrix.sort_by('seatprice')
+        assert result['seatprice'] == [20.0, 25.0, 30.0, 35.0]
+
+        result = matrix.sort_by('surcharge', 'seatprice', reverse=True)
+        assert result['seatprice'] == [35.0, 25.0, 30.0, 20.0]
+
+    def test_sort_by_puts_missing_values_last(self, matrix):
+        result = matrix.sort_by('tax', 'seatprice')
+        assert result['tax'] == [1.5, None, None, None]
+        assert result['seatprice'] == [35.0, 20.0, 25.0, 30.0]
+
+    def test_sort_by_reverse_puts_missing_values_last(self, matrix):
+        matrix.columns['tax'][3] = 0.5
+        result = matrix.sort_by('tax', 'seatprice', reverse=True)
+        assert result['tax'] == [1.5, 0.5, None, None]
+        assert result['seatprice'] == [35.0, 20.0, 30.0, 25.0]
+
+    def test_take(self, matrix):
+        result = matrix.take([3, 0])
+        assert result['discount_code'] == [None, 'ADULT']
+
+
+class TestToNumpy:
+
+    def test_to_numpy(self, matrix):
+        numpy = pytest.importorskip('numpy')
+        array = matrix.to_numpy()
+
+        assert len(array) == 4
+        assert array['price_band_code'].tolist() == ['A', 'A', 'B', 'A']
+        assert array['discount_code'].tolist() == ['ADULT', 'CHILD', 'ADULT', '']
+        assert array['availability'].dtype == numpy.dtype('i8')
+        assert array['seatprice'].dtype == numpy.dtype('f8')
+        assert numpy.isnan(array['tax'][1])
+        cheap = array[array['seatprice'] + array['surcharge'] < 35]
+        assert cheap['discount_code'].tolist() == ['CHILD', 'ADULT', '']
+
+    def test_to_numpy_with_minor_units_and_decimals(self):
+        numpy = pytest.importorskip('numpy')
+        matrix = PriceMatrix({
+            'seatprice': [3500, 2500],
+            'surcharge': [decimal.Decimal('4.00'), None],
+        })
+        array = matrix.to_numpy()
+
+        assert array['seatprice'].dtype == numpy.dtype('i8')
+        assert array['surcharge'][0] == 4.0
+
+    def test_minor_units_with_tax(self):
+        ticket_types = [
+            TicketType('STALLS', price_bands=[
+                PriceBand('A', None, discounts=[
+                    Discount('ADULT', seatprice=35.0, surcharge=4.0,
+                             availability=6, tax_component=1.5),
+                ]),
+                PriceBand('B', None, seatprice=30.0, surcharge=3.5,
+                          availability=10, tax_component=1.25),
+            ]),
+        ]
+        money.convert_prices(ticket_types)
+
+        matrix = PriceMatrix.from_ticket_types(ticket_types)
+
+        assert matrix.rows() == [
+            ('STALLS', 'A', 'ADULT', 3500, 400, 6, 150),
+            ('STALLS', 'B', None, 3000, 350, 10, 125),
+        ]
+
+        numpy = pytest.importorskip('numpy')
+        array = matrix.to_numpy()
+        assert array['seatprice'].dtype == numpy.dtype('i8')
+        assert array['tax'].dtype == numpy.dtype('i8')
+        assert array['tax'].tolist() == [150, 125]
+
+    def test_to_numpy_without_numpy(self, matrix, monkeypatch):
+        monkeypatch.setattr(price_matrix, 'numpy', None)
+        with pytest.raises(ImportError):
+            matrix.to_numpy()
+
+
+def test_missing_columns_are_filled_with_none():
+    matrix = PriceMatrix({'seatprice': [1.0, 2.0]})
+    assert matrix['discount_code'] == [None, None]
@@ -0,0 +1,181 @@
+import pytest
+import requests
+from mock import Mock
+from pyticketswitch import exceptions
+from pyticketswitch.resilience import (
+    CircuitBreaker, ResiliencePolicy, backend_error_from_api_data,
+    CLOSED, OPEN, HALF_OPEN,
+)
+
+
+@pytest.fixture
+def policy(clock):
+    return ResiliencePolicy(
+        max_attempts=3, failure_threshold=2, reset_timeout=30,
+        clock=clock, sleep=Mock(),
+    )
+
+
+class TestBackendErrorFromApiData:
+
+    def test_no_error(self):
+        assert backend_error_from_api_data({'backend_is_down': False}) is None
+
+    def test_down(self):
+        error = backend_error_from_api_data(
+            {'backend_is_down': True, 'source_code': 'ext_test0'})
+        assert isinstance(error, exceptions.BackendDownError)
+        assert 'ext_test0' in str(error)
+
+    def test_broken(self):
+        error = backend_error_from_api_data({'backend_is_broken': True})
+        assert isinstance(error, exceptions.BackendBrokenError)
+
+    def test_throttled(self):
+        error = backend_error_from_api_data({'backend_throttle_failed': True})
+        assert isinstance(error, exceptions.BackendThrottleError)
+
+
+class TestCircuitBreaker:
+
+    def test_opens_after_threshold(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_failures(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2, clock=clock)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+
+    def test_half_open_after_reset_timeout(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now += 30
+        assert breaker.allow()
+        assert breaker.state == HALF_OPEN
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert breaker.allow()
+
+    def test_failed_trial_reopens(self, clock):
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30, clock=clock)
+        for _ in range(5):
+            breaker.record_failure()
+
+        clock.now += 30
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+
+    def test_unreported_trial_allows_another_trial(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now += 30
+        assert breaker.allow()
+
+        clock.now += 30
+        assert breaker.allow()
+
+
+class TestResiliencePolicy:
+
+    def test_call_success(self, policy):
+        func = Mock(return_value={'results': {}})
+        assert policy.call('events.v1', {}, 'get', func) == {'results': {}}
+        assert func.call_count == 1
+
+    def test_call_retries_network_errors(self, policy):
+        func = Mock(side_effect=[requests.ConnectionError, {'results': {}}])
+
+        assert policy.call('events.v1', {}, 'get', func) == {'results': {}}
+        assert func.call_count == 2
+        assert policy.sleep.call_count == 1
+
+    def test_call_raises_after_max_attempts(self, policy):
+        func = Mock(side_effect=requests.Timeout)
+
+        with pytest.raises(requests.Timeout):
+            policy.call('events.v1', {}, 'get', func)
+
+        assert func.call_count == 3
+        assert policy.sleep.call_count == 2
+
+    def test_call_does_not_retry_non_idempotent(self, policy):
+        func = Mock(side_effect=requests.ConnectionError)
+
+        with pytest.raises(requests.ConnectionError):
+            policy.call('reserve.v1', {}, 'post', func)
+
+        assert func.call_count == 1
+
+    def test_call_does_not_retry_api_errors(self, policy):
+        func = Mock(side_effect=exceptions.APIError('bad', 8))
+
+        with pytest.raises(exceptions.APIError):
+            policy.call('events.v1', {}, 'get', func)
+
+        assert func.call_count == 1
+
+    def test_call_retries_backend_signals(self, policy):
+        func = Mock(side_effect=[
+            {'backend_throttle_failed': True},
+            {'availability': {}},
+        ])
+
+        assert policy.call('availability.v1', {'perf_id': '6IF-1'}, 'get', func) == {
+            'availability': {},
+        }
+        assert func.call_count == 2
+
+    def test_call_raises_backend_error(self, policy):
+        func = Mock(return_value={'backend_is_broken': True})
+
+        with pytest.raises(exceptions.BackendBrokenError):
+            policy.call('availability.v1', {'perf_id': '6IF-1'}, 'get', func)
+
+    def test_circuit_breaker_fails_fast(self, policy, clock):
+        down = {'backend_is_down': True, 'source_code': 'ext_test0'}
+        func = Mock(return_value=down)
+
+        with pytest.raises(exceptions.BackendDownError):
+            policy.call('availability.v1', {'perf_id': '6IF-1'}, 'get', func)
+        assert func.call_count == 3
+        assert policy.get_source_code({'event_id': '6IF'}) == 'ext_test0'
+        assert policy.get_breaker('ext_test0').state == OPEN
+
+        func.reset_mock()
+        with pytest.raises(exceptions.BackendDownError):
+            policy.call('performances.v1', {'event_id': '6IF'}, 'get', func)
+        func.assert_not_called()
+
+        # other backends are unaffected
+        other = Mock(return_value={'results': {}})
+        policy.call('performances.v1', {'event_id': '7AB'}, 'get', other)
+        assert other.call_count == 1
+
+        # after the reset timeout a trial call is made
+        clock.now += 30
+        func.return_value = {'availability': {}, 'source_code': 'ext_test0'}
+        policy.call('availability.v1', {'perf_id': '6IF-2'}, 'get', func)
+        assert policy.get_breaker('ext_test0').state == CLOSED
+
+    def test_get_backoff(self, policy):
+        policy.backoff = 1
+        policy.max_backoff = 3
+        assert 0 <= policy.get_backoff(0) <= 1
+        assert 0 <= policy.get_backoff(1) <= 2
+        assert 0 <= policy.get_backoff(5) <= 3
@@ -1,4 +1,4 @@
-from pyticketswitch.seat import Seat, SeatBlock
+from pyticketswitch.seat import Seat, SeatBlock, index_seat_text
 
 
 class TestSeatBlock:
@@ -13,6 +13,49 @@ class TestSeatBlock:
         assert len(seat_block.seats) == 1
         assert seat_block.seats[0].id == 'D1.12'
 
+    def test_from_api_data_with_restricted_seats_and_text(self):
+
+        data = ["D1", "D2", "D3"]
+
+        seat_block = SeatBlock.from_api_data(
+            data,
+            row_id='D',
+            restricted_view_seats={'D2'},
+            seats_by_text_message={'Near toilet': ['D3', 'E1']},
+        )
+
+        assert [seat.is_restricted for seat in seat_block.seats] == [False, True, False]
+        assert [seat.seat_text for seat in seat_block.seats] == ['', '', 'Near toilet']
+
+    def test_from_api_data_with_seat_text_by_id(self):
+
+        data = ["D1", "D2"]
+
+        seat_block = SeatBlock.from_api_data(
+            data,
+            row_id='D',
+            seats_by_text_message={'Ignored': ['D1']},
+            seat_text_by_id={'D2': 'Near toilet'},
+        )
+
+        assert seat_block.seats[0].is_restricted is False
+        assert seat_block.seats[0].seat_text == ''
+        assert seat_block.seats[1].seat_text == 'Near toilet'
+
+
+def test_index_seat_text():
+    seats_by_text_message = {
+        'Near toilet': ['D1', 'D2'],
+        'Restricted legroom': ['D2', 'D3'],
+    }
+
+    assert index_seat_text(seats_by_text_message) == {
+        'D1': 'Near toilet',
+        'D2': 'Restricted legroom',
+        'D3': 'Restricted legroom',
+    }
+    assert index_seat_text(None) == {}
+
 
 class TestSeat:
 
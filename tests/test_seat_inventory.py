@@ -0,0 +1,133 @@
+from pyticketswitch.price_band import PriceBand
+from pyticketswitch.seat_inventory import SeatInventory
+from pyticketswitch.seat_map import SeatMap
+from pyticketswitch.ticket_type import TicketType
+
+
+FREE_SEAT_BLOCKS = {
+    'blocks_by_row': {
+        'A': [['A-1', 'A-2', 'A-3'], ['A-10', 'A-11']],
+        'B': [['B1', 'B2']],
+        'BOX': [['BOX-A', 'BOX-01', 'BOX-2-3']],
+    },
+    'separators_by_row': {'A': '-', 'B': '', 'BOX': '-'},
+    'restricted_view_seats': ['A-2', 'A-10', 'BOX-A'],
+    'seats_by_text_message': {'Near toilet': ['A-3', 'B2']},
+}
+
+
+def seat_tuples(seats):
+    return [
+        (
+            seat.id,
+            seat.row,
+            seat.column,
+            seat.separator,
+            seat.is_restricted,
+            seat.seat_text,
+        )
+        for seat in seats
+    ]
+
+
+class TestSeatInventory:
+
+    def test_from_api_data(self):
+        inventory = SeatInventory.from_api_data(FREE_SEAT_BLOCKS)
+
+        assert len(inventory) == 10
+        assert inventory.rows == ['A', 'B', 'BOX']
+
+    def test_get_seats_matches_seat_blocks(self):
+        inventory = SeatInventory.from_api_data(FREE_SEAT_BLOCKS)
+        price_band = PriceBand.from_api_data({
+            'price_band_code': 'A',
+            'free_seat_blocks': FREE_SEAT_BLOCKS,
+        })
+
+        assert seat_tuples(inventory.get_seats()) == seat_tuples(
+            price_band.get_seats())
+
+    def test_get_seat_blocks(self):
+        inventory = SeatInventory.from_api_data(FREE_SEAT_BLOCKS)
+
+        blocks = inventory.get_seat_blocks()
+
+        assert [block.length for block in blocks] == [3, 2, 2, 3]
+        assert [seat.id for seat in blocks[1].seats] == ['A-10', 'A-11']
+        assert blocks[0].seats[1].is_restricted is True
+        assert blocks[0].seats[2].seat_text == 'Near toilet'
+        assert blocks[0].seats[2].column == '3'
+
+    def test_columns_that_are_not_integers(self):
+        inventory = SeatInventory.from_api_data(FREE_SEAT_BLOCKS)
+
+        seats = inventory.get_seat_blocks()[3].seats
+
+        assert [seat.id for seat in seats] == ['BOX-A', 'BOX-01', 'BOX-2-3']
+        assert [seat.column for seat in seats] == ['A', '01', '2']
+        assert seats[0].is_restricted is True
+
+    def test_add_block(self):
+        inventory = SeatInventory()
+        inventory.add_block('C', None, ['C1', 'C2'], restricted_view_seats={'C2'})
+        inventory.add_block('C', None, [])
+
+        seats = inventory.get_seats()
+
+        assert [seat.id for seat in seats] == ['C1', 'C2']
+        assert [seat.is_restricted for seat in seats] == [False, True]
+        assert seats[0].separator is None
+        assert len(inventory.get_seat_blocks()) == 1
+
+    def test_restricted_flags_across_bytes(self):
+        inventory = SeatInventory()
+        seat_ids = ['D{}'.format(number) for number in range(1, 21)]
+        inventory.add_block('D', '', seat_ids, restricted_view_seats={'D9', 'D17'})
+
+        restricted = [seat.id for seat in inventory.get_seats() if seat.is_restricted]
+
+        assert restricted == ['D9', 'D17']
+
+    def test_as_json(self):
+        inventory = SeatInventory()
+        inventory.add_block('B', '', ['B1'])
+
+        assert inventory.__jsondict__() == [{
+            'length': 1,
+            'seats': [{
+                'id': 'B1',
+                'row': 'B',
+                'column': '1',
+                'is_restricted': False,
+            }],
+        }]
+
+
+class TestCompactPriceBand:
+
+    def test_from_api_data(self):
+        price_band = PriceBand.from_api_data({
+            'price_band_code': 'A',
+            'free_seat_blocks': FREE_SEAT_BLOCKS,
+        }, compact_seats=True)
+
+        assert price_band.seat_blocks is None
+        assert len(price_band.seat_inventory) == 10
+        assert len(price_band.get_seats()) == 10
+        assert len(price_band.get_seat_blocks()) == 4
+
+    def test_ticket_type(self):
+        ticket_type = TicketType.from_api_data({
+            'ticket_type_code': 'STALLS',
+            'price_band': [{
+                'price_band_code': 'A',
+                'free_seat_blocks': FREE_SEAT_BLOCKS,
+            }],
+        }, compact_seats=True)
+
+        assert len(ticket_type.get_seats()) == 10
+
+        seat_map = SeatMap.from_ticket_types([ticket_type])
+        runs = seat_map.find_seats(3)
+        assert runs[0].seat_ids == ['A-1', 'A-2', 'A-3']
@@ -0,0 +1,183 @@
+import pytest
+from pyticketswitch.availability import AvailabilityMeta
+from pyticketswitch.seat_map import SeatMap
+from pyticketswitch.ticket_type import TicketType
+
+
+def price_band_data(code, blocks_by_row, restricted=(), singles='if_necessary'):
+    return {
+        'price_band_code': code,
+        'allows_leaving_single_seats': singles,
+        'free_seat_blocks': {
+            'blocks_by_row': blocks_by_row,
+            'separators_by_row': {row: '' for row in blocks_by_row},
+            'restricted_view_seats': list(restricted),
+            'seats_by_text_message': {},
+        },
+    }
+
+
+def make_seat_map(*price_bands, **kwargs):
+    ticket_type = TicketType.from_api_data({
+        'ticket_type_code': 'STALLS',
+        'price_band': list(price_bands),
+    })
+    return SeatMap.from_ticket_types([ticket_type], **kwargs)
+
+
+@pytest.fixture
+def seat_map():
+    return make_seat_map(
+        price_band_data('A', {
+            'A': [['A1', 'A2', 'A3', 'A4', 'A5', 'A6']],
+            'B': [['B1', 'B2'], ['B9', 'B10', 'B11']],
+        }, restricted=['A1']),
+        price_band_data('B', {
+            'C': [['C1', 'C2', 'C3', 'C4']],
+        }),
+    )
+
+
+class TestSeatMap:
+
+    def test_from_ticket_types(self, seat_map):
+        assert len(seat_map) == 15
+        assert 'B10' in seat_map
+        assert 'D1' not in seat_map
+        assert seat_map.get_seat('C2').row == 'C'
+        assert seat_map.get_seat('D1') is None
+        assert seat_map.contiguous_seat_selection_only is True
+        assert seat_map.must_select_whole_seat_block is False
+
+    def test_from_ticket_types_with_meta(self):
+        meta = AvailabilityMeta(
+            contiguous_seat_selection_only=False,
+            must_select_whole_seat_block=True,
+            currencies={},
+        )
+        seat_map = make_seat_map(meta=meta)
+        assert seat_map.contiguous_seat_selection_only is False
+        assert seat_map.must_select_whole_seat_block is True
+
+    def test_rows(self, seat_map):
+        assert list(seat_map.rows) == ['A', 'B', 'C']
+        assert [seat.id for seat in seat_map.rows['B']] == [
+            'B1', 'B2', 'B9', 'B10', 'B11',
+        ]
+
+    def test_find_seats(self, seat_map):
+        runs = seat_map.find_seats(2, limit=4)
+
+        assert [run.seat_ids for run in runs] == [
+            ['B1', 'B2'],
+            ['A5', 'A6'],
+            ['C1', 'C2'],
+            ['C3', 'C4'],
+        ]
+        assert runs[0].ticket_type_code == 'STALLS'
+        assert runs[0].price_band_code == 'A'
+        assert runs[0].row == 'B'
+        assert runs[0].leaves_single_seat is False
+
+    def test_find_seats_ranks_singles_last(self, seat_map):
+        runs = seat_map.find_seats(3, price_band_code='B', limit=10)
+
+        assert [run.seat_ids for run in runs] == [
+            ['C1', 'C2', 'C3'],
+            ['C2', 'C3', 'C4'],
+        ]
+        assert runs[0].leaves_single_seat is True
+
+    def test_find_seats_ranks_restricted_view_after_unrestricted(self, seat_map):
+        runs = seat_map.find_seats(5, limit=10)
+
+        assert [run.seat_ids for run in runs] == [
+            ['A2', 'A3', 'A4', 'A5', 'A6'],
+            ['A1', 'A2', 'A3', 'A4', 'A5'],
+        ]
+        assert runs[1].restricted_seats == 1
+
+    def test_find_seats_without_restricted_view(self, seat_map):
+        runs = seat_map.find_seats(6, allow_restricted=False)
+        assert runs == []
+
+    def test_find_seats_in_the_middle_of_blocks(self, seat_map):
+        runs = seat_map.find_seats(2, price_band_code='A', limit=10)
+
+        assert [run.seat_ids for run in runs] == [
+            ['B1', 'B2'],
+            ['A5', 'A6'],
+            ['A3', 'A4'],
+            ['A1', 'A2'],
+            ['B9', 'B10'],
+            ['B10', 'B11'],
+            ['A2', 'A3'],
+            ['A4', 'A5'],
+        ]
+
+    def test_find_seats_never_leaving_singles(self):
+        seat_map = make_seat_map(
+            price_band_data('A', {'A': [['A1', 'A2', 'A3']]}, singles='never'),
+        )
+        assert seat_map.find_seats(2) == []
+        assert len(seat_map.find_seats(3)) == 1
+
+    def test_find_seats_must_select_whole_seat_block(self, seat_map):
+        seat_map.must_select_whole_seat_block = True
+        runs = seat_map.find_seats(2, limit=10)
+        assert [run.seat_ids for run in runs] == [['B1', 'B2']]
+
+    def test_find_seats_filters(self, seat_map):
+        assert seat_map.find_seats(2, ticket_type_code='CIRCLE') == []
+        runs = seat_map.find_seats(4, price_band_code='B')
+        assert [run.seat_ids for run in runs] == [['C1', 'C2', 'C3', 'C4']]
+
+    def test_find_seats_with_no_seats(self, seat_map):
+        assert seat_map.find_seats(0) == []
+        assert seat_map.find_seats(7) == []
+
+    def test_find_seats_by_price_band(self, seat_map):
+        results = seat_map.find_seats_by_price_band(4, limit=1)
+
+        assert list(results) == [('STALLS', 'A'), ('STALLS', 'B')]
+        assert results[('STALLS', 'A')][0].seat_ids == ['A3', 'A4', 'A5', 'A6']
+        assert results[('STALLS', 'B')][0].seat_ids == ['C1', 'C2', 'C3', 'C4']
+
+    def test_find_seats_by_price_band_leaves_out_empty_bands(self, seat_map):
+        results = seat_map.find_seats_by_price_band(5)
+        assert list(results) == [('STALLS', 'A')]
+
+    def test_leaves_single_seat(self, seat_map):
+        assert seat_map.leaves_single_seat(['A1', 'A2']) is False
+        assert seat_map.leaves_single_seat(['A2', 'A3']) is True
+        assert seat_map.leaves_single_seat(['A4', 'A5']) is True
+        assert seat_map.leaves_single_seat(['C1', 'C3']) is True
+        assert seat_map.leaves_single_seat(['B1', 'B2', 'B9']) is False
+
+    def test_leaves_single_seat_with_taken_seat(self, seat_map):
+        with pytest.raises(ValueError):
+            seat_map.leaves_single_seat(['A7'])
+
+    def test_is_valid_selection(self, seat_map):
+        assert seat_map.is_valid_selection(['A2', 'A3']) is True
+        assert seat_map.is_valid_selection(['A3', 'A2']) is True
+        assert seat_map.is_valid_selection(['A1', 'A3']) is False
+        assert seat_map.is_valid_selection(['B2', 'B9']) is False
+        assert seat_map.is_valid_selection([]) is False
+
+    def test_is_valid_selection_when_not_contiguous_only(self, seat_map):
+        seat_map.contiguous_seat_selection_only = False
+        assert seat_map.is_valid_selection(['A1', 'A3']) is True
+        assert seat_map.is_valid_selection(['B2', 'C1']) is True
+
+    def test_is_valid_selection_must_select_whole_seat_block(self, seat_map):
+        seat_map.must_select_whole_seat_block = True
+        assert seat_map.is_valid_selection(['B1', 'B2']) is True
+        assert seat_map.is_valid_selection(['A1', 'A2']) is False
+
+
+def test_seat_run_as_dict_for_json(seat_map):
+    run = seat_map.find_seats(2)[0]
+    result = run.as_dict_for_json()
+    assert result['row'] == 'B'
+    assert [seat['id'] for seat in result['seats']] == ['B1', 'B2']
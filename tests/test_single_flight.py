@@ -0,0 +1,132 @@
+import threading
+import time
+import pytest
+from pyticketswitch import exceptions
+from pyticketswitch.single_flight import SingleFlight
+
+
+def run_concurrently(single_flight, key, func, number_of_threads, started):
+    results = [None] * number_of_threads
+
+    def target(index):
+        try:
+            results[index] = single_flight.do(key, func)
+        except Exception as error:
+            results[index] = error
+
+    threads = [
+        threading.Thread(target=target, args=(i,))
+        for i in range(number_of_threads)
+    ]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+
+    # wait for the other threads to join the flight.
+    while single_flight.coalesced < number_of_threads - 1:
+        time.sleep(0.001)
+
+    return threads, results
+
+
+class TestSingleFlight:
+
+    def test_do(self):
+        single_flight = SingleFlight()
+        assert single_flight.do('key', lambda x: x * 2, 21) == 42
+        assert single_flight.coalesced == 0
+
+    def test_do_coalesces_concurrent_calls(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def func():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {'results': {}}
+
+        threads, results = run_concurrently(
+            single_flight, 'key', func, 5, started)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert single_flight.coalesced == 4
+        assert all(result == {'results': {}} for result in results)
+        assert all(result is results[0] for result in results)
+
+    def test_do_propagates_errors_to_each_waiter(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def func():
+            started.set()
+            release.wait(5)
+            raise exceptions.APIError('oh noes', 8)
+
+        threads, results = run_concurrently(
+            single_flight, 'key', func, 3, started)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert all(isinstance(result, exceptions.APIError) for result in results)
+        assert all(result.code == 8 for result in results)
+        assert results[1] is not results[0]
+
+    def test_do_when_interrupted(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        results = {}
+
+        def func():
+            started.set()
+            release.wait(5)
+            raise KeyboardInterrupt()
+
+        def target(name):
+            try:
+                single_flight.do('key', func)
+            except BaseException as error:
+                results[name] = error
+
+        leader = threading.Thread(target=target, args=('leader',))
+        leader.start()
+        started.wait(5)
+        waiter = threading.Thread(target=target, args=('waiter',))
+        waiter.start()
+        while single_flight.coalesced < 1:
+            time.sleep(0.001)
+        release.set()
+        leader.join()
+        waiter.join()
+
+        assert isinstance(results['leader'], KeyboardInterrupt)
+        assert isinstance(results['waiter'], exceptions.CallInterruptedError)
+
+    def test_do_runs_again_after_completion(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        single_flight.do('key', calls.append, 1)
+        single_flight.do('key', calls.append, 2)
+
+        assert calls == [1, 2]
+
+    def test_do_releases_key_after_error(self):
+        single_flight = SingleFlight()
+
+        def func():
+            raise ValueError('nope')
+
+        with pytest.raises(ValueError):
+            single_flight.do('key', func)
+
+        assert single_flight.do('key', lambda: 'ok') == 'ok'
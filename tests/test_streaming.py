@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+import decimal
+import gc
+import json
+
+import pytest
+from mock import Mock
+from pyticketswitch import exceptions
+from pyticketswitch.streaming import ResponseStream, _Reader, iter_json_list
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+DOCUMENT = {
+    'currency_code': 'gbp',
+    'results': {
+        'event': [
+            {'event_id': 'ABC1', 'event_desc': u'Crème brûlée', 'price': 12.5},
+            {'event_id': 'DEF2', 'tags': [1, 2, {'a': None}]},
+            {'event_id': 'GHI3', 'escaped': '"quoted" \\ ]}'},
+        ],
+        'paging_status': {'page_number': 123456, 'total_unpaged_results': 3},
+    },
+    'backend_is_down': False,
+}
+
+
+class TestIterJsonList:
+
+    @pytest.mark.parametrize('size', [1, 2, 7, 64, 100000])
+    def test_items_and_document(self, size):
+        data = json.dumps(DOCUMENT, indent=2).encode('utf-8')
+        document = {}
+
+        items = list(iter_json_list(chunked(data, size), ('results', 'event'), document))
+
+        assert items == DOCUMENT['results']['event']
+        assert document == dict(
+            DOCUMENT, results=dict(DOCUMENT['results'], event=[]),
+        )
+
+    def test_numbers_split_across_chunks(self):
+        document = {}
+        chunks = [b'{"results": {"event": [12', b'34, 5', b'6]}, "page": 78', b'9}']
+
+        items = list(iter_json_list(chunks, ('results', 'event'), document))
+
+        assert items == [1234, 56]
+        assert document == {'results': {'event': []}, 'page': 789}
+
+    def test_scalars_split_at_every_position(self):
+        data = (
+            b'{"a": 25.5, "b": 1e5, "c": -2.5E-3, "d": 0, "e": true,'
+            b' "results": {"event": [7, 1.25e+2]}, "f": null, "g": 10}'
+        )
+        for split in range(1, len(data)):
+            document = {}
+            chunks = [data[:split], data[split:]]
+
+            items = list(iter_json_list(chunks, ('results', 'event'), document))
+
+            assert items == [7, 125.0], split
+            assert document == {
+                'a': 25.5, 'b': 1e5, 'c': -2.5e-3, 'd': 0, 'e': True,
+                'results': {'event': []}, 'f': None, 'g': 10,
+            }, split
+
+    def test_parse_float(self):
+        chunks = [b'{"results": {"event": [{"price": 1.1}]}}']
+        items = list(iter_json_list(
+            chunks, ('results', 'event'), {}, parse_float=decimal.Decimal,
+        ))
+        assert items == [{'price': decimal.Decimal('1.1')}]
+
+    def test_missing_list(self):
+        document = {}
+        items = list(iter_json_list(
+            [b'{"error_code": 8, "error_desc": "bad"}'], ('results', 'event'),
+            document,
+        ))
+        assert items == []
+        assert document == {'error_code': 8, 'error_desc': 'bad'}
+
+    def test_list_is_not_a_list(self):
+        document = {}
+        items = list(iter_json_list(
+            [b'{"results": {"event": null}}'], ('results', 'event'), document,
+        ))
+        assert items == []
+        assert document == {'results': {'event': None}}
+
+    def test_empty_containers(self):
+        document = {}
+        items = list(iter_json_list(
+            [b'{"a": {}, "results": {"event": []}}'], ('results', 'event'),
+            document,
+        ))
+        assert items == []
+        assert document == {'a': {}, 'results': {'event': []}}
+
+    @pytest.mark.parametrize('data', [
+        b'{"results": {"event": [1, 2',
+        b'{"results": {"event": [1 2]}}',
+        b'[1, 2]',
+        b'{"a": 1} extra',
+        b'',
+    ])
+    def test_invalid(self, data):
+        with pytest.raises(ValueError):
+            list(iter_json_list([data], ('results', 'event'), {}))
+
+    def test_is_incremental(self):
+        def chunks():
+            yield b'{"results": {"event": [1, '
+            yield b'2, '
+            raise AssertionError('read too far')
+
+        items = iter_json_list(chunks(), ('results', 'event'), {})
+        assert next(items) == 1
+
+    def test_long_values_are_decoded_once(self):
+        value = {'text': 'a "quoted" \\ string ' * 200, 'list': [{'b': [1]}] * 200}
+        data = json.dumps(value).encode('utf-8')
+        decoder = json.JSONDecoder()
+        decoder.raw_decode = Mock(side_effect=decoder.raw_decode)
+
+        reader = _Reader(chunked(data, 16), decoder)
+
+        assert reader.value() == value
+        assert decoder.raw_decode.call_count == 1
+
+    def test_escapes_split_at_every_position(self):
+        event = ['a\\"b', '\\', {'c\\': '\\"'}, '\u00e9']
+        data = json.dumps({'results': {'event': event}}).encode('utf-8')
+        for split in range(1, len(data)):
+            items = list(iter_json_list(
+                [data[:split], data[split:]], ('results', 'event'), {}))
+            assert items == event, split
+
+
+class TestResponseStream:
+
+    def test_iter(self):
+        data = json.dumps(DOCUMENT).encode('utf-8')
+        on_close = Mock()
+        check = Mock()
+        stream = ResponseStream(
+            chunked(data, 10),
+            ('results', 'event'),
+            lambda item: item['event_id'],
+            meta_factory=lambda document: document['currency_code'],
+            check=check,
+            on_close=on_close,
+        )
+
+        assert stream.meta is None
+        assert list(stream) == ['ABC1', 'DEF2', 'GHI3']
+        assert stream.meta == 'gbp'
+        check.assert_called_once_with(stream.document)
+        on_close.assert_called_once_with()
+
+    def test_check_raises(self):
+        check = Mock(side_effect=exceptions.APIError('bad', 8))
+        on_close = Mock()
+        stream = ResponseStream(
+            [b'{"error_code": 8}'], ('results', 'event'), Mock(),
+            check=check, on_close=on_close,
+        )
+
+        with pytest.raises(exceptions.APIError):
+            list(stream)
+        on_close.assert_called_once_with()
+
+    def test_missing_results(self):
+        stream = ResponseStream([b'{}'], ('results', 'event'), Mock())
+        with pytest.raises(exceptions.InvalidResponseError):
+            list(stream)
+
+    def test_invalid_json(self):
+        stream = ResponseStream([b'{"results": ['], ('results', 'event'), Mock())
+        with pytest.raises(exceptions.InvalidResponseError):
+            list(stream)
+
+    def test_context_manager_closes(self):
+        on_close = Mock()
+        with ResponseStream([], ('results',), Mock(), on_close=on_close):
+            pass
+        on_close.assert_called_once_with()
+
+    def test_closes_when_collected(self):
+        on_close = Mock()
+        stream = ResponseStream([], ('results',), Mock(), on_close=on_close)
+
+        del stream
+        gc.collect()
+
+        on_close.assert_called_once_with()
+
+    def test_closes_when_abandoned(self):
+        data = json.dumps(DOCUMENT).encode('utf-8')
+        on_close = Mock()
+        stream = ResponseStream(
+            chunked(data, 10), ('results', 'event'), Mock(), on_close=on_close)
+
+        items = iter(stream)
+        next(items)
+        del items
+        gc.collect()
+
+        on_close.assert_called_once_with()
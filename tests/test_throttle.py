@@ -0,0 +1,225 @@
+import threading
+import time
+
+import pytest
+from mock import Mock
+from pyticketswitch import exceptions
+from pyticketswitch.throttle import Bulkhead, Limit, Throttle, TokenBucket
+
+
+class TestLimit:
+
+    def test_default_burst(self):
+        assert Limit(rate=2.5).burst == 3
+        assert Limit(rate=0.1).burst == 1
+        assert Limit(max_concurrent=3).burst is None
+
+    def test_explicit_burst(self):
+        assert Limit(rate=2, burst=10).burst == 10
+
+
+class TestTokenBucket:
+
+    def test_burst_then_rate(self, clock):
+        bucket = TokenBucket(2, 2, clock=clock, sleep=clock.sleep)
+        start = clock.now
+
+        assert bucket.acquire(start + 10)
+        assert bucket.acquire(start + 10)
+        assert clock.now == start
+
+        assert bucket.acquire(start + 10)
+        assert clock.now == start + 0.5
+
+    def test_refills_over_time(self, clock):
+        bucket = TokenBucket(1, 1, clock=clock, sleep=Mock())
+        assert bucket.acquire(clock.now)
+        assert not bucket.acquire(clock.now)
+
+        clock.now += 1
+        assert bucket.acquire(clock.now)
+        bucket.sleep.assert_not_called()
+
+    def test_deadline(self, clock):
+        bucket = TokenBucket(1, 1, clock=clock, sleep=clock.sleep)
+        assert bucket.acquire(clock.now)
+
+        assert not bucket.acquire(clock.now + 0.5)
+        # the failed attempt didn't reserve a token
+        assert bucket.acquire(clock.now + 1)
+
+    def test_reserve_and_refund(self, clock):
+        bucket = TokenBucket(1, 1, clock=clock, sleep=Mock())
+
+        assert bucket.reserve(clock.now) == 0
+        assert bucket.reserve(clock.now + 1) == 1
+
+        bucket.refund()
+        bucket.refund()
+        assert bucket.reserve(clock.now) == 0
+        bucket.sleep.assert_not_called()
+
+
+class TestBulkhead:
+
+    def test_caps_concurrency(self):
+        bulkhead = Bulkhead(2)
+        deadline = time.time() + 0.05
+
+        assert bulkhead.acquire(deadline)
+        assert bulkhead.acquire(deadline)
+        assert not bulkhead.acquire(deadline)
+        assert bulkhead.active == 2
+        assert bulkhead.waiting == 0
+
+    def test_release_wakes_waiter(self):
+        bulkhead = Bulkhead(1)
+        assert bulkhead.acquire(time.time() + 1)
+        results = []
+
+        thread = threading.Thread(
+            target=lambda: results.append(bulkhead.acquire(time.time() + 5))
+        )
+        thread.start()
+        while not bulkhead.waiting:
+            time.sleep(0.001)
+        bulkhead.release()
+        thread.join()
+
+        assert results == [True]
+        assert bulkhead.active == 1
+
+
+class TestThrottle:
+
+    def test_get_limits(self):
+        events = Limit(rate=1)
+        bob = Limit(rate=2)
+        default = Limit(rate=3)
+        throttle = Throttle(
+            endpoint_limits={'events.v1': events},
+            sub_user_limits={'bob': bob},
+            default_sub_user_limit=default,
+        )
+
+        assert throttle.get_limits('events.v1', 'bob') == [
+            (('endpoint', 'events.v1'), events),
+            (('sub_user', 'bob'), bob),
+        ]
+        assert throttle.get_limits('reserve.v1', 'alice') == [
+            (('sub_user', 'alice'), default),
+        ]
+        assert throttle.get_limits('reserve.v1', None) == [
+            (('sub_user', None), default),
+        ]
+
+    def test_call_unlimited(self):
+        throttle = Throttle()
+        func = Mock(return_value='result')
+        assert throttle.call('events.v1', None, func) == 'result'
+
+    def test_call_rate_limited(self, clock):
+        throttle = Throttle(
+            endpoint_limits={'events.v1': Limit(rate=1)},
+            clock=clock, sleep=clock.sleep,
+        )
+        func = Mock()
+        start = clock.now
+
+        throttle.call('events.v1', None, func)
+        throttle.call('events.v1', None, func)
+        assert clock.now == start + 1
+
+        # other endpoints don't share the limit
+        throttle.call('reserve.v1', None, func)
+        assert clock.now == start + 1
+        assert func.call_count == 3
+
+    def test_call_limits_each_sub_user_separately(self, clock):
+        throttle = Throttle(
+            default_sub_user_limit=Limit(rate=1),
+            clock=clock, sleep=clock.sleep,
+        )
+        start = clock.now
+
+        throttle.call('events.v1', 'alice', Mock())
+        throttle.call('events.v1', 'bob', Mock())
+        assert clock.now == start
+
+        throttle.call('events.v1', 'alice', Mock())
+        assert clock.now == start + 1
+
+    def test_call_queue_timeout(self, clock):
+        throttle = Throttle(
+            endpoint_limits={'events.v1': Limit(rate=0.1)},
+            queue_timeout=5, clock=clock, sleep=clock.sleep,
+        )
+        func = Mock()
+        throttle.call('events.v1', None, func)
+
+        with pytest.raises(exceptions.QueueTimeoutError):
+            throttle.call('events.v1', None, func)
+
+        assert func.call_count == 1
+
+    def test_call_queue_timeout_refunds_tokens(self, clock):
+        throttle = Throttle(
+            endpoint_limits={'events.v1': Limit(rate=1)},
+            sub_user_limits={'frodo': Limit(rate=0.1)},
+            queue_timeout=5, clock=clock, sleep=clock.sleep,
+        )
+        func = Mock()
+        start = clock.now
+        throttle.call('events.v1', 'frodo', func)
+
+        # the sub user limit can't be met, so the endpoint token is returned
+        with pytest.raises(exceptions.QueueTimeoutError):
+            throttle.call('events.v1', 'frodo', func)
+
+        clock.now += 1
+        throttle.call('events.v1', 'sam', func)
+        assert clock.now == start + 1
+        assert func.call_count == 2
+
+    def test_call_waits_for_slowest_limit_once(self, clock):
+        throttle = Throttle(
+            endpoint_limits={'events.v1': Limit(rate=1)},
+            default_sub_user_limit=Limit(rate=0.5),
+            clock=clock, sleep=clock.sleep,
+        )
+        start = clock.now
+
+        throttle.call('events.v1', None, Mock())
+        throttle.call('events.v1', None, Mock())
+
+        assert clock.now == start + 2
+
+    def test_call_releases_bulkhead(self):
+        throttle = Throttle(endpoint_limits={'events.v1': Limit(max_concurrent=1)})
+        func = Mock(side_effect=[exceptions.APIError('oh noes'), 'result'])
+
+        with pytest.raises(exceptions.APIError):
+            throttle.call('events.v1', None, func)
+
+        assert throttle.call('events.v1', None, func) == 'result'
+        limit = throttle.endpoint_limits['events.v1']
+        bulkhead = throttle.get_bulkhead(('endpoint', 'events.v1'), limit)
+        assert bulkhead.active == 0
+
+    def test_call_bulkhead_timeout(self):
+        throttle = Throttle(
+            endpoint_limits={'events.v1': Limit(max_concurrent=1)},
+            queue_timeout=0.01,
+        )
+        errors = []
+
+        def nested():
+            try:
+                throttle.call('events.v1', None, Mock())
+            except exceptions.QueueTimeoutError as error:
+                errors.append(error)
+
+        throttle.call('events.v1', None, nested)
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], exceptions.DeadlineExceededError)
@@ -97,6 +97,50 @@ class TestIsoStrToDatetime:
         with pytest.raises(ValueError):
             utils.isostr_to_datetime(date_str)
 
+    def test_with_negative_offset(self):
+        date_str = '2016-09-16T19:30:00-05:30'
+        dt = utils.isostr_to_datetime(date_str)
+
+        assert dt == datetime.datetime(
+            2016, 9, 16, 19, 30, 0, tzinfo=tzoffset(None, -19800))
+
+    def test_with_fractional_seconds(self):
+        date_str = '2016-09-16T19:30:00.5+01:00'
+        dt = utils.isostr_to_datetime(date_str)
+
+        assert dt == datetime.datetime(
+            2016, 9, 16, 19, 30, 0, 500000, tzinfo=self.BST)
+
+    def test_with_invalid_date(self):
+        date_str = '2016-02-30T19:30:00+01:00'
+        with pytest.raises(ValueError):
+            utils.isostr_to_datetime(date_str)
+
+    def test_shares_timezones(self):
+        first = utils.isostr_to_datetime('2016-09-16T19:30:00+01:00')
+        second = utils.isostr_to_datetime('2016-09-17T14:30:00+01:00')
+
+        assert first.tzinfo is second.tzinfo
+
+    def test_remembers_parsed_strings(self, monkeypatch):
+        date_str = '2016-09-18T19:30:00+01:00'
+        first = utils.isostr_to_datetime(date_str)
+
+        monkeypatch.setattr(utils, '_parse_isostr', None)
+        assert utils.isostr_to_datetime(date_str) is first
+
+    def test_forgets_least_recently_used(self, monkeypatch):
+        monkeypatch.setattr(utils, 'DATETIME_CACHE_SIZE', 2)
+        utils.isostr_to_datetime('2016-09-19T19:30:00+01:00')
+        utils.isostr_to_datetime('2016-09-20T19:30:00+01:00')
+        utils.isostr_to_datetime('2016-09-19T19:30:00+01:00')
+        utils.isostr_to_datetime('2016-09-21T19:30:00+01:00')
+
+        assert list(utils._datetime_cache) == [
+            '2016-09-19T19:30:00+01:00',
+            '2016-09-21T19:30:00+01:00',
+        ]
+
 
 class TestYYYYToDate:
 
@@ -116,6 +160,12 @@ class TestYYYYToDate:
         with pytest.raises(ValueError):
             utils.yyyymmdd_to_date('wrong_date')
 
+        with pytest.raises(ValueError):
+            utils.yyyymmdd_to_date('20161301')
+
+    def test_yyyymmdd_to_date_falls_back_to_strptime(self):
+        assert utils.yyyymmdd_to_date('2016081') == datetime.date(2016, 8, 1)
+
 
 class TestSpecificDatesFromAPI:
 
@@ -264,6 +314,11 @@ class TestAddPrices:
         combined = utils.add_prices(1, 1)
         assert combined == 2
 
+    def test_adding_minor_units(self):
+        combined = utils.add_prices(3550, 225, 150)
+        assert combined == 3925
+        assert isinstance(combined, int)
+
     def test_adding_two_strs(self):
         combined = utils.add_prices('1.0', '1.0')
         assert combined == '2.0'
@@ -319,3 +374,15 @@ class TestFilterNoneFromParameters:
             'foo': 'bar',
             'lol': 'beans',
         }
+
+
+class TestChunked:
+
+    def test_chunked(self):
+        assert utils.chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+    def test_chunked_exact(self):
+        assert utils.chunked([1, 2, 3, 4], 2) == [[1, 2], [3, 4]]
+
+    def test_chunked_empty(self):
+        assert utils.chunked([], 2) == []